@@ -2,20 +2,44 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import ConfigType
-from ThermiaOnlineAPI import Thermia
 
-from .const import CONF_PASSWORD, CONF_USERNAME, DEBUG_ACTION_NAME, DOMAIN
+from .aggregation import AggregationStage
+from .const import (
+    CONF_AGGREGATION,
+    CONF_AGGREGATION_DEADBAND,
+    CONF_AGGREGATION_WINDOW,
+    CONF_PARALLEL_FETCHES,
+    CONF_PASSWORD,
+    CONF_REQUEST_TIMEOUT,
+    CONF_USERNAME,
+    CONF_WRITE_DEBOUNCE,
+    DEBUG_ACTION_NAME,
+    DEFAULT_AGGREGATION,
+    DEFAULT_AGGREGATION_DEADBAND,
+    DEFAULT_AGGREGATION_WINDOW,
+    DEFAULT_PARALLEL_FETCHES,
+    DEFAULT_REQUEST_TIMEOUT,
+    DEFAULT_WRITE_DEBOUNCE,
+    DOMAIN,
+    REFRESH_METADATA_ACTION_NAME,
+    REGISTERS_ACTION_NAME,
+    STORAGE_KEY,
+    STORAGE_VERSION,
+    TELEMETRY_ACTION_NAME,
+)
 from .coordinator import ThermiaDataUpdateCoordinator
+from .hub import async_get_hub
+from .platforms import PLATFORM_PROBES, required_platforms
 from .services import ThermiaServicesSetup
 
-PLATFORMS: list[str] = ["binary_sensor", "sensor", "switch", "water_heater","number"]
+PLATFORMS: list[str] = list(PLATFORM_PROBES)
 #PLATFORMS: list[str] = ["number"]
 
 
@@ -35,49 +59,124 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry):
     username = config_entry.data[CONF_USERNAME]
     password = config_entry.data[CONF_PASSWORD]
 
-    thermia = await hass.async_add_executor_job(lambda: Thermia(username, password))
+    # Entries with the same credentials share one client and its polls
+    hub = async_get_hub(hass)
+    client = hub.async_acquire(
+        username,
+        password,
+        config_entry.options.get(CONF_PARALLEL_FETCHES, DEFAULT_PARALLEL_FETCHES),
+        config_entry.options.get(CONF_REQUEST_TIMEOUT, DEFAULT_REQUEST_TIMEOUT),
+    )
+    coordinator = ThermiaDataUpdateCoordinator(
+        hass,
+        client,
+        _snapshot_store(hass, config_entry),
+        config_entry.options.get(CONF_WRITE_DEBOUNCE, DEFAULT_WRITE_DEBOUNCE),
+        phase=hub.async_next_phase(),
+        aggregation=AggregationStage(
+            config_entry.options.get(CONF_AGGREGATION, DEFAULT_AGGREGATION),
+            config_entry.options.get(
+                CONF_AGGREGATION_WINDOW, DEFAULT_AGGREGATION_WINDOW
+            ),
+            config_entry.options.get(
+                CONF_AGGREGATION_DEADBAND, DEFAULT_AGGREGATION_DEADBAND
+            ),
+        ),
+    )
 
-    coordinator = ThermiaDataUpdateCoordinator(hass, thermia)
+    if await coordinator.async_restore():
+        # Set up the entities from the stored snapshot right away and let
+        # the login and first poll catch up in the background, in the phase
+        # of this entry so restarts do not refresh every entry at once
+        config_entry.async_create_background_task(
+            hass, coordinator.async_refresh_in_phase(), f"{DOMAIN} first refresh"
+        )
+    else:
+        try:
+            await client.async_connect()
+        except Exception as exception:
+            hub.async_release(client)
+            raise ConfigEntryNotReady(exception) from exception
 
-    await coordinator.async_refresh()
+        await coordinator.async_refresh()
 
-    if not coordinator.last_update_success:
-        raise ConfigEntryNotReady
+        if not coordinator.last_update_success:
+            hub.async_release(client)
+            raise ConfigEntryNotReady
 
     hass.data[DOMAIN][config_entry.entry_id] = coordinator
 
-    await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
+    # Only load the platforms that have entities, the rest once they do
+    platforms = required_platforms(coordinator.data)
+    coordinator.platforms.update(platforms)
+    await hass.config_entries.async_forward_entry_setups(config_entry, platforms)
+
+    @callback
+    def async_load_new_platforms() -> None:
+        if not coordinator.last_update_success:
+            return
+        new_platforms = [
+            platform
+            for platform in required_platforms(coordinator.data)
+            if platform not in coordinator.platforms
+        ]
+        if new_platforms:
+            _LOGGER.debug("Loading new platforms %s", new_platforms)
+            coordinator.platforms.update(new_platforms)
+            config_entry.async_create_task(
+                hass,
+                hass.config_entries.async_forward_entry_setups(
+                    config_entry, new_platforms
+                ),
+            )
+
+    config_entry.async_on_unload(
+        coordinator.async_add_listener(async_load_new_platforms)
+    )
 
     config_entry.async_on_unload(
         config_entry.add_update_listener(async_reload_entry))
 
-    ThermiaServicesSetup(hass, coordinator)
+    ThermiaServicesSetup(hass)
 
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Unload a config entry."""
-    unload_ok = all(
-        await asyncio.gather(
-            *[
-                hass.config_entries.async_forward_entry_unload(
-                    entry, component)
-                for component in PLATFORMS
-            ]
-        )
+    coordinator: ThermiaDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    unload_ok = await hass.config_entries.async_unload_platforms(
+        entry, coordinator.platforms
     )
 
-    if hass.services.has_service(DOMAIN, DEBUG_ACTION_NAME):
-        hass.services.async_remove(DOMAIN, DEBUG_ACTION_NAME)
-
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_shutdown()
+        async_get_hub(hass).async_release(coordinator.client)
+
+    if not hass.data[DOMAIN]:
+        # The services serve every entry, keep them until the last one is gone
+        for service in (
+            DEBUG_ACTION_NAME,
+            REFRESH_METADATA_ACTION_NAME,
+            TELEMETRY_ACTION_NAME,
+            REGISTERS_ACTION_NAME,
+        ):
+            if hass.services.has_service(DOMAIN, service):
+                hass.services.async_remove(DOMAIN, service)
 
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored snapshot of a deleted config entry."""
+    await _snapshot_store(hass, entry).async_remove()
+
+
+def _snapshot_store(hass: HomeAssistant, entry: ConfigEntry) -> Store:
+    return Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}.{entry.entry_id}")
+
+
 async def async_reload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
     """Reload config entry."""
-    await async_unload_entry(hass, config_entry)
-    await async_setup_entry(hass, config_entry)
+    await hass.config_entries.async_reload(config_entry.entry_id)
@@ -0,0 +1,245 @@
+"""Values the measurement sensors publish, aggregated or filtered."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import math
+import time
+from typing import Any, Callable
+
+from .const import (
+    AGGREGATION_RAW,
+    AGGREGATION_WINDOW,
+    DEFAULT_AGGREGATION_DEADBAND,
+    DEFAULT_AGGREGATION_WINDOW,
+)
+from .descriptions import SENSOR_DESCRIPTIONS
+from .snapshot import EntityWatch, ThermiaSnapshot
+
+# Attributes of the sensors whose states the recorder keeps statistics of
+AGGREGATED_ATTRIBUTES = frozenset(
+    description.key
+    for description in SENSOR_DESCRIPTIONS
+    if description.state_class == "measurement"
+)
+
+PublishedKey = tuple[str, str]
+
+
+@dataclass(frozen=True, slots=True)
+class Published:
+    """Value a sensor shows, with the range of the window it sums up."""
+
+    value: Any
+    minimum: float | None = None
+    maximum: float | None = None
+    samples: int = 0
+
+    def attributes(self) -> dict[str, Any]:
+        """Return the window statistics as state attributes."""
+        if not self.samples:
+            return {}
+        return {"min": self.minimum, "max": self.maximum, "samples": self.samples}
+
+
+@dataclass(slots=True)
+class _Window:
+    count: int = 0
+    total: float = 0.0
+    minimum: float = math.inf
+    maximum: float = -math.inf
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+
+    def published(self) -> Published:
+        return Published(
+            round(self.total / self.count, 2), self.minimum, self.maximum, self.count
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class SensorFilter:
+    """Deadband of a sensor: the change, absolute or relative to the shown
+    value, needed to show a new value, and the longest time to go without
+    showing one."""
+
+    deadband: float = 0.0
+    relative: float = 0.0
+    max_silence: float | None = None
+
+    def significant(self, value: float, published: float) -> bool:
+        """Return True if ``value`` moved out of the band around ``published``.
+
+        An unchanged value never is, even when the band is zero.
+        """
+        return value != published and abs(value - published) >= max(
+            self.deadband, abs(published) * self.relative
+        )
+
+
+def _numeric(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class AggregationStage:
+    """Stage between the polls and the measurement sensors.
+
+    Polling goes on at its own pace; the sensors only show what this stage
+    publishes. ``raw`` publishes every polled value except for sensors whose
+    description has a deadband, ``window`` publishes the mean, minimum and
+    maximum of every ``window`` seconds of polls and ``deadband`` publishes a
+    value once it moved ``deadband``, or the deadband of its description,
+    away from the last published one. ``updated`` holds the keys published by
+    the last poll and ``moved`` those of them whose value left its deadband;
+    ``suppressed`` and ``heartbeats`` count the changes held back by a
+    deadband and the values published after ``max_silence``.
+    """
+
+    def __init__(
+        self,
+        mode: str = AGGREGATION_RAW,
+        window: float = DEFAULT_AGGREGATION_WINDOW,
+        deadband: float = DEFAULT_AGGREGATION_DEADBAND,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.mode = mode
+        self.window = window
+        self.deadband = deadband
+        self._clock = clock
+        self.published: dict[PublishedKey, Published] = {}
+        self.updated: set[PublishedKey] = set()
+        self.moved: set[PublishedKey] = set()
+        self.suppressed: dict[PublishedKey, int] = {}
+        self.heartbeats: dict[PublishedKey, int] = {}
+        self._published_at: dict[PublishedKey, float] = {}
+        self._windows: dict[PublishedKey, _Window] = {}
+        self._window_end: float | None = None
+
+        self.filters: dict[str, SensorFilter] = {
+            description.key: SensorFilter(
+                description.deadband or 0.0,
+                description.relative_deadband or 0.0,
+                description.max_silence,
+            )
+            for description in SENSOR_DESCRIPTIONS
+            if description.key in AGGREGATED_ATTRIBUTES
+            and (description.deadband or description.relative_deadband)
+        }
+        self._filter_all = SensorFilter(deadband)
+        self._attributes: frozenset[str] = (
+            frozenset(self.filters)
+            if mode == AGGREGATION_RAW
+            else AGGREGATED_ATTRIBUTES
+        )
+
+    def handles(self, attribute: str) -> bool:
+        """Return True if sensors of ``attribute`` show what the stage
+        publishes rather than every polled value."""
+        return attribute in self._attributes
+
+    def value(self, heat_pump_id: str, attribute: str, polled: Any) -> Any:
+        """Return the value to show for ``attribute`` of a heat pump."""
+        published = self.published.get((heat_pump_id, attribute))
+        return polled if published is None else published.value
+
+    def attributes(self, heat_pump_id: str, attribute: str) -> dict[str, Any]:
+        """Return the window statistics of ``attribute`` of a heat pump."""
+        published = self.published.get((heat_pump_id, attribute))
+        return {} if published is None else published.attributes()
+
+    def process(self, snapshot: ThermiaSnapshot) -> None:
+        """Feed the values of a poll through the stage."""
+        self.updated = set()
+        self.moved = set()
+        if not self._attributes:
+            return
+
+        now = self._clock()
+        for heat_pump in snapshot.heat_pumps:
+            for attribute in self._attributes:
+                if not heat_pump.fetched(attribute):
+                    # Keep showing the last value; the sensor is unavailable
+                    continue
+                key = (heat_pump.id, attribute)
+                value = heat_pump.values.get(attribute)
+                if not _numeric(value):
+                    self._publish(key, Published(value), now)
+                elif self.mode == AGGREGATION_WINDOW:
+                    self._windows.setdefault(key, _Window()).add(value)
+                else:
+                    self._filter(
+                        key, value, now, self.filters.get(attribute, self._filter_all)
+                    )
+
+        if self.mode == AGGREGATION_WINDOW and (
+            self._window_end is None or now >= self._window_end
+        ):
+            # The first poll is published at once so sensors start with a value
+            for key, window in self._windows.items():
+                self._publish(key, window.published(), now)
+            self._windows.clear()
+            self._window_end = now + self.window
+
+    def _filter(
+        self, key: PublishedKey, value: float, now: float, sensor_filter: SensorFilter
+    ) -> None:
+        """Publish ``value`` if it is significant or a heartbeat is due."""
+        published = self.published.get(key)
+        if published is None or not _numeric(published.value):
+            self._publish(key, Published(value), now)
+        elif sensor_filter.significant(value, published.value):
+            self.moved.add(key)
+            self._publish(key, Published(value), now)
+        elif (
+            sensor_filter.max_silence is not None
+            and now - self._published_at[key] >= sensor_filter.max_silence
+        ):
+            self.heartbeats[key] = self.heartbeats.get(key, 0) + 1
+            self._publish(key, Published(value), now, force=True)
+        elif value != published.value:
+            self.suppressed[key] = self.suppressed.get(key, 0) + 1
+
+    def _publish(
+        self,
+        key: PublishedKey,
+        published: Published,
+        now: float,
+        force: bool = False,
+    ) -> None:
+        if force or self.published.get(key) != published:
+            self.published[key] = published
+            self._published_at[key] = now
+            self.updated.add(key)
+
+
+@dataclass(frozen=True, slots=True)
+class AggregatedWatch(EntityWatch):
+    """Watch the value ``attribute`` as published by ``stage``."""
+
+    attribute: str = ""
+    stage: AggregationStage | None = field(default=None, compare=False)
+
+    def affected(
+        self,
+        changes: dict[int, frozenset[str]],
+        previous: ThermiaSnapshot,
+        current: ThermiaSnapshot,
+    ) -> bool:
+        """Return True if a value was published or anything else changed."""
+        if self.stage is None or not self.stage.handles(self.attribute):
+            return EntityWatch.affected(self, changes, previous, current)
+
+        changed = changes.get(self.idx, frozenset())
+        if not (self.attributes - {self.attribute}).isdisjoint(changed):
+            return True
+        previous_pump = previous.heat_pumps[self.idx]
+        current_pump = current.heat_pumps[self.idx]
+        if self.attribute in changed and previous_pump.fetched(
+            self.attribute
+        ) != current_pump.fetched(self.attribute):
+            return True
+        return (current_pump.id, self.attribute) in self.stage.updated
@@ -0,0 +1,76 @@
+"""Active alarms of the heat pumps and how they change from poll to poll."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Mapping
+
+
+@dataclass(frozen=True, slots=True)
+class Alarm:
+    """One active alarm, as listed by the events endpoint."""
+
+    id: str
+    title: str | None
+    details: Mapping[str, Any] = field(compare=False)
+
+    @classmethod
+    def from_event(cls, event: Mapping[str, Any]) -> Alarm:
+        """Return the alarm of an event of the events response."""
+        title = event.get("eventTitle")
+        return cls(
+            id=str(event.get("id", title)),
+            title=title,
+            details=MappingProxyType(dict(event)),
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the alarm as JSON serializable data."""
+        return {"id": self.id, "title": self.title, "details": dict(self.details)}
+
+
+class AlarmTracker:
+    """Active alarms of every heat pump of an account, indexed by alarm ID.
+
+    ``update`` diffs a fresh events response against the alarms known so
+    far. The events response is cached between its refreshes, so a poll that
+    reuses it is skipped without looking at the events. The first response
+    of a heat pump only seeds its alarms: alarms that were already active
+    before Home Assistant started are not reported as raised.
+    """
+
+    def __init__(self) -> None:
+        self.active: dict[str, dict[str, Alarm]] = {}
+        self._events: dict[str, list] = {}
+
+    def update(
+        self, heat_pump_id: str, events: list | None
+    ) -> tuple[list[Alarm], list[Alarm]]:
+        """Take in the events of a heat pump and return the raised and the
+        cleared alarms."""
+        if events is None or self._events.get(heat_pump_id) is events:
+            # Not fetched yet, or the response of the last poll again
+            return [], []
+        self._events[heat_pump_id] = events
+
+        current = {
+            alarm.id: alarm
+            for alarm in (
+                Alarm.from_event(event)
+                for event in events
+                if event.get("isActiveAlarm") is True
+            )
+        }
+        previous = self.active.get(heat_pump_id)
+        self.active[heat_pump_id] = current
+        if previous is None:
+            return [], []
+        return (
+            [alarm for alarm_id, alarm in current.items() if alarm_id not in previous],
+            [alarm for alarm_id, alarm in previous.items() if alarm_id not in current],
+        )
+
+    def alarms(self, heat_pump_id: str) -> list[Alarm]:
+        """Return the active alarms of a heat pump."""
+        return list(self.active.get(heat_pump_id, {}).values())
@@ -0,0 +1,162 @@
+"""Thermia Online tokens kept across reloads and restarts."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from datetime import datetime
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from ThermiaOnlineAPI import Thermia
+from ThermiaOnlineAPI.api.ThermiaAPI import ThermiaAPI
+
+from .const import (
+    AUTH_SAVE_DELAY,
+    AUTH_STORAGE_KEY,
+    DOMAIN,
+    STORAGE_VERSION,
+    TOKEN_REFRESH_MARGIN,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_TOKEN_STORE = f"{DOMAIN}_tokens"
+
+
+@dataclass(frozen=True, slots=True)
+class ThermiaTokens:
+    """Access and refresh token of one account with their expiry."""
+
+    api_base_url: str
+    token: str
+    token_valid_to: float
+    refresh_token: str | None = None
+    refresh_token_valid_to: float | None = None
+
+    @classmethod
+    def from_api(cls, api: ThermiaAPI) -> ThermiaTokens | None:
+        """Return the tokens a logged in ``ThermiaAPI`` holds."""
+        token = getattr(api, "_ThermiaAPI__token", None)
+        if not token:
+            return None
+        return cls(
+            api_base_url=api.configuration["apiBaseUrl"],
+            token=token,
+            token_valid_to=api._ThermiaAPI__token_valid_to,
+            refresh_token=api._ThermiaAPI__refresh_token,
+            refresh_token_valid_to=api._ThermiaAPI__refresh_token_valid_to,
+        )
+
+    @property
+    def usable(self) -> bool:
+        """Return True if the tokens can still get requests through."""
+        now = datetime.now().timestamp()
+        return self.token_valid_to > now or (
+            self.refresh_token is not None
+            and self.refresh_token_valid_to is not None
+            and self.refresh_token_valid_to > now
+        )
+
+    @staticmethod
+    def expiring(api: ThermiaAPI) -> bool:
+        """Return True if the access token of ``api`` expires soon."""
+        valid_to = api._ThermiaAPI__token_valid_to
+        return (
+            valid_to is None
+            or valid_to - TOKEN_REFRESH_MARGIN < datetime.now().timestamp()
+        )
+
+    def resume(self, username: str, password: str) -> Thermia:
+        """Build a logged in ``Thermia`` from the tokens, without logging in.
+
+        Blocking: fetches the heat pumps of the account. Raises if the tokens
+        are rejected.
+        """
+        api = object.__new__(ThermiaAPI)
+        # Run the library's own constructor, which sets up the session and its
+        # retry adapter, with the configuration fetch and the login replaced
+        # for the duration of the call
+        api._ThermiaAPI__fetch_configuration = lambda: {
+            "apiBaseUrl": self.api_base_url
+        }
+        api._ThermiaAPI__authenticate = lambda: True
+        try:
+            ThermiaAPI.__init__(api, username, password)
+        finally:
+            del api._ThermiaAPI__fetch_configuration
+            del api._ThermiaAPI__authenticate
+
+        api._ThermiaAPI__token = self.token
+        api._ThermiaAPI__token_valid_to = self.token_valid_to
+        api._ThermiaAPI__refresh_token = self.refresh_token
+        api._ThermiaAPI__refresh_token_valid_to = self.refresh_token_valid_to
+        headers = getattr(api, "_ThermiaAPI__default_request_headers", None)
+        if headers is None:
+            raise AttributeError("ThermiaAPI keeps no default request headers")
+        headers["Authorization"] = "Bearer " + self.token
+
+        # Thermia only wraps the API; its constructor would log in again
+        thermia = object.__new__(Thermia)
+        thermia._username = username
+        thermia._password = password
+        thermia.api_interface = api
+        thermia.connected = api.authenticated
+        thermia.heat_pumps = thermia.fetch_heat_pumps()
+        return thermia
+
+
+class TokenStore:
+    """Tokens of every account, persisted in Home Assistant's storage."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._store: Store[dict[str, dict[str, Any]]] = Store(
+            hass, STORAGE_VERSION, AUTH_STORAGE_KEY, private=True
+        )
+        self._tokens: dict[str, ThermiaTokens] | None = None
+
+    async def async_get(self, username: str) -> ThermiaTokens | None:
+        """Return the stored tokens of ``username``."""
+        return (await self._async_load()).get(username)
+
+    async def async_set(self, username: str, tokens: ThermiaTokens | None) -> None:
+        """Remember the tokens of ``username``; ``None`` forgets them.
+
+        The stored tokens are loaded first so the tokens of the other
+        accounts are kept.
+        """
+        stored = await self._async_load()
+        if stored.get(username) == tokens:
+            return
+        if tokens is None:
+            stored.pop(username, None)
+        else:
+            stored[username] = tokens
+        self._store.async_delay_save(self._data_to_store, AUTH_SAVE_DELAY)
+
+    async def _async_load(self) -> dict[str, ThermiaTokens]:
+        if self._tokens is None:
+            stored = await self._store.async_load() or {}
+            tokens = {}
+            for name, data in stored.items():
+                try:
+                    tokens[name] = ThermiaTokens(**data)
+                except TypeError:
+                    _LOGGER.debug("Ignoring invalid stored tokens of %s", name)
+            # Another caller may have loaded the store while this one waited
+            if self._tokens is None:
+                self._tokens = tokens
+        return self._tokens
+
+    @callback
+    def _data_to_store(self) -> dict[str, dict[str, Any]]:
+        return {name: asdict(tokens) for name, tokens in (self._tokens or {}).items()}
+
+
+@callback
+def async_get_token_store(hass: HomeAssistant) -> TokenStore:
+    """Return the token store shared by all config entries."""
+    if (store := hass.data.get(DATA_TOKEN_STORE)) is None:
+        store = hass.data[DATA_TOKEN_STORE] = TokenStore(hass)
+    return store
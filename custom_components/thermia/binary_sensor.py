@@ -12,7 +12,11 @@ from homeassistant.components.binary_sensor import BinarySensorDeviceClass
 from .binary_sensors.operational_or_power_status_binary_sensor import (
     ThermiaOperationalOrPowerStatusBinarySensor,
 )
+from .binary_sensors.short_cycling_binary_sensor import (
+    ThermiaShortCyclingBinarySensor,
+)
 from .const import (
+    COMPRESSOR_OPERATIONAL_STATUS,
     DOMAIN,
     MDI_INFORMATION_OUTLINE_ICON,
 )
@@ -52,6 +56,14 @@ async def async_setup_entry(
                     )
                 )
 
+            if (
+                COMPRESSOR_OPERATIONAL_STATUS
+                in heat_pump.available_operational_statuses
+            ):
+                hass_thermia_binary_sensors.append(
+                    ThermiaShortCyclingBinarySensor(coordinator, idx)
+                )
+
         if (
             heat_pump.available_power_statuses is not None
             and heat_pump.running_power_statuses is not None
@@ -6,14 +6,13 @@ from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
 )
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from ..const import DOMAIN
-from ..coordinator import ThermiaDataUpdateCoordinator
+from ..entity import ThermiaEntity
+from ..snapshot import MembershipWatch
 
 
 class ThermiaOperationalOrPowerStatusBinarySensor(
-    CoordinatorEntity[ThermiaDataUpdateCoordinator], BinarySensorEntity
+    ThermiaEntity, BinarySensorEntity
 ):
     """Representation of an Thermia Operational or Power Status binary sensor."""
 
@@ -28,7 +27,15 @@ class ThermiaOperationalOrPowerStatusBinarySensor(
         status_value: str,
         running_status_list: str,
     ):
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator,
+            MembershipWatch(
+                idx,
+                frozenset({is_online_prop, running_status_list, "name"}),
+                status_list=running_status_list,
+                member=status_value,
+            ),
+        )
         self.idx: int = idx
 
         self._is_online_prop: str = is_online_prop
@@ -41,17 +48,19 @@ class ThermiaOperationalOrPowerStatusBinarySensor(
     @property
     def available(self):
         """Return True if entity is available."""
-        return getattr(self.coordinator.data.heat_pumps[self.idx], self._is_online_prop)
+        return self._fetched(self._running_status_list) and getattr(
+            self.coordinator.data.heat_pumps[self.idx], self._is_online_prop
+        )
 
     @property
     def name(self):
         """Return the name of the sensor."""
-        return f"{self.coordinator.data.heat_pumps[self.idx].name} {self._binary_sensor_name}"
+        return self.coordinator.descriptors[self.idx].entity_name(self._binary_sensor_name)
 
     @property
     def unique_id(self):
         """Return the unique ID of the sensor."""
-        return f"{self.coordinator.data.heat_pumps[self.idx].name}_{self._binary_sensor_name.lower().replace(' ', '_')}"
+        return self.coordinator.descriptors[self.idx].entity_unique_id(self._binary_sensor_name)
 
     @property
     def icon(self):
@@ -61,13 +70,7 @@ class ThermiaOperationalOrPowerStatusBinarySensor(
     @property
     def device_info(self):
         """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.data.heat_pumps[self.idx].id)},
-            "name": self.coordinator.data.heat_pumps[self.idx].name,
-            "manufacturer": "Thermia",
-            "model": self.coordinator.data.heat_pumps[self.idx].model,
-            "model_id": self.coordinator.data.heat_pumps[self.idx].model_id,
-        }
+        return self.coordinator.descriptors[self.idx].device_info
 
     @property
     def device_class(self):
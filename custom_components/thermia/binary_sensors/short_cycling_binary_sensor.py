@@ -0,0 +1,87 @@
+"""Thermia compressor short cycling binary sensor integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass,
+    BinarySensorEntity,
+)
+
+from ..const import SHORT_CYCLE_MAX_STARTS_PER_HOUR, SHORT_CYCLE_MIN_RUN_TIME
+from ..derived import SHORT_CYCLING, DerivedWatch
+from ..entity import ThermiaEntity
+
+
+class ThermiaShortCyclingBinarySensor(ThermiaEntity, BinarySensorEntity):
+    """Problem sensor that turns on while the compressor short cycles.
+
+    The compressor short cycles when it started more often than the limit
+    or ran shorter than the minimum run time within the last hour, as seen
+    in the transition log of its operational status.
+    """
+
+    def __init__(self, coordinator, idx: int):
+        super().__init__(
+            coordinator,
+            DerivedWatch(
+                idx,
+                frozenset({"is_online", "name", "running_operational_statuses"}),
+                SHORT_CYCLING,
+                coordinator.derived,
+            ),
+        )
+        self.idx: int = idx
+
+    @property
+    def available(self):
+        """Return True if entity is available."""
+        return self._fetched("running_operational_statuses") and bool(
+            self.coordinator.data.heat_pumps[self.idx].is_online
+        )
+
+    @property
+    def name(self):
+        """Return the name of the sensor."""
+        return self.coordinator.descriptors[self.idx].entity_name(
+            "Compressor Short Cycling"
+        )
+
+    @property
+    def unique_id(self):
+        """Return the unique ID of the sensor."""
+        return self.coordinator.descriptors[self.idx].entity_unique_id(
+            "Compressor Short Cycling"
+        )
+
+    @property
+    def icon(self):
+        """Return the icon of the sensor."""
+        return "mdi:sync-alert"
+
+    @property
+    def device_info(self):
+        """Return device information."""
+        return self.coordinator.descriptors[self.idx].device_info
+
+    @property
+    def device_class(self):
+        """Return the device class of the sensor."""
+        return BinarySensorDeviceClass.PROBLEM
+
+    @property
+    def is_on(self):
+        """Return True if the compressor is short cycling."""
+        return self.coordinator.derived.value(
+            self.coordinator.data.heat_pumps[self.idx].id, SHORT_CYCLING
+        )
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the limits the compressor is held to."""
+        return {
+            "max_starts_per_hour": SHORT_CYCLE_MAX_STARTS_PER_HOUR,
+            "min_run_minutes": SHORT_CYCLE_MIN_RUN_TIME / 60,
+            **(super().extra_state_attributes or {}),
+        }
@@ -0,0 +1,919 @@
+"""Async client for the Thermia Online API."""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import logging
+import threading
+import time
+from typing import Any, AsyncIterator, Callable, Iterable, TypeVar
+
+from aiohttp import ClientError, ClientSession, ClientTimeout
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util.json import json_loads
+from ThermiaOnlineAPI import Thermia, ThermiaHeatPump
+from ThermiaOnlineAPI.const import (
+    REG_GROUP_OPERATIONAL_TIME,
+    THERMIA_INSTALLATION_PATH,
+)
+
+from .alarms import AlarmTracker
+from .auth import ThermiaTokens, TokenStore, async_get_token_store
+from .metrics import PollMetrics
+from .registers import RegisterConstraints, RegisterKey, RegisterWrite
+from .sources import ALL_ATTRIBUTES, SourceStatus, unavailable_attributes
+from .const import (
+    CLIENT_MAX_WORKERS,
+    DEFAULT_PARALLEL_FETCHES,
+    DEFAULT_REQUEST_TIMEOUT,
+    DOMAIN,
+    EVENT_ALARM_CLEARED,
+    EVENT_ALARM_RAISED,
+    MAX_CONCURRENT_REQUESTS,
+    REFRESH_TIER_ALARM,
+    REFRESH_TIER_COLD,
+    REFRESH_TIER_HOT,
+    REFRESH_TIER_INTERVALS,
+    REFRESH_TIER_WARM,
+    SHARED_UPDATE_MAX_AGE,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+RequestKey = tuple[str, ...]
+
+# Blocking ThermiaAPI GET helpers that ThermiaHeatPump.update_data() goes
+# through, mapped to the path they request. Register groups are fetched with a
+# name mangled private helper, which is why it is listed by its mangled name.
+ENDPOINTS: dict[str, str] = {
+    "get_devices": "/api/v1/installationsInfo",
+    "get_device_info": "/api/v1/installations/{0}",
+    "get_device_status": "/api/v1/installationstatus/{0}/status",
+    "get_all_alarms": "/api/v1/installation/{0}/events?onlyActiveAlarms=false",
+    "_ThermiaAPI__get_register_group": THERMIA_INSTALLATION_PATH + "{0}/Groups/{1}",
+}
+
+_REGISTERS_PATH = THERMIA_INSTALLATION_PATH + "{0}/Registers"
+_PROFILE_GROUPS_PATH = "/api/v1/installationprofiles/{0}/groups"
+
+# Refresh tier of each endpoint or register group; anything not listed is
+# live telemetry and refetched on every poll. The device info, operation mode
+# and heating curve groups carry the online state and current settings, so
+# they stay live too.
+REQUEST_TIERS: dict[str, str] = {
+    "get_devices": REFRESH_TIER_COLD,
+    "get_all_alarms": REFRESH_TIER_WARM,
+    REG_GROUP_OPERATIONAL_TIME: REFRESH_TIER_WARM,
+}
+
+
+def source_name(key: RequestKey) -> str:
+    """Return the endpoint or register group ``key`` fetches."""
+    if key[0] == "_ThermiaAPI__get_register_group":
+        return key[-1]
+    return key[0]
+
+
+class CacheMissError(Exception):
+    """Raised when the library asks for a response that was not prefetched."""
+
+
+class TierCache:
+    """Responses of one refresh tier, each kept for ``interval`` seconds."""
+
+    def __init__(self, name: str, interval: float):
+        self.name = name
+        self.interval = interval
+        self.responses: dict[RequestKey, Any] = {}
+        self.fetched_at: dict[RequestKey, float] = {}
+
+    def store(self, key: RequestKey, response: Any, now: float) -> None:
+        """Store a fresh response."""
+        self.responses[key] = response
+        self.fetched_at[key] = now
+
+    def expire(self, now: float) -> None:
+        """Drop responses older than the tier interval."""
+        for key, fetched_at in list(self.fetched_at.items()):
+            if now - fetched_at >= self.interval:
+                self.drop(key)
+
+    def drop(self, key: RequestKey) -> None:
+        """Drop one response."""
+        self.responses.pop(key, None)
+        self.fetched_at.pop(key, None)
+
+
+class ResponseCache:
+    """Response cache shared by the async prefetch and the blocking library.
+
+    The ThermiaAPI helpers listed in ``ENDPOINTS`` are shadowed on the API
+    instance, so every request the library makes is answered from here when
+    possible. Each key the library asks for is remembered in ``plan`` so the
+    next cycle can prefetch exactly those responses natively.
+
+    Responses are split into refresh tiers: live telemetry is refetched every
+    poll, while operational times, alarms and installation metadata are kept
+    in their own tier cache and only refetched once their interval expires.
+    Single keys can be moved to another tier, which is how the alarms of a
+    heat pump with active alarms are refetched more often.
+
+    The outcome of the last fetch of every key is kept in ``status``. A key
+    whose fetch failed is left out of its tier, so the next poll retries it
+    whatever its tier, and is answered with its last good response meanwhile.
+
+    The library fills the cache from the client worker threads while the
+    event loop reads it, so every change and every walk over the cached keys
+    holds ``_lock``; callers use the accessors below rather than the dicts.
+    """
+
+    def __init__(self, intervals: dict[str, float] = REFRESH_TIER_INTERVALS):
+        self.tiers = {
+            name: TierCache(name, interval) for name, interval in intervals.items()
+        }
+        self.plan: set[RequestKey] = set()
+        # Keys moved to another tier than their endpoint's for a while
+        self.overrides: dict[RequestKey, str] = {}
+        self.status: dict[RequestKey, SourceStatus] = {}
+        self._last_good: dict[RequestKey, Any] = {}
+        self._strict_thread: int | None = None
+        self._lock = threading.RLock()
+
+    def install(self, api: Any) -> None:
+        """Route the library GET helpers of ``api`` through the cache."""
+        for endpoint in ENDPOINTS:
+            original = getattr(api, endpoint)
+            setattr(api, endpoint, partial(self._call, endpoint, original))
+
+    def tier(self, key: RequestKey) -> TierCache:
+        """Return the tier cache that holds ``key``."""
+        tier = (
+            self.overrides.get(key)
+            or REQUEST_TIERS.get(key[0])
+            or REQUEST_TIERS.get(key[-1])
+        )
+        return self.tiers[tier or REFRESH_TIER_HOT]
+
+    def __contains__(self, key: RequestKey) -> bool:
+        return key in self.tier(key).responses
+
+    def get(self, key: RequestKey) -> Any:
+        """Return the cached response for ``key``."""
+        return self.tier(key).responses[key]
+
+    def last(self, key: RequestKey) -> Any:
+        """Return the last good response for ``key``, if there is one."""
+        return self._last_good.get(key)
+
+    def retier(self, key: RequestKey, tier: str | None) -> None:
+        """Keep ``key`` in the cache of ``tier``, or back in the tier of its
+        endpoint when ``tier`` is None, carrying its cached response over."""
+        with self._lock:
+            if self.overrides.get(key) == tier:
+                return
+            old = self.tier(key)
+            if tier is None:
+                del self.overrides[key]
+            else:
+                self.overrides[key] = tier
+            if key in old.responses:
+                self.tier(key).store(key, old.responses[key], old.fetched_at[key])
+                old.drop(key)
+
+    def store(self, key: RequestKey, response: Any) -> None:
+        """Store a fresh response for ``key``."""
+        with self._lock:
+            self.tier(key).store(key, response, time.monotonic())
+            self._last_good[key] = response
+            self.status[key] = SourceStatus(True, time.time())
+
+    def fail(self, key: RequestKey, error: Exception) -> None:
+        """Record that fetching ``key`` failed with ``error``."""
+        with self._lock:
+            self.tier(key).drop(key)
+            self.status[key] = self.status.get(key, SourceStatus(False)).failed(
+                error
+            )
+
+    def sources(self, device_id: str) -> dict[str, SourceStatus]:
+        """Return the status of every data source of heat pump ``device_id``."""
+        with self._lock:
+            return {
+                source_name(key): status
+                for key, status in self.status.items()
+                if key[1:2] == (device_id,)
+            }
+
+    def statuses(self) -> list[tuple[RequestKey, SourceStatus]]:
+        """Return the status of every key fetched so far."""
+        with self._lock:
+            return list(self.status.items())
+
+    def responses(self, endpoint: str) -> list[tuple[RequestKey, Any]]:
+        """Return the cached responses of ``endpoint``."""
+        with self._lock:
+            return [
+                (key, response)
+                for tier in self.tiers.values()
+                for key, response in tier.responses.items()
+                if key[0] == endpoint
+            ]
+
+    def missing(self) -> set[RequestKey]:
+        """Return the keys of the plan that are not cached."""
+        with self._lock:
+            return {key for key in self.plan if key not in self}
+
+    def expire(self) -> None:
+        """Drop every response whose tier interval has passed."""
+        now = time.monotonic()
+        with self._lock:
+            for tier in self.tiers.values():
+                tier.expire(now)
+
+    def _call(self, endpoint: str, original: Callable[..., Any], *args: Any) -> Any:
+        key = (endpoint, *map(str, args))
+        with self._lock:
+            self.plan.add(key)
+
+            if key in self:
+                return self.get(key)
+            if self._strict_thread == threading.get_ident():
+                if key in self._last_good and not self.status[key].ok:
+                    return self._last_good[key]
+                raise CacheMissError(key)
+
+        try:
+            response = original(*args)
+        except Exception as exception:
+            self.fail(key, exception)
+            raise
+        self.store(key, response)
+        return response
+
+    def run_strict(self, func: Callable[[], _T]) -> _T:
+        """Run ``func`` in the calling thread, failing instead of doing I/O."""
+        self._strict_thread = threading.get_ident()
+        try:
+            return func()
+        finally:
+            self._strict_thread = None
+
+    def invalidate(
+        self, device_id: str | None = None, endpoint: str | None = None
+    ) -> None:
+        """Drop cached responses, optionally only those of one heat pump
+        and one endpoint."""
+        with self._lock:
+            for tier in self.tiers.values():
+                for key in list(tier.responses):
+                    if (device_id is None or device_id in key[1:2]) and (
+                        endpoint is None or key[0] == endpoint
+                    ):
+                        tier.drop(key)
+
+
+class ThermiaClient:
+    """Async client for one Thermia Online account.
+
+    ThermiaOnlineAPI is blocking, so it is only used for what it does best:
+    the Azure login flow and turning the cloud JSON into ``ThermiaHeatPump``
+    objects. Polling fetches every response the library needs with Home
+    Assistant's shared aiohttp session and then lets the library parse them
+    straight from the ``ResponseCache`` on the event loop; register writes
+    are posted natively too. Calls that cannot be served natively, such as the
+    login itself, run on a small worker pool owned by the client instead of
+    Home Assistant's shared executor.
+
+    A client can be shared by several coordinators: concurrent refreshes join
+    the one in flight and a refresh right after another one is served from
+    its results. ``limiter`` caps the requests in flight and may be shared
+    with other clients.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        username: str,
+        password: str,
+        max_workers: int = CLIENT_MAX_WORKERS,
+        tokens: TokenStore | None = None,
+        limiter: asyncio.Semaphore | None = None,
+        max_parallel_fetches: int = DEFAULT_PARALLEL_FETCHES,
+        request_timeout: float = DEFAULT_REQUEST_TIMEOUT,
+    ):
+        self.hass = hass
+        self.username = username
+        self._password = password
+        self._tokens = tokens
+        self._auth_lock = asyncio.Lock()
+        self._login_lock = asyncio.Lock()
+        self._limiter = limiter or asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self._update: asyncio.Task[None] | None = None
+        self.max_parallel_fetches = max_parallel_fetches
+        self.request_timeout = request_timeout
+        # Heat pump ID to error of the heat pumps the last poll could not parse
+        self.failures: dict[str, Exception] = {}
+        self._updated_at: float = -SHARED_UPDATE_MAX_AGE
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=f"{DOMAIN}_{username}"
+        )
+        self._session: ClientSession = async_get_clientsession(hass)
+        self.cache = ResponseCache()
+        self.thermia: Thermia | None = None
+        self.native: bool = False
+        self.calls: int = 0
+        self.executor_calls: int = 0
+        self.metrics = PollMetrics()
+        self.constraints = RegisterConstraints()
+        self.alarms = AlarmTracker()
+
+    @property
+    def heat_pumps(self) -> list[ThermiaHeatPump]:
+        """Return the heat pumps of the logged in account."""
+        if self.thermia is None:
+            return []
+        return self.thermia.heat_pumps
+
+    def _heat_pump(self, idx: int) -> ThermiaHeatPump:
+        if self.thermia is None:
+            raise HomeAssistantError("Not connected to Thermia Online yet")
+        return self.thermia.heat_pumps[idx]
+
+    @property
+    def _api(self) -> Any:
+        return self.thermia.api_interface
+
+    async def async_run(self, func: Callable[..., _T], *args: Any) -> _T:
+        """Run a blocking library call on the client worker pool."""
+        self.executor_calls += 1
+        return await self.hass.loop.run_in_executor(
+            self._executor, partial(func, *args)
+        )
+
+    async def async_login(self, reuse_tokens: bool = True) -> None:
+        """Log in and fetch the heat pumps of the account.
+
+        Stored tokens of the account are reused when they are still valid; a
+        full username and password login is only done when they are not, or
+        when the cloud rejects them.
+        """
+        self.thermia = None
+        with self.metrics.time("auth"):
+            await self._async_resume_or_login(reuse_tokens)
+        await self._async_remember_tokens()
+
+        try:
+            self.cache.install(self._api)
+            self._api._ThermiaAPI__default_request_headers  # noqa: B018
+            self._api._ThermiaAPI__token_valid_to  # noqa: B018
+        except AttributeError:
+            _LOGGER.warning(
+                "Installed ThermiaOnlineAPI does not support native requests, "
+                "falling back to blocking calls"
+            )
+            self.native = False
+        else:
+            self.native = True
+
+    async def _async_resume_or_login(self, reuse_tokens: bool) -> None:
+        if reuse_tokens and self._tokens is not None:
+            tokens = await self._tokens.async_get(self.username)
+            if tokens is not None and tokens.usable:
+                try:
+                    self.thermia = await self.async_run(
+                        tokens.resume, self.username, self._password
+                    )
+                except Exception as exception:  # noqa: BLE001
+                    _LOGGER.debug(
+                        "Stored tokens were rejected, logging in again: %s",
+                        exception,
+                    )
+
+        if self.thermia is None:
+            self.thermia = await self.async_run(
+                Thermia, self.username, self._password
+            )
+
+    async def async_connect(self) -> None:
+        """Log in unless already logged in, joining a login in progress."""
+        async with self._login_lock:
+            if self.thermia is None:
+                await self.async_login()
+
+    async def async_update_data(self) -> None:
+        """Refresh the data of all heat pumps, unless it just was.
+
+        Coordinators sharing the client wait for the refresh in flight
+        instead of starting their own.
+        """
+        if self._update is None:
+            if time.monotonic() - self._updated_at < SHARED_UPDATE_MAX_AGE:
+                return
+            self._update = self.hass.loop.create_task(self._async_update_data())
+            self._update.add_done_callback(self._update_done)
+        await asyncio.shield(self._update)
+
+    def _update_done(self, update: asyncio.Task[None]) -> None:
+        self._update = None
+        if not update.cancelled() and update.exception() is None:
+            self._updated_at = time.monotonic()
+
+    def mark_stale(self) -> None:
+        """Make the next refresh fetch, however recent the last one was."""
+        self._updated_at = -SHARED_UPDATE_MAX_AGE
+
+    def invalidate(self) -> None:
+        """Make the next refresh fetch every response again."""
+        self.cache.invalidate()
+        self.mark_stale()
+
+    async def _async_update_data(self) -> None:
+        """Refresh the data of all heat pumps, tier by tier.
+
+        The responses of every heat pump are fetched concurrently. A response
+        that cannot be fetched is replaced by its last good one and only the
+        attributes read from it become unavailable. A heat pump without such
+        a fallback keeps its previous values and is listed in ``failures``.
+        Only a poll in which nothing could be fetched raises.
+        """
+        try:
+            await self._async_update_heat_pumps()
+        finally:
+            self.metrics.end_cycle()
+
+    async def _async_update_heat_pumps(self) -> None:
+        self.cache.expire()
+        failures: dict[str, Exception] = {}
+        learn = list(self.heat_pumps)
+
+        if self.native and self.cache.plan:
+            with self.metrics.time("prefetch"):
+                failed = await self._async_prefetch(self.cache.missing())
+            learn = []
+            for heat_pump in self.heat_pumps:
+                try:
+                    with self.metrics.time("parse"):
+                        self.cache.run_strict(heat_pump.update_data)
+                except CacheMissError as miss:
+                    if (error := failed.get(miss.args[0])) is not None:
+                        failures[str(heat_pump.id)] = error
+                        continue
+                    _LOGGER.debug("Response %s was not prefetched", miss)
+                    learn.append(heat_pump)
+
+        if learn:
+            # First cycle, or the library asked for something new: let it
+            # fetch on its own so the request plan is learned for the next
+            # cycle.
+            with self.metrics.time("learn"):
+                results = await asyncio.gather(
+                    *(self.async_run(heat_pump.update_data) for heat_pump in learn),
+                    return_exceptions=True,
+                )
+            for heat_pump, result in zip(learn, results):
+                if isinstance(result, Exception):
+                    failures[str(heat_pump.id)] = result
+            # The library may have refreshed the tokens on its own
+            await self._async_remember_tokens()
+
+        self._index_constraints()
+        self._track_alarms()
+        self.failures = failures
+        if failures:
+            _LOGGER.debug("Failed to update heat pumps %s", failures)
+            if len(failures) >= len(self.heat_pumps):
+                raise next(iter(failures.values()))
+
+    def _index_constraints(self) -> None:
+        """Index the register limits of the register groups in the cache."""
+        for key, response in self.cache.responses("_ThermiaAPI__get_register_group"):
+            self.constraints.index(key[1], key[2], response)
+
+    def _track_alarms(self) -> None:
+        """Fire an event for every alarm raised or cleared since the last
+        poll, and refetch the alarms of heat pumps with active alarms in
+        the faster alarm tier."""
+        for heat_pump in self.heat_pumps:
+            device_id = str(heat_pump.id)
+            key = ("get_all_alarms", device_id)
+            raised, cleared = self.alarms.update(device_id, self.cache.last(key))
+            self.cache.retier(
+                key, REFRESH_TIER_ALARM if self.alarms.active.get(device_id) else None
+            )
+            for event_type, alarms in (
+                (EVENT_ALARM_RAISED, raised),
+                (EVENT_ALARM_CLEARED, cleared),
+            ):
+                for alarm in alarms:
+                    self.hass.bus.async_fire(
+                        event_type,
+                        {
+                            "heat_pump_id": device_id,
+                            "heat_pump_name": heat_pump.name,
+                            **alarm.as_dict(),
+                        },
+                    )
+
+    def validate_register(
+        self, idx: int, register: RegisterKey | int | None, value: float
+    ) -> float:
+        """Return ``value`` snapped to the step of a register of heat pump
+        ``idx``, by group and name or by ID, without a request.
+
+        Raises ServiceValidationError if the register cannot take the value.
+        """
+        if register is None or self.thermia is None:
+            return value
+        heat_pump_id = str(self._heat_pump(idx).id)
+        return self.constraints.validate(heat_pump_id, register, value)
+
+    def register_index(self, idx: int, name: str) -> int | None:
+        """Return the ID of one of the library's named registers, such as
+        ``temperature``, on heat pump ``idx``."""
+        return self._heat_pump(idx).get_register_indexes().get(name)
+
+    @property
+    def degraded(self) -> bool:
+        """Return True if the last poll could not fetch everything."""
+        return bool(self.failures) or any(
+            not status.ok for _, status in self.cache.statuses()
+        )
+
+    def unavailable(self) -> dict[str, frozenset[str]]:
+        """Return the attributes the last poll could not fetch per heat pump ID."""
+        unavailable = {}
+        for heat_pump in self.heat_pumps:
+            device_id = str(heat_pump.id)
+            if device_id in self.failures:
+                unavailable[device_id] = ALL_ATTRIBUTES
+                continue
+            unavailable[device_id] = unavailable_attributes(
+                [
+                    source
+                    for source, status in self.cache.sources(device_id).items()
+                    if not status.ok
+                ]
+            )
+        return unavailable
+
+    async def async_fetch_heat_pumps(self) -> list[ThermiaHeatPump]:
+        """Fetch the heat pumps of the account."""
+        return await self.async_run(self.thermia.fetch_heat_pumps)
+
+    async def async_set_temperature(self, idx: int, temperature: float) -> None:
+        """Set the heating target temperature."""
+        heat_pump = self._heat_pump(idx)
+        await self._async_set_register_value(
+            heat_pump, heat_pump.get_register_indexes()["temperature"], temperature
+        )
+
+    async def async_set_operation_mode(self, idx: int, operation_mode: str) -> None:
+        """Set the operation mode."""
+        heat_pump = self._heat_pump(idx)
+
+        if heat_pump.is_operation_mode_read_only:
+            _LOGGER.error("Operation mode of %s is read only", heat_pump.name)
+            return
+
+        value = next(
+            (
+                value
+                for value, name in (heat_pump.available_operation_mode_map or {}).items()
+                if name == operation_mode
+            ),
+            None,
+        )
+        if value is None:
+            _LOGGER.error("Invalid operation mode %s", operation_mode)
+            return
+
+        await self._async_set_register_value(
+            heat_pump, heat_pump.get_register_indexes()["operation_mode"], value
+        )
+
+    async def async_set_hot_water_start_temperature(
+        self, idx: int, temperature: float
+    ) -> None:
+        """Set the hot water start temperature."""
+        await self.async_run(
+            self._heat_pump(idx).set_hot_water_start_temperature, temperature
+        )
+
+    async def async_set_hot_water_switch_state(self, idx: int, state: int) -> None:
+        """Set the hot water switch state."""
+        heat_pump = self._heat_pump(idx)
+        await self._async_set_register_value(
+            heat_pump, heat_pump.get_register_indexes()["hot_water_switch"], state
+        )
+
+    async def async_set_hot_water_boost_switch_state(
+        self, idx: int, state: int
+    ) -> None:
+        """Set the hot water boost switch state."""
+        heat_pump = self._heat_pump(idx)
+        await self._async_set_register_value(
+            heat_pump, heat_pump.get_register_indexes()["hot_water_boost_switch"], state
+        )
+
+    async def async_set_register(
+        self, idx: int, register_group: str, register_name: str, value: float
+    ) -> None:
+        """Write a register value by register group and name."""
+        heat_pump = self._heat_pump(idx)
+
+        if not self.native:
+            value = self.constraints.validate(
+                str(heat_pump.id), (register_group, register_name), value
+            )
+            await self.async_run(
+                heat_pump.set_register_data_by_register_group_and_name,
+                register_group,
+                register_name,
+                value,
+            )
+            return
+
+        group = await self._async_get(
+            ("_ThermiaAPI__get_register_group", heat_pump.id, register_group)
+        )
+        register_id = next(
+            (
+                register["registerId"]
+                for register in group or []
+                if register.get("registerName") == register_name
+            ),
+            None,
+        )
+        await self._async_set_register_value(heat_pump, register_id, value)
+
+    async def async_registers(
+        self, idx: int, register_groups: Iterable[str]
+    ) -> dict[RegisterKey, dict[str, Any]]:
+        """Return the registers of ``register_groups`` by group and name.
+
+        Groups come from the response cache when it holds them, so this is
+        cheap right after a poll.
+        """
+        heat_pump = self._heat_pump(idx)
+        register_groups = list(dict.fromkeys(register_groups))
+        if self.native:
+            groups = await asyncio.gather(
+                *(
+                    self._async_get(
+                        ("_ThermiaAPI__get_register_group", str(heat_pump.id), group)
+                    )
+                    for group in register_groups
+                )
+            )
+        else:
+            groups = [
+                await self.async_run(
+                    self._api.get_register_group_json, heat_pump.id, group
+                )
+                for group in register_groups
+            ]
+        for group, registers in zip(register_groups, groups):
+            self.constraints.index(str(heat_pump.id), group, registers)
+        return {
+            (group, register["registerName"]): register
+            for group, registers in zip(register_groups, groups)
+            for register in registers or []
+            if register.get("registerName") is not None
+        }
+
+    async def async_set_registers(
+        self,
+        idx: int,
+        values: dict[RegisterKey, float],
+        registers: dict[RegisterKey, dict[str, Any]] | None = None,
+    ) -> list[RegisterWrite]:
+        """Write several registers of a heat pump at once.
+
+        The API takes one register per request, so the writes are posted
+        concurrently, bounded by the request limit, and the register groups
+        of the heat pump are invalidated once afterwards. ``registers`` are
+        the registers already returned by ``async_registers``; they are only
+        fetched when not given. A failed write does not stop the others;
+        every outcome is returned with its duration.
+        """
+        heat_pump = self._heat_pump(idx)
+        if registers is None:
+            registers = await self.async_registers(idx, (group for group, _ in values))
+
+        async def write(key: RegisterKey, value: float) -> RegisterWrite:
+            start = time.perf_counter()
+            try:
+                if (register := registers.get(key)) is None:
+                    raise HomeAssistantError(
+                        f"Register {key[1]} is not available on {heat_pump.name}"
+                    )
+                await self._async_post_register_value(
+                    heat_pump, register["registerId"], value
+                )
+            except Exception as error:  # noqa: BLE001
+                # The library raises bare exceptions; report them per register
+                return RegisterWrite(key, value, error, time.perf_counter() - start)
+            return RegisterWrite(key, value, seconds=time.perf_counter() - start)
+
+        if self.native:
+            results = await asyncio.gather(
+                *(write(key, value) for key, value in values.items())
+            )
+        else:
+            # Writes through the library are posted one after the other
+            results = [await write(key, value) for key, value in values.items()]
+        self.cache.invalidate(str(heat_pump.id), "_ThermiaAPI__get_register_group")
+        return results
+
+    async def async_debug_sections(
+        self, heat_pump: ThermiaHeatPump
+    ) -> AsyncIterator[tuple[str, Any]]:
+        """Yield the sections of a debug report of ``heat_pump`` one by one.
+
+        Each section is a title and the response it shows, in the order of
+        ``ThermiaHeatPump.debug``; register groups are fetched one at a time
+        as the report is consumed. Requires native requests.
+        """
+        device_id = str(heat_pump.id)
+        info = await self._async_get(("get_device_info", device_id))
+        yield "self.__info", info
+        yield "self.__status", await self._async_get(("get_device_status", device_id))
+        devices = await self._async_get(("get_devices",))
+        yield "self.__device_data", next(
+            (device for device in devices if str(device["id"]) == device_id), None
+        )
+
+        profile_id = (info or {}).get("installationProfileId")
+        if profile_id is None:
+            return
+        groups = await self._async_request(
+            "GET", _PROFILE_GROUPS_PATH.format(profile_id)
+        )
+        yield "All available groups", groups
+        for group in groups or []:
+            if (name := group.get("name")) is not None:
+                yield f"Group {name}", await self._async_get(
+                    ("_ThermiaAPI__get_register_group", device_id, name)
+                )
+
+    def close(self) -> None:
+        """Release the worker pool."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _async_set_register_value(
+        self, heat_pump: ThermiaHeatPump, register_index: int | None, value: Any
+    ) -> None:
+        """Post a register value, the way ThermiaAPI.set_register_value does."""
+        if register_index is None:
+            _LOGGER.error("Register is not available on %s", heat_pump.name)
+            return
+
+        value = self.constraints.validate(str(heat_pump.id), register_index, value)
+        await self._async_post_register_value(heat_pump, register_index, value)
+        # Only the register groups of this heat pump can have changed
+        self.cache.invalidate(str(heat_pump.id), "_ThermiaAPI__get_register_group")
+
+    async def _async_post_register_value(
+        self, heat_pump: ThermiaHeatPump, register_index: int, value: Any
+    ) -> None:
+        """Post a register value without touching the response cache."""
+        if not self.native:
+            await self.async_run(
+                self._api.set_register_value, heat_pump, register_index, value
+            )
+            return
+
+        body = {
+            "registerSpecificationId": register_index,
+            "registerValue": value,
+            "clientUuid": "api-client-uuid",
+        }
+        with self.metrics.time("write"):
+            await self._async_request(
+                "POST", _REGISTERS_PATH.format(heat_pump.id), json=body
+            )
+
+    async def _async_prefetch(
+        self, keys: set[RequestKey]
+    ) -> dict[RequestKey, Exception]:
+        """Fetch all ``keys`` concurrently into the response cache.
+
+        At most ``max_parallel_fetches`` requests are in flight at once.
+        Returns the keys that failed with their error. Raises if a request
+        that is not tied to a heat pump failed, or every request did.
+        """
+        semaphore = asyncio.Semaphore(self.max_parallel_fetches)
+
+        async def fetch(key: RequestKey) -> Any:
+            async with semaphore:
+                return await self._async_get(key)
+
+        keys = list(keys)
+        responses = await asyncio.gather(
+            *(fetch(key) for key in keys), return_exceptions=True
+        )
+        failed: dict[RequestKey, Exception] = {}
+        for key, response in zip(keys, responses):
+            if not isinstance(response, BaseException):
+                self.cache.store(key, response)
+                continue
+            if not isinstance(response, Exception) or len(key) < 2:
+                raise response
+            self.cache.fail(key, response)
+            failed[key] = response
+
+        if failed and len(failed) == len(keys):
+            raise next(iter(failed.values()))
+        return failed
+
+    async def _async_get(self, key: RequestKey) -> Any:
+        """Fetch the response the library would get for ``key``."""
+        if key in self.cache:
+            return self.cache.get(key)
+
+        endpoint, *args = key
+        with self.metrics.time(f"fetch {source_name(key)}"):
+            response = await self._async_request(
+                "GET", ENDPOINTS[endpoint].format(*args)
+            )
+        if endpoint == "get_devices":
+            return response.get("items", [])
+        return response
+
+    async def _async_request(self, method: str, path: str, **kwargs: Any) -> Any:
+        """Send an authenticated request, logging in again once on 401."""
+        await self._async_ensure_token()
+
+        for attempt in (1, 2):
+            async with self._limiter, self._session.request(
+                method,
+                self._api.configuration["apiBaseUrl"] + path,
+                headers=self._api._ThermiaAPI__default_request_headers,
+                timeout=ClientTimeout(total=self.request_timeout),
+                **kwargs,
+            ) as response:
+                self.calls += 1
+                if response.status == 401 and attempt == 1:
+                    await self._async_ensure_token(force=True)
+                    continue
+                if response.status != 200:
+                    raise ClientError(
+                        f"{method} {path} failed with status {response.status}"
+                    )
+                body = await response.read()
+            self.metrics.request(len(body))
+            if not body.strip():
+                return None
+            with self.metrics.time("decode"):
+                return json_loads(body)
+
+    async def _async_ensure_token(self, force: bool = False) -> None:
+        """Renew the access token before it expires.
+
+        The library uses the refresh token while it is valid and logs in with
+        username and password otherwise. ``force`` is used after a 401 and
+        always does the full login.
+        """
+        if not force and not ThermiaTokens.expiring(self._api):
+            return
+        token = self._api._ThermiaAPI__token
+        async with self._auth_lock:
+            # Concurrent requests share one renewal
+            if self._api._ThermiaAPI__token != token:
+                return
+            if force:
+                self._api._ThermiaAPI__refresh_token = None
+                self._api._ThermiaAPI__refresh_token_valid_to = None
+            with self.metrics.time("auth"):
+                await self.async_run(self._authenticate)
+            await self._async_remember_tokens()
+
+    def _authenticate(self) -> None:
+        self._api.authenticated = self._api._ThermiaAPI__authenticate()
+
+    async def _async_remember_tokens(self) -> None:
+        if self._tokens is not None and self.thermia is not None:
+            await self._tokens.async_set(
+                self.username, ThermiaTokens.from_api(self._api)
+            )
+
+
+async def async_check_credentials(
+    hass: HomeAssistant, username: str, password: str
+) -> None:
+    """Log in once to validate credentials, keeping the tokens for setup."""
+    client = ThermiaClient(
+        hass, username, password, max_workers=1, tokens=async_get_token_store(hass)
+    )
+    try:
+        await client.async_login(reuse_tokens=False)
+    finally:
+        client.close()
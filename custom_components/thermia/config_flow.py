@@ -6,12 +6,35 @@ import voluptuous as vol
 
 import homeassistant.helpers.config_validation as cv
 from homeassistant import config_entries
-from ThermiaOnlineAPI import AuthenticationException, Thermia
+from homeassistant.core import callback
+from ThermiaOnlineAPI import AuthenticationException
 
+from .client import async_check_credentials
 from .const import (
+    AGGREGATION_MODES,
+    CONF_AGGREGATION,
+    CONF_AGGREGATION_DEADBAND,
+    CONF_AGGREGATION_WINDOW,
+    CONF_DIAGNOSTIC_SENSORS,
+    CONF_PARALLEL_FETCHES,
     CONF_PASSWORD,
+    CONF_REQUEST_TIMEOUT,
     CONF_USERNAME,
+    CONF_WRITE_DEBOUNCE,
+    DEFAULT_AGGREGATION,
+    DEFAULT_AGGREGATION_DEADBAND,
+    DEFAULT_AGGREGATION_WINDOW,
+    DEFAULT_DIAGNOSTIC_SENSORS,
+    DEFAULT_PARALLEL_FETCHES,
+    DEFAULT_REQUEST_TIMEOUT,
+    DEFAULT_WRITE_DEBOUNCE,
     DOMAIN,
+    MAX_AGGREGATION_DEADBAND,
+    MAX_AGGREGATION_WINDOW,
+    MAX_PARALLEL_FETCHES,
+    MAX_REQUEST_TIMEOUT,
+    MAX_WRITE_DEBOUNCE,
+    POLL_INTERVAL_FAST,
 )
 
 STEP_USER_DATA_SCHEMA = vol.Schema(
@@ -34,16 +57,18 @@ class ThermiaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Initialize."""
         self._errors = {}
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry):
+        """Get the options flow for this handler."""
+        return ThermiaOptionsFlow(config_entry)
+
     async def _check_credentials(self, user_input):
         """Check if Thermia credentials are valid."""
         try:
-            thermia = await self.hass.async_add_executor_job(
-                lambda: Thermia(
-                    user_input[CONF_USERNAME],
-                    user_input[CONF_PASSWORD],
-                )
+            await async_check_credentials(
+                self.hass, user_input[CONF_USERNAME], user_input[CONF_PASSWORD]
             )
-            await self.hass.async_add_executor_job(thermia.fetch_heat_pumps)
         except Exception as error:
             _LOGGER.error(error)
             self._errors["base"] = "invalid_credentials"
@@ -68,3 +93,78 @@ class ThermiaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             data_schema=STEP_USER_DATA_SCHEMA,
             errors=self._errors,
         )
+
+
+class ThermiaOptionsFlow(config_entries.OptionsFlow):
+    """Thermia Options Flow."""
+
+    def __init__(self, config_entry):
+        """Initialize."""
+        self.config_entry = config_entry
+
+    async def async_step_init(self, user_input=None):
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_WRITE_DEBOUNCE,
+                        default=self.config_entry.options.get(
+                            CONF_WRITE_DEBOUNCE, DEFAULT_WRITE_DEBOUNCE
+                        ),
+                    ): vol.All(
+                        vol.Coerce(float), vol.Range(min=0, max=MAX_WRITE_DEBOUNCE)
+                    ),
+                    vol.Optional(
+                        CONF_PARALLEL_FETCHES,
+                        default=self.config_entry.options.get(
+                            CONF_PARALLEL_FETCHES, DEFAULT_PARALLEL_FETCHES
+                        ),
+                    ): vol.All(
+                        vol.Coerce(int), vol.Range(min=1, max=MAX_PARALLEL_FETCHES)
+                    ),
+                    vol.Optional(
+                        CONF_REQUEST_TIMEOUT,
+                        default=self.config_entry.options.get(
+                            CONF_REQUEST_TIMEOUT, DEFAULT_REQUEST_TIMEOUT
+                        ),
+                    ): vol.All(
+                        vol.Coerce(float), vol.Range(min=1, max=MAX_REQUEST_TIMEOUT)
+                    ),
+                    vol.Optional(
+                        CONF_AGGREGATION,
+                        default=self.config_entry.options.get(
+                            CONF_AGGREGATION, DEFAULT_AGGREGATION
+                        ),
+                    ): vol.In(AGGREGATION_MODES),
+                    vol.Optional(
+                        CONF_AGGREGATION_WINDOW,
+                        default=self.config_entry.options.get(
+                            CONF_AGGREGATION_WINDOW, DEFAULT_AGGREGATION_WINDOW
+                        ),
+                    ): vol.All(
+                        vol.Coerce(float),
+                        vol.Range(min=POLL_INTERVAL_FAST, max=MAX_AGGREGATION_WINDOW),
+                    ),
+                    vol.Optional(
+                        CONF_AGGREGATION_DEADBAND,
+                        default=self.config_entry.options.get(
+                            CONF_AGGREGATION_DEADBAND, DEFAULT_AGGREGATION_DEADBAND
+                        ),
+                    ): vol.All(
+                        vol.Coerce(float),
+                        vol.Range(min=0, max=MAX_AGGREGATION_DEADBAND),
+                    ),
+                    vol.Optional(
+                        CONF_DIAGNOSTIC_SENSORS,
+                        default=self.config_entry.options.get(
+                            CONF_DIAGNOSTIC_SENSORS, DEFAULT_DIAGNOSTIC_SENSORS
+                        ),
+                    ): cv.boolean,
+                }
+            ),
+        )
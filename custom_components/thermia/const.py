@@ -2,10 +2,112 @@ DOMAIN = "thermia"
 
 CONF_USERNAME = "username"
 CONF_PASSWORD = "password"
+CONF_WRITE_DEBOUNCE = "write_debounce"
+CONF_PARALLEL_FETCHES = "parallel_fetches"
+CONF_REQUEST_TIMEOUT = "request_timeout"
+CONF_AGGREGATION = "aggregation"
+CONF_AGGREGATION_WINDOW = "aggregation_window"
+CONF_AGGREGATION_DEADBAND = "aggregation_deadband"
+CONF_DIAGNOSTIC_SENSORS = "diagnostic_sensors"
 
 MDI_INFORMATION_OUTLINE_ICON = "mdi:information-outline"
 MDI_TIMER_COG_OUTLINE_ICON = "mdi:timer-cog-outline"
 MDI_TEMPERATURE_ICON = "mdi:thermometer"
 
 DEBUG_ACTION_NAME = "debug"
-DEFAULT_DEBUG_FILENAME = "thermia_debug.txt"
+REFRESH_METADATA_ACTION_NAME = "refresh_metadata"
+TELEMETRY_ACTION_NAME = "get_telemetry"
+REGISTERS_ACTION_NAME = "set_registers"
+
+EVENT_ALARM_RAISED = f"{DOMAIN}_alarm_raised"
+EVENT_ALARM_CLEARED = f"{DOMAIN}_alarm_cleared"
+
+# Debug reports go to this directory in the configuration directory
+DEBUG_DIRECTORY = "thermia_debug"
+DEBUG_KEEP_FILES = 10
+# Uncompressed size after which a debug report is cut off
+DEBUG_MAX_BYTES = 20 * 1024 * 1024
+
+CLIENT_MAX_WORKERS = 2
+# Requests in flight to Thermia Online across all config entries
+MAX_CONCURRENT_REQUESTS = 16
+# Seconds a refresh is reused by other coordinators sharing the client
+SHARED_UPDATE_MAX_AGE = 5
+
+COMPRESSOR_OPERATIONAL_STATUS = "COMPRESSOR"
+
+POLL_INTERVAL_FAST = 10
+POLL_INTERVAL_SLOW = 120
+POLL_MAX_BACKOFF = 900
+POLL_JITTER = 0.1
+CHANGE_RATE_SMOOTHING = 0.3
+WRITE_CONFIRM_WINDOW = 60
+
+# Samples kept per heat pump by the telemetry recorder, 12 hours at the fast
+# poll interval
+TELEMETRY_SAMPLES = 4320
+
+# Seconds without a new value before queued register writes are posted
+DEFAULT_WRITE_DEBOUNCE = 1.5
+MAX_WRITE_DEBOUNCE = 30
+
+# Requests in flight per account while fetching the heat pumps of one poll
+DEFAULT_PARALLEL_FETCHES = 8
+MAX_PARALLEL_FETCHES = 16
+# Seconds before a single request to Thermia Online is given up
+DEFAULT_REQUEST_TIMEOUT = 10
+MAX_REQUEST_TIMEOUT = 60
+
+# What the measurement sensors show of the polled values
+AGGREGATION_RAW = "raw"
+AGGREGATION_WINDOW = "window"
+AGGREGATION_DEADBAND = "deadband"
+AGGREGATION_MODES = [AGGREGATION_RAW, AGGREGATION_WINDOW, AGGREGATION_DEADBAND]
+DEFAULT_AGGREGATION = AGGREGATION_RAW
+# Seconds of polls summed up by one published value in window mode
+DEFAULT_AGGREGATION_WINDOW = 60
+MAX_AGGREGATION_WINDOW = 3600
+# Change in the sensor unit needed to publish a value in deadband mode
+DEFAULT_AGGREGATION_DEADBAND = 0.2
+MAX_AGGREGATION_DEADBAND = 10
+
+# Deadband of the jittery refrigerant and hot water temperature sensors, in
+# degrees, and seconds after which they show their value anyway
+TEMPERATURE_DEADBAND = 0.2
+SENSOR_HEARTBEAT = 900
+
+# Seconds of polls the compressor duty cycle and starts are computed over
+DERIVED_METRICS_WINDOW = 3600
+# Transitions kept per operational status: enough for one every fast poll
+# over the whole window
+TRANSITION_LOG_SIZE = DERIVED_METRICS_WINDOW // POLL_INTERVAL_FAST
+# The compressor is short cycling when it starts more often than this per
+# hour, or a run within the window was shorter than this many seconds
+SHORT_CYCLE_MAX_STARTS_PER_HOUR = 3
+SHORT_CYCLE_MIN_RUN_TIME = 600
+
+# Whether to add sensors showing the duration and traffic of every poll
+DEFAULT_DIAGNOSTIC_SENSORS = False
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.snapshot"
+SNAPSHOT_SAVE_DELAY = 60
+AUTH_STORAGE_KEY = f"{DOMAIN}.auth"
+AUTH_SAVE_DELAY = 1
+
+# Renew access tokens this many seconds before they expire
+TOKEN_REFRESH_MARGIN = 300
+
+ATTR_STALE = "stale"
+
+REFRESH_TIER_HOT = "hot"
+REFRESH_TIER_WARM = "warm"
+REFRESH_TIER_COLD = "cold"
+# Alarms of a heat pump while any of them is active
+REFRESH_TIER_ALARM = "alarm"
+REFRESH_TIER_INTERVALS = {
+    REFRESH_TIER_HOT: 0,
+    REFRESH_TIER_ALARM: 30,
+    REFRESH_TIER_WARM: 300,
+    REFRESH_TIER_COLD: 3600,
+}
@@ -1,39 +1,296 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Callable
 from datetime import timedelta
 import logging
+import time
+from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from ThermiaOnlineAPI import Thermia
 
-from .const import DOMAIN
+from .aggregation import AggregationStage
+from .client import ThermiaClient
+from .const import (
+    COMPRESSOR_OPERATIONAL_STATUS,
+    DEFAULT_WRITE_DEBOUNCE,
+    DOMAIN,
+    POLL_INTERVAL_FAST,
+    SNAPSHOT_SAVE_DELAY,
+)
+from .derived import DerivedMetrics
+from .device import HeatPumpDescriptor, refresh_descriptors
+from .metrics import PollMetrics
+from .optimistic import OptimisticState
+from .registers import RegisterKey, RegisterWrite
+from .scheduler import AdaptivePollScheduler
+from .snapshot import EntityWatch, ThermiaSnapshot
+from .telemetry import TelemetryRecorder
+from .writes import WriteQueue
 
 _LOGGER = logging.getLogger(__name__)
 
+# Attributes telling what the heat pump is doing; measured values only speed
+# up polling once they leave their aggregation deadband, not with every jitter
+SCHEDULE_ATTRIBUTES = frozenset(
+    {
+        "is_online",
+        "running_operational_statuses",
+        "running_power_statuses",
+        "operation_mode",
+        "hot_water_switch_state",
+        "hot_water_boost_switch_state",
+        "active_alarm_count",
+    }
+)
 
-class ThermiaDataUpdateCoordinator(DataUpdateCoordinator[Thermia]):
+
+class ThermiaDataUpdateCoordinator(DataUpdateCoordinator[ThermiaSnapshot]):
     """Thermia Data Update Coordinator."""
 
-    def __init__(self, hass: HomeAssistant, thermia: Thermia):
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: ThermiaClient,
+        store: Store | None = None,
+        write_debounce: float = DEFAULT_WRITE_DEBOUNCE,
+        phase: float = 0.0,
+        aggregation: AggregationStage | None = None,
+    ):
         """Initialize the data update object."""
 
-        self.thermia = thermia
-        
-        # Francis - reducing update to 10 seconds to reduce platform load 
-        
+        self.client = client
+        self.store = store
+        self.scheduler = AdaptivePollScheduler(phase=phase)
+        self.optimistic = OptimisticState()
+        self.telemetry = TelemetryRecorder()
+        self.aggregation = aggregation or AggregationStage()
+        self.derived = DerivedMetrics()
+        self.metrics = PollMetrics()
+        self.writes = WriteQueue(
+            hass, write_debounce, self.async_request_refresh_after_write
+        )
+
+        self.previous_data: ThermiaSnapshot | None = None
+        self.changes: dict[int, frozenset[str]] | None = None
+        self.descriptors: tuple[HeatPumpDescriptor, ...] = ()
+        self.platforms: set[str] = set()
+        self.state_writes: int = 0
+        self.suppressed_writes: int = 0
+
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=10),
+            update_interval=timedelta(seconds=POLL_INTERVAL_FAST),
         )
 
-    async def _async_update_data(self):
+    async def _async_update_data(self) -> ThermiaSnapshot:
         """Update the data."""
         try:
-            await self.hass.async_add_executor_job(lambda: self.thermia.update_data())
+            with self.metrics.time("update"):
+                await self.client.async_connect()
+                await self.client.async_update_data()
         except Exception as exception:
+            self.update_interval = timedelta(seconds=self.scheduler.on_failure())
             raise UpdateFailed(exception)
 
-        return self.thermia
+        with self.metrics.time("snapshot"):
+            snapshot = ThermiaSnapshot.capture(
+                self.client.thermia,
+                self.client.unavailable(),
+                {
+                    str(heat_pump.id): self.client.cache.sources(str(heat_pump.id))
+                    for heat_pump in self.client.heat_pumps
+                },
+            )
+
+        with self.metrics.time("telemetry"):
+            self.telemetry.record(time.time(), snapshot)
+            self.aggregation.process(snapshot)
+
+        with self.metrics.time("derived"):
+            self.derived.process(snapshot)
+
+        with self.metrics.time("diff"):
+            self.previous_data = self.data
+            self.changes = snapshot.diff(self.data)
+            if not self.last_update_success:
+                # Entities went unavailable with the failed poll, update them all
+                self.changes = None
+
+            if (settled := self.optimistic.reconcile(snapshot)) and self.changes:
+                # Entities showing a write that did not stick show the poll again
+                for idx, attribute in settled:
+                    if idx in self.changes:
+                        self.changes[idx] = self.changes[idx] | {attribute}
+
+        if self.changes is None or any(
+            "name" in changed for changed in self.changes.values()
+        ):
+            self.descriptors = refresh_descriptors(
+                self.descriptors, snapshot.heat_pumps
+            )
+
+        if self.store is not None:
+            self.store.async_delay_save(self._data_to_store, SNAPSHOT_SAVE_DELAY)
+
+        self.update_interval = timedelta(
+            seconds=self.scheduler.on_success(
+                changed=self.changes is None
+                or bool(self.aggregation.moved)
+                or any(
+                    not SCHEDULE_ATTRIBUTES.isdisjoint(changed)
+                    for changed in self.changes.values()
+                ),
+                active=any(
+                    COMPRESSOR_OPERATIONAL_STATUS
+                    in (heat_pump.running_operational_statuses or ())
+                    for heat_pump in snapshot.heat_pumps
+                ),
+                # Retry what failed soon rather than in the usual interval
+                degraded=self.client.degraded,
+            )
+        )
+
+        return snapshot
+
+    async def async_restore(self) -> bool:
+        """Publish the last stored snapshot, if any, until the first poll.
+
+        Entities can then be set up without waiting for the cloud; the
+        restored snapshot is marked stale.
+        """
+        if self.store is None or (stored := await self.store.async_load()) is None:
+            return False
+
+        try:
+            snapshot = ThermiaSnapshot.from_dict(stored)
+        except (KeyError, TypeError) as error:
+            _LOGGER.warning("Ignoring invalid stored snapshot: %s", error)
+            return False
+
+        self.descriptors = refresh_descriptors((), snapshot.heat_pumps)
+        self.data = snapshot
+        return True
+
+    async def async_refresh_in_phase(self) -> None:
+        """Refresh once the phase offset of this coordinator has passed."""
+        await asyncio.sleep(self.scheduler.take_phase())
+        await self.async_refresh()
+
+    @callback
+    def _data_to_store(self) -> dict:
+        """Return the snapshot to persist."""
+        return self.data.as_dict()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update the listeners whose watched attributes changed."""
+        changes = self.changes if self.last_update_success else None
+        self.changes = None
+
+        entities = notified = 0
+        with self.metrics.time("dispatch"):
+            for update_callback, context in list(self._listeners.values()):
+                if not isinstance(context, EntityWatch):
+                    update_callback()
+                    continue
+                entities += 1
+                if changes is None or context.affected(
+                    changes, self.previous_data, self.data
+                ):
+                    update_callback()
+                    notified += 1
+        self.metrics.end_cycle()
+
+        self.state_writes += notified
+        self.suppressed_writes += entities - notified
+        _LOGGER.debug(
+            "Updated %s of %s entities (%s state writes suppressed so far)",
+            notified,
+            entities,
+            self.suppressed_writes,
+        )
+
+    def value(self, idx: int, attribute: str) -> Any:
+        """Return ``attribute`` of heat pump ``idx`` as entities show it.
+
+        Values of writes that no poll has confirmed yet take precedence over
+        the snapshot.
+        """
+        return self.optimistic.value(
+            idx, attribute, getattr(self.data.heat_pumps[idx], attribute)
+        )
+
+    def published(self, idx: int, attribute: str) -> Any:
+        """Return ``attribute`` of heat pump ``idx`` as the measurement
+        sensors show it, after the aggregation stage."""
+        heat_pump = self.data.heat_pumps[idx]
+        return self.aggregation.value(
+            heat_pump.id, attribute, getattr(heat_pump, attribute)
+        )
+
+    async def async_write_optimistic(
+        self,
+        idx: int,
+        attribute: str,
+        value: Any,
+        write: Callable[[], Awaitable[None]],
+    ) -> None:
+        """Show ``value`` for ``attribute`` right away and run ``write``.
+
+        The value is dropped again if the write fails.
+        """
+        self.optimistic.expect(
+            idx, attribute, value, getattr(self.data.heat_pumps[idx], attribute)
+        )
+        self._async_update_watchers(idx, attribute)
+        try:
+            await write()
+        except Exception:
+            self.optimistic.discard(idx, attribute)
+            self._async_update_watchers(idx, attribute)
+            raise
+
+    async def async_write_registers(
+        self,
+        idx: int,
+        values: dict[RegisterKey, float],
+        registers: dict[RegisterKey, dict[str, Any]] | None = None,
+    ) -> list[RegisterWrite]:
+        """Write several registers of heat pump ``idx``, then refresh once.
+
+        Queued writes are posted first, so a debounced slider value cannot
+        overwrite a value of the batch afterwards. ``registers`` are passed on
+        to ``ThermiaClient.async_set_registers``.
+        """
+        await self.writes.async_flush(refresh=False)
+        results = await self.client.async_set_registers(idx, values, registers)
+        if any(result.error is None for result in results):
+            await self.async_request_refresh_after_write()
+        return results
+
+    @callback
+    def _async_update_watchers(self, idx: int, attribute: str) -> None:
+        """Update the entities that render ``attribute`` of heat pump ``idx``."""
+        for update_callback, context in list(self._listeners.values()):
+            if (
+                isinstance(context, EntityWatch)
+                and context.idx == idx
+                and attribute in context.attributes
+            ):
+                update_callback()
+
+    async def async_request_refresh_after_write(self) -> None:
+        """Poll fast until a write shows up, starting with a refresh now."""
+        self.scheduler.note_write()
+        self.client.mark_stale()
+        await self.async_request_refresh()
+
+    async def async_shutdown(self) -> None:
+        """Post queued writes, then stop refreshing."""
+        await self.writes.async_flush(refresh=False)
+        await super().async_shutdown()
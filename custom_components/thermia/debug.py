@@ -0,0 +1,140 @@
+"""Compressed debug reports of Thermia heat pumps."""
+
+from __future__ import annotations
+
+from datetime import datetime
+import gzip
+import logging
+import os
+import time
+from typing import IO, Any
+
+from homeassistant.core import HomeAssistant
+from ThermiaOnlineAPI import ThermiaHeatPump
+from ThermiaOnlineAPI.utils.utils import pretty_json_string_except
+
+from .client import ThermiaClient
+from .const import DEBUG_DIRECTORY, DEBUG_KEEP_FILES, DEBUG_MAX_BYTES
+
+_LOGGER = logging.getLogger(__name__)
+
+_FILE_PREFIX = "thermia_debug_"
+
+# Keys left out of the report, as ThermiaHeatPump.debug does
+_REDACTED_KEYS: dict[str, list[str]] = {
+    "self.__info": [
+        "deviceId",
+        "name",
+        "address",
+        "macAddress",
+        "ownerId",
+        "retailerAccess",
+        "retailerId",
+        "timeZoneId",
+        "id",
+        "hasUserAccount",
+    ],
+    "self.__device_data": [
+        "deviceId",
+        "location",
+        "name",
+        "macAddress",
+        "owner",
+        "retailerAccess",
+        "retailerId",
+        "id",
+        "status",
+    ],
+}
+
+
+async def async_dump_heat_pump(
+    hass: HomeAssistant,
+    client: ThermiaClient,
+    heat_pump: ThermiaHeatPump,
+    max_bytes: int = DEBUG_MAX_BYTES,
+) -> dict[str, Any]:
+    """Write a gzip compressed debug report of ``heat_pump``.
+
+    The report is streamed to a timestamped file in the debug directory of
+    the configuration directory one section at a time, so no more than one
+    register group is held in memory. Writing stops after ``max_bytes`` of
+    uncompressed report, and only the newest ``DEBUG_KEEP_FILES`` reports
+    are kept. Returns the path, sizes and timing of the report.
+    """
+    start = time.perf_counter()
+    directory = hass.config.path(DEBUG_DIRECTORY)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    path = os.path.join(
+        directory, f"{_FILE_PREFIX}{heat_pump.id}_{timestamp}.txt.gz"
+    )
+
+    report = await hass.async_add_executor_job(_open_report, path)
+    written = sections = 0
+    truncated = False
+    try:
+        async for text in _async_report(client, heat_pump):
+            if written + len(text) > max_bytes:
+                text = (
+                    text[: max_bytes - written]
+                    + "\n########## DEBUG TRUNCATED ##########\n"
+                )
+                truncated = True
+            await hass.async_add_executor_job(report.write, text)
+            written += len(text)
+            sections += 1
+            if truncated:
+                break
+    finally:
+        await hass.async_add_executor_job(report.close)
+
+    compressed = await hass.async_add_executor_job(
+        _rotate, directory, path, DEBUG_KEEP_FILES
+    )
+    result = {
+        "heat_pump": heat_pump.id,
+        "path": path,
+        "sections": sections,
+        "bytes": written,
+        "compressed_bytes": compressed,
+        "truncated": truncated,
+        "seconds": round(time.perf_counter() - start, 3),
+    }
+    _LOGGER.info("Thermia debug report written: %s", result)
+    return result
+
+
+async def _async_report(client: ThermiaClient, heat_pump: ThermiaHeatPump):
+    """Yield the text of the report section by section."""
+    if not client.native:
+        # The library only builds the report as a whole
+        yield await client.async_run(heat_pump.debug)
+        return
+
+    yield "########## DEBUG START ##########\n"
+    async for title, data in client.async_debug_sections(heat_pump):
+        yield f"{title}:\n" + (
+            pretty_json_string_except(data, _REDACTED_KEYS.get(title, [])) or ""
+        )
+    yield "########## DEBUG END ##########\n"
+
+
+def _open_report(path: str) -> IO[str]:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return gzip.open(path, "wt", encoding="utf-8")
+
+
+def _rotate(directory: str, path: str, keep: int) -> int:
+    """Delete all but the newest ``keep`` reports; return the size of ``path``."""
+    reports = sorted(
+        (
+            entry
+            for entry in os.scandir(directory)
+            if entry.name.startswith(_FILE_PREFIX) and entry.is_file()
+        ),
+        key=lambda entry: entry.stat().st_mtime,
+        reverse=True,
+    )
+    for entry in reports[keep:]:
+        os.remove(entry.path)
+    return os.path.getsize(path)
@@ -0,0 +1,265 @@
+"""Metrics derived from the polled values, updated poll by poll."""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+import time
+from typing import Any, Callable
+
+from homeassistant.const import PERCENTAGE, UnitOfTemperature, UnitOfTime
+
+from .const import (
+    COMPRESSOR_OPERATIONAL_STATUS,
+    DERIVED_METRICS_WINDOW,
+    SHORT_CYCLE_MAX_STARTS_PER_HOUR,
+    SHORT_CYCLE_MIN_RUN_TIME,
+)
+from .snapshot import EntityWatch, HeatPumpSnapshot, ThermiaSnapshot
+from .transitions import TransitionRecorder
+
+DerivedKey = tuple[str, str]
+
+# Key of the flag telling whether the compressor is short cycling
+SHORT_CYCLING = "short_cycling"
+
+
+@dataclass(frozen=True, slots=True)
+class DerivedMetric:
+    """Description of a metric computed from the snapshot attributes
+    ``inputs``."""
+
+    key: str
+    name: str
+    icon: str
+    inputs: tuple[str, ...]
+    unit: str | None = None
+    device_class: str | None = None
+
+
+# Differences between the first and the second input
+DELTA_METRICS: tuple[DerivedMetric, ...] = (
+    DerivedMetric(
+        key="supply_return_delta_t",
+        name="Supply Return Delta T",
+        icon="mdi:thermometer-lines",
+        inputs=("supply_line_temperature", "return_line_temperature"),
+        unit=UnitOfTemperature.KELVIN,
+    ),
+    DerivedMetric(
+        key="brine_delta_t",
+        name="Brine Delta T",
+        icon="mdi:thermometer-lines",
+        inputs=("brine_in_temperature", "brine_out_temperature"),
+        unit=UnitOfTemperature.KELVIN,
+    ),
+)
+
+# Statistics of the compressor over the last window
+COMPRESSOR_METRICS: tuple[DerivedMetric, ...] = (
+    DerivedMetric(
+        key="compressor_duty_cycle",
+        name="Compressor Duty Cycle",
+        icon="mdi:percent",
+        inputs=("running_operational_statuses",),
+        unit=PERCENTAGE,
+    ),
+    DerivedMetric(
+        key="compressor_starts",
+        name="Compressor Starts Last Hour",
+        icon="mdi:counter",
+        inputs=("running_operational_statuses",),
+    ),
+    DerivedMetric(
+        key="compressor_shortest_run",
+        name="Compressor Shortest Run Last Hour",
+        icon="mdi:timer-outline",
+        inputs=("running_operational_statuses",),
+        unit=UnitOfTime.MINUTES,
+        device_class="duration",
+    ),
+)
+
+DERIVED_METRICS = DELTA_METRICS + COMPRESSOR_METRICS
+
+
+def _numeric(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def supported(heat_pump: HeatPumpSnapshot, metric: DerivedMetric) -> bool:
+    """Return True if ``heat_pump`` reports what ``metric`` is computed from."""
+    if metric in COMPRESSOR_METRICS:
+        return COMPRESSOR_OPERATIONAL_STATUS in (
+            heat_pump.available_operational_statuses or ()
+        )
+    return all(_numeric(heat_pump.values.get(attribute)) for attribute in metric.inputs)
+
+
+class CompressorWindow:
+    """Run time of a compressor over the last ``window`` seconds.
+
+    The time between polls is kept as segments of one state, merged while the
+    state stays the same, with running sums of the time covered and the time
+    running. Segments are dropped as they leave the window, so a poll costs
+    O(1) amortized however long the window is.
+    """
+
+    __slots__ = ("window", "_segments", "_running", "_total", "_last")
+
+    def __init__(self, window: float = DERIVED_METRICS_WINDOW) -> None:
+        self.window = window
+        # Start, end and state of every segment
+        self._segments: deque[list] = deque()
+        self._running = 0.0
+        self._total = 0.0
+        self._last: tuple[float, bool] | None = None
+
+    def add(self, now: float, running: bool) -> None:
+        """Take in the compressor state seen by a poll at ``now``."""
+        if self._last is not None:
+            since, was_running = self._last
+            self._extend(since, now, was_running)
+        self._last = (now, running)
+
+        cutoff = now - self.window
+        while self._segments and self._segments[0][0] < cutoff:
+            segment = self._segments[0]
+            start, end, state = segment
+            expired = min(end, cutoff) - start
+            self._total -= expired
+            if state:
+                self._running -= expired
+            if end <= cutoff:
+                self._segments.popleft()
+            else:
+                segment[0] = cutoff
+
+    def _extend(self, start: float, end: float, running: bool) -> None:
+        if self._segments and self._segments[-1][2] == running:
+            self._segments[-1][1] = end
+        else:
+            self._segments.append([start, end, running])
+        self._total += end - start
+        if running:
+            self._running += end - start
+
+    @property
+    def duty_cycle(self) -> float | None:
+        """Return the share of the window the compressor ran, in percent."""
+        if self._total <= 0:
+            return None
+        return round(self._running / self._total * 100, 1)
+
+
+class DerivedMetrics:
+    """Stage computing the derived metrics of every heat pump.
+
+    ``process`` takes in each poll; ``values`` holds the current value of
+    every metric and ``updated`` the metrics whose value the last poll
+    changed. Starts and run times come from the transition logs of the
+    operational statuses, which also tell whether the compressor is short
+    cycling.
+    """
+
+    def __init__(
+        self,
+        window: float = DERIVED_METRICS_WINDOW,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.window = window
+        self._clock = clock
+        self.values: dict[DerivedKey, Any] = {}
+        self.updated: set[DerivedKey] = set()
+        self.compressors: dict[str, CompressorWindow] = {}
+        self.transitions = TransitionRecorder()
+
+    def value(self, heat_pump_id: str, metric: str) -> Any:
+        """Return the value of ``metric`` of a heat pump."""
+        return self.values.get((heat_pump_id, metric))
+
+    def process(self, snapshot: ThermiaSnapshot) -> None:
+        """Update the metrics with the values of a poll."""
+        self.updated = set()
+        now = self._clock()
+        self.transitions.record(now, snapshot)
+        for heat_pump in snapshot.heat_pumps:
+            values = heat_pump.values
+            for metric in DELTA_METRICS:
+                if not heat_pump.fetched(*metric.inputs):
+                    # Keep the last value; the sensor is unavailable
+                    continue
+                first, second = (values.get(attribute) for attribute in metric.inputs)
+                self._set(
+                    (heat_pump.id, metric.key),
+                    round(first - second, 2)
+                    if _numeric(first) and _numeric(second)
+                    else None,
+                )
+
+            statuses = values.get("running_operational_statuses")
+            if statuses is None or not heat_pump.fetched(
+                "running_operational_statuses"
+            ):
+                continue
+            if (compressor := self.compressors.get(heat_pump.id)) is None:
+                compressor = self.compressors[heat_pump.id] = CompressorWindow(
+                    self.window
+                )
+            compressor.add(now, COMPRESSOR_OPERATIONAL_STATUS in statuses)
+            self._set((heat_pump.id, "compressor_duty_cycle"), compressor.duty_cycle)
+
+            log = self.transitions.log(heat_pump.id, COMPRESSOR_OPERATIONAL_STATUS)
+            if log is None:
+                continue
+            since = now - self.window
+            starts = log.starts(since)
+            shortest_run = log.shortest_run(since)
+            self._set((heat_pump.id, "compressor_starts"), starts)
+            self._set(
+                (heat_pump.id, "compressor_shortest_run"),
+                None if shortest_run is None else round(shortest_run / 60, 1),
+            )
+            self._set(
+                (heat_pump.id, SHORT_CYCLING),
+                starts > SHORT_CYCLE_MAX_STARTS_PER_HOUR * self.window / 3600
+                or (
+                    shortest_run is not None
+                    and shortest_run < SHORT_CYCLE_MIN_RUN_TIME
+                ),
+            )
+
+    def _set(self, key: DerivedKey, value: Any) -> None:
+        if key not in self.values or self.values[key] != value:
+            self.values[key] = value
+            self.updated.add(key)
+
+
+@dataclass(frozen=True, slots=True)
+class DerivedWatch(EntityWatch):
+    """Watch the derived metric ``metric`` of ``stage``."""
+
+    metric: str = ""
+    stage: DerivedMetrics | None = field(default=None, compare=False)
+
+    def affected(
+        self,
+        changes: dict[int, frozenset[str]],
+        previous: ThermiaSnapshot,
+        current: ThermiaSnapshot,
+    ) -> bool:
+        """Return True if the metric or availability changed."""
+        changed = changes.get(self.idx, frozenset())
+        if not self.attributes.isdisjoint(changed):
+            previous_pump = previous.heat_pumps[self.idx]
+            current_pump = current.heat_pumps[self.idx]
+            if any(
+                previous_pump.fetched(attribute) != current_pump.fetched(attribute)
+                or attribute in ("is_online", "name")
+                for attribute in self.attributes & changed
+            ):
+                return True
+        return (
+            self.stage is not None
+            and (current.heat_pumps[self.idx].id, self.metric) in self.stage.updated
+        )
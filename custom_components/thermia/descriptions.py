@@ -0,0 +1,292 @@
+"""Entity descriptions of the Thermia sensors and numbers.
+
+Adding a register means adding a row here; the platforms create one entity
+per row and heat pump that reports a value for it.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Generic, Iterator, Sequence, TypeVar
+
+from homeassistant.const import UnitOfPressure, UnitOfTemperature, UnitOfTime
+from homeassistant.helpers.entity import EntityCategory
+
+from .const import (
+    MDI_TEMPERATURE_ICON,
+    MDI_TIMER_COG_OUTLINE_ICON,
+    SENSOR_HEARTBEAT,
+    TEMPERATURE_DEADBAND,
+)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ThermiaSensorDescription:
+    """Description of a sensor reading the heat pump attribute ``key``."""
+
+    key: str
+    name: str
+    icon: str
+    device_class: str | None = None
+    state_class: str = "measurement"
+    unit: str | None = None
+    entity_category: EntityCategory | None = EntityCategory.DIAGNOSTIC
+    is_online_prop: str = "is_online"
+    # Heat pump attribute that has to be truthy for the entity to exist
+    requires: str | None = None
+    # Whether ``key`` has to have a value for the entity to exist
+    requires_value: bool = True
+    # Change, absolute or relative to the shown value, needed to show a new
+    # value, and seconds after which the value is shown anyway
+    deadband: float | None = None
+    relative_deadband: float | None = None
+    max_silence: float | None = None
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ThermiaNumberDescription(ThermiaSensorDescription):
+    """Description of a number writing the register ``register``."""
+
+    register: str
+    entity_category: EntityCategory | None = EntityCategory.CONFIG
+
+    @property
+    def min_prop(self) -> str:
+        """Return the heat pump attribute holding the minimum value."""
+        return f"{self.key}_min"
+
+    @property
+    def max_prop(self) -> str:
+        """Return the heat pump attribute holding the maximum value."""
+        return f"{self.key}_max"
+
+    @property
+    def step_prop(self) -> str:
+        """Return the heat pump attribute holding the step."""
+        return f"{self.key}_step"
+
+
+DescriptionT = TypeVar("DescriptionT", bound=ThermiaSensorDescription)
+
+
+class DescriptionTable(Generic[DescriptionT]):
+    """Descriptions with the attributes they probe laid out column-wise."""
+
+    __slots__ = ("descriptions", "_row", "_plan")
+
+    def __init__(self, descriptions: Sequence[DescriptionT]) -> None:
+        self.descriptions: tuple[DescriptionT, ...] = tuple(descriptions)
+
+        probed = sorted(
+            {
+                attribute
+                for description in self.descriptions
+                for attribute in (description.key, description.requires)
+                if attribute
+            }
+        )
+        column = {attribute: idx for idx, attribute in enumerate(probed)}
+        # Fetches every probed attribute of a heat pump in one call; the extra
+        # trailing column keeps the result a tuple for single attribute tables
+        self._row = itemgetter(*probed, probed[0])
+        self._plan = tuple(
+            (
+                description,
+                column[description.key] if description.requires_value else None,
+                column[description.requires] if description.requires else None,
+            )
+            for description in self.descriptions
+        )
+
+    def __iter__(self) -> Iterator[DescriptionT]:
+        return iter(self.descriptions)
+
+    @property
+    def attributes(self) -> frozenset[str]:
+        """Return every heat pump attribute the descriptions read."""
+        attributes = set()
+        for description in self.descriptions:
+            attributes.update((description.key, description.is_online_prop))
+            if description.requires:
+                attributes.add(description.requires)
+            if isinstance(description, ThermiaNumberDescription):
+                attributes.update(
+                    (description.min_prop, description.max_prop, description.step_prop)
+                )
+        return frozenset(attributes)
+
+    def probe(self, heat_pumps: Sequence) -> list[tuple[int, DescriptionT]]:
+        """Return ``(heat pump index, description)`` for every entity to create.
+
+        The probed attributes of all heat pumps are fetched as rows first and
+        every row is then matched against the table in one pass.
+        """
+        rows = [self._row(heat_pump.values) for heat_pump in heat_pumps]
+        return [
+            (idx, description)
+            for idx, row in enumerate(rows)
+            for description, value, required in self._plan
+            if (value is None or row[value] is not None)
+            and (required is None or row[required])
+        ]
+
+
+def _temperature(key: str, name: str, **kwargs) -> ThermiaSensorDescription:
+    return ThermiaSensorDescription(
+        key=key,
+        name=name,
+        icon=MDI_TEMPERATURE_ICON,
+        device_class="temperature",
+        unit=UnitOfTemperature.CELSIUS,
+        **kwargs,
+    )
+
+
+def _operational_time(key: str, name: str) -> ThermiaSensorDescription:
+    return ThermiaSensorDescription(
+        key=key,
+        name=name,
+        icon=MDI_TIMER_COG_OUTLINE_ICON,
+        state_class="total_increasing",
+        unit=UnitOfTime.HOURS,
+    )
+
+
+def _heat_curve(key: str, name: str) -> ThermiaNumberDescription:
+    return ThermiaNumberDescription(
+        key=f"HC_{key}",
+        register=key,
+        name=name,
+        icon=MDI_TEMPERATURE_ICON,
+        device_class="temperature",
+        unit=UnitOfTemperature.CELSIUS,
+        requires="HC_REG_HEATING_HEAT_CURVE",
+        requires_value=False,
+    )
+
+
+SENSOR_DESCRIPTIONS: DescriptionTable[ThermiaSensorDescription] = DescriptionTable(
+    (
+        _temperature(
+            "heat_temperature", "Heat Target Temperature", requires="heat_temperature"
+        ),
+        _temperature(
+            "outdoor_temperature",
+            "Outdoor Temperature",
+            requires="is_outdoor_temp_sensor_functioning",
+        ),
+        _temperature(
+            "indoor_temperature",
+            "Indoor Temperature",
+            requires="has_indoor_temp_sensor",
+        ),
+        _temperature(
+            "hot_water_temperature",
+            "Hot Water Temperature",
+            requires="is_hot_water_active",
+        ),
+        _temperature(
+            "lower_hot_water_temperature",
+            "Lower Hot Water temp ",
+            deadband=TEMPERATURE_DEADBAND,
+            max_silence=SENSOR_HEARTBEAT,
+        ),
+        _temperature(
+            "weighted_hot_water_temperature",
+            "Weighted Hot Water Temp",
+            deadband=TEMPERATURE_DEADBAND,
+            max_silence=SENSOR_HEARTBEAT,
+        ),
+        # Other temperature sensors
+        _temperature("supply_line_temperature", "Supply Line Temperature"),
+        _temperature(
+            "desired_supply_line_temperature", "Desired Supply Line Temperature"
+        ),
+        _temperature("return_line_temperature", "Return Line Temperature"),
+        _temperature("brine_out_temperature", "Brine Out Temperature"),
+        _temperature("brine_in_temperature", "Brine In Temperature"),
+        _temperature("cooling_tank_temperature", "Cooling Tank Temperature"),
+        _temperature(
+            "cooling_supply_line_temperature", "Cooling Supply Line Temperature"
+        ),
+        _temperature("buffer_tank_temperature", "Buffer Tank Temperature"),
+        _temperature("pool_temperature", "Pool Temperature"),
+        _temperature("start_hot_water_temperature", "Start Hot Water Temperature"),
+        # Operational status
+        ThermiaSensorDescription(
+            key="operational_status_integral",
+            name="Integral",
+            icon="mdi:math-integral",
+        ),
+        ThermiaSensorDescription(
+            key="operational_status_pid",
+            name="PID",
+            icon="mdi:math-integral-box",
+        ),
+        # Operational time
+        _operational_time("compressor_operational_time", "Compressor Operational Time"),
+        _operational_time("heating_operational_time", "Heating Operational Time"),
+        _operational_time("hot_water_operational_time", "Hot Water Operational Time"),
+        _operational_time(
+            "auxiliary_heater_1_operational_time",
+            "Auxiliary Heater 1 Operational Time",
+        ),
+        _operational_time(
+            "auxiliary_heater_2_operational_time",
+            "Auxiliary Heater 2 Operational Time",
+        ),
+        _operational_time(
+            "auxiliary_heater_3_operational_time",
+            "Auxiliary Heater 3 Operational Time",
+        ),
+        # Refrigerant circuit
+        ThermiaSensorDescription(
+            key="evaporator_pressure",
+            name="Evaporator Pressure",
+            icon=MDI_TIMER_COG_OUTLINE_ICON,
+            unit=UnitOfPressure.BAR,
+            relative_deadband=0.02,
+            max_silence=SENSOR_HEARTBEAT,
+        ),
+        ThermiaSensorDescription(
+            key="suction_temp",
+            name="Suction Temp",
+            icon=MDI_TIMER_COG_OUTLINE_ICON,
+            unit=UnitOfTemperature.CELSIUS,
+            deadband=TEMPERATURE_DEADBAND,
+            max_silence=SENSOR_HEARTBEAT,
+        ),
+        ThermiaSensorDescription(
+            key="evaporator_temp",
+            name="Evaporator temp",
+            icon=MDI_TIMER_COG_OUTLINE_ICON,
+            unit=UnitOfTemperature.CELSIUS,
+            deadband=TEMPERATURE_DEADBAND,
+            max_silence=SENSOR_HEARTBEAT,
+        ),
+        ThermiaSensorDescription(
+            key="super_heat",
+            name="Super Heat",
+            icon=MDI_TIMER_COG_OUTLINE_ICON,
+            unit=UnitOfTemperature.CELSIUS,
+            deadband=TEMPERATURE_DEADBAND,
+            max_silence=SENSOR_HEARTBEAT,
+        ),
+        ThermiaSensorDescription(
+            key="opening_degree",
+            name="Opening degree",
+            icon=MDI_TIMER_COG_OUTLINE_ICON,
+        ),
+    )
+)
+
+NUMBER_DESCRIPTIONS: DescriptionTable[ThermiaNumberDescription] = DescriptionTable(
+    (
+        _heat_curve("REG_HEATING_HEAT_CURVE", "HEATING HEAT CURVE"),
+        _heat_curve("REG_HEATING_HEAT_CURVE_MIN", "HEATING Supply line miniumm"),
+        _heat_curve("REG_HEATING_HEAT_CURVE_MAX", "HEATING Supply line max. "),
+        _heat_curve("REG_HEATING_HEAT_STOP", "HEATING Heat Stop"),
+        _heat_curve("REG_HEATING_ROOM_FACTOR", "HEATING Room Factor"),
+    )
+)
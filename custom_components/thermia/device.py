@@ -0,0 +1,83 @@
+"""Per heat pump metadata shared by all entities of the heat pump."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from .const import DOMAIN
+from .snapshot import HeatPumpSnapshot
+
+
+@dataclass(frozen=True, slots=True)
+class HeatPumpDescriptor:
+    """Device info and entity names of one heat pump.
+
+    Built once per heat pump and only replaced when its metadata changes, so
+    entity properties read cached values instead of formatting them again on
+    every state write.
+    """
+
+    id: str
+    name: str | None
+    model: str | None
+    model_id: str | None
+    device_info: dict[str, Any] = field(init=False, compare=False, repr=False)
+    _entity_names: dict[str, tuple[str, str]] = field(
+        init=False, default_factory=dict, compare=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "device_info",
+            {
+                "identifiers": {(DOMAIN, self.id)},
+                "name": self.name,
+                "manufacturer": "Thermia",
+                "model": self.model,
+                "model_id": self.model_id,
+            },
+        )
+
+    @classmethod
+    def from_snapshot(cls, heat_pump: HeatPumpSnapshot) -> HeatPumpDescriptor:
+        """Create the descriptor of a heat pump snapshot."""
+        return cls(heat_pump.id, heat_pump.name, heat_pump.model, heat_pump.model_id)
+
+    def entity_name(self, entity_name: str) -> str:
+        """Return the name of the heat pump entity called ``entity_name``."""
+        return self._entity_names_for(entity_name)[0]
+
+    def entity_unique_id(self, entity_name: str) -> str:
+        """Return the unique ID of the heat pump entity called ``entity_name``."""
+        return self._entity_names_for(entity_name)[1]
+
+    def _entity_names_for(self, entity_name: str) -> tuple[str, str]:
+        try:
+            return self._entity_names[entity_name]
+        except KeyError:
+            names = (
+                f"{self.name} {entity_name}",
+                f"{self.name}_{entity_name.lower().replace(' ', '_')}",
+            )
+            self._entity_names[entity_name] = names
+            return names
+
+
+def refresh_descriptors(
+    descriptors: tuple[HeatPumpDescriptor, ...],
+    heat_pumps: tuple[HeatPumpSnapshot, ...],
+) -> tuple[HeatPumpDescriptor, ...]:
+    """Return descriptors for ``heat_pumps``, reusing unchanged ones."""
+    refreshed = tuple(
+        HeatPumpDescriptor.from_snapshot(heat_pump) for heat_pump in heat_pumps
+    )
+    if refreshed == descriptors:
+        return descriptors
+    return tuple(
+        descriptors[idx]
+        if idx < len(descriptors) and descriptors[idx] == descriptor
+        else descriptor
+        for idx, descriptor in enumerate(refreshed)
+    )
@@ -0,0 +1,83 @@
+"""Diagnostics support for Thermia."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .client import source_name
+from .const import CONF_PASSWORD, CONF_USERNAME, DOMAIN
+from .coordinator import ThermiaDataUpdateCoordinator
+
+TO_REDACT = {CONF_USERNAME, CONF_PASSWORD}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry.
+
+    Holds the timing histograms of every poll phase of the client (login,
+    every endpoint and register group, JSON decoding, parsing) and of the
+    coordinator (snapshot, diff, dispatch), with the requests and bytes per
+    poll. Credentials are redacted.
+    """
+    coordinator: ThermiaDataUpdateCoordinator = hass.data[DOMAIN][
+        config_entry.entry_id
+    ]
+    client = coordinator.client
+    return {
+        "entry": {
+            "data": async_redact_data(config_entry.data, TO_REDACT),
+            "options": dict(config_entry.options),
+        },
+        "client": {
+            "native": client.native,
+            "calls": client.calls,
+            "executor_calls": client.executor_calls,
+            "failures": {
+                heat_pump_id: repr(error)
+                for heat_pump_id, error in client.failures.items()
+            },
+            "sources": {
+                " ".join((source_name(key), *key[1:2])): {
+                    "ok": status.ok,
+                    "last_success": status.last_success,
+                    "error": status.error,
+                    "failures": status.failures,
+                }
+                for key, status in client.cache.statuses()
+            },
+            "metrics": client.metrics.as_dict(),
+        },
+        "coordinator": {
+            "update_interval": coordinator.update_interval.total_seconds()
+            if coordinator.update_interval
+            else None,
+            "state_writes": coordinator.state_writes,
+            "suppressed_writes": coordinator.suppressed_writes,
+            "metrics": coordinator.metrics.as_dict(),
+        },
+        "aggregation": _aggregation(coordinator),
+    }
+
+
+def _aggregation(coordinator: ThermiaDataUpdateCoordinator) -> dict[str, Any]:
+    """Return what the aggregation stage published and held back per sensor."""
+    stage = coordinator.aggregation
+    return {
+        "mode": stage.mode,
+        "sensors": {
+            f"{heat_pump_id}.{attribute}": {
+                "published": published.value,
+                "suppressed": stage.suppressed.get((heat_pump_id, attribute), 0),
+                "heartbeats": stage.heartbeats.get((heat_pump_id, attribute), 0),
+            }
+            for (heat_pump_id, attribute), published in sorted(
+                stage.published.items()
+            )
+        },
+    }
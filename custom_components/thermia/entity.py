@@ -0,0 +1,27 @@
+"""Base entity of the Thermia integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import ATTR_STALE
+from .coordinator import ThermiaDataUpdateCoordinator
+
+
+class ThermiaEntity(CoordinatorEntity[ThermiaDataUpdateCoordinator]):
+    """Entity backed by the snapshots of a Thermia coordinator."""
+
+    idx: int
+
+    def _fetched(self, *attributes: str) -> bool:
+        """Return True if the last poll fetched ``attributes`` of the heat pump."""
+        return self.coordinator.data.heat_pumps[self.idx].fetched(*attributes)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Flag values restored from storage that no poll has confirmed yet."""
+        if self.coordinator.data.stale:
+            return {ATTR_STALE: True}
+        return None
@@ -0,0 +1,107 @@
+"""Clients and poll phases shared by all Thermia config entries."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import logging
+
+from homeassistant.core import HomeAssistant, callback
+
+from .auth import async_get_token_store
+from .client import ThermiaClient
+from .const import (
+    DEFAULT_PARALLEL_FETCHES,
+    DEFAULT_REQUEST_TIMEOUT,
+    DOMAIN,
+    MAX_CONCURRENT_REQUESTS,
+    POLL_INTERVAL_FAST,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_HUB = f"{DOMAIN}_hub"
+
+# Fractional part of the golden ratio; consecutive multiples of it spread any
+# number of entries evenly over the poll interval without knowing the total.
+_PHASE_STEP = 0.6180339887498949
+
+
+@dataclass(slots=True)
+class _SharedClient:
+    client: ThermiaClient
+    users: int = 0
+
+
+class ThermiaHub:
+    """Registry of the clients of every config entry.
+
+    Entries logging in with the same credentials share one client, so they
+    share the login, the tokens, the worker pool, the response cache and each
+    other's polls. All clients send their requests through one HTTP pool and
+    one limit of concurrent requests, and every entry gets its own poll phase
+    so entries set up together do not poll in lockstep.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self.limiter = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self._clients: dict[tuple[str, str], _SharedClient] = {}
+        self._phases: int = 0
+
+    @callback
+    def async_acquire(
+        self,
+        username: str,
+        password: str,
+        max_parallel_fetches: int = DEFAULT_PARALLEL_FETCHES,
+        request_timeout: float = DEFAULT_REQUEST_TIMEOUT,
+    ) -> ThermiaClient:
+        """Return the client for the credentials, creating it if needed.
+
+        A shared client keeps the fetch settings of the entry that created it.
+        """
+        key = (username, password)
+        if (shared := self._clients.get(key)) is None:
+            shared = self._clients[key] = _SharedClient(
+                ThermiaClient(
+                    self.hass,
+                    username,
+                    password,
+                    tokens=async_get_token_store(self.hass),
+                    limiter=self.limiter,
+                    max_parallel_fetches=max_parallel_fetches,
+                    request_timeout=request_timeout,
+                )
+            )
+        else:
+            _LOGGER.debug("Sharing the Thermia Online client of %s", username)
+        shared.users += 1
+        return shared.client
+
+    @callback
+    def async_release(self, client: ThermiaClient) -> None:
+        """Release a client returned by ``async_acquire``; the last user
+        closes it."""
+        for key, shared in list(self._clients.items()):
+            if shared.client is not client:
+                continue
+            shared.users -= 1
+            if shared.users <= 0:
+                del self._clients[key]
+                client.close()
+            return
+
+    @callback
+    def async_next_phase(self, interval: float = POLL_INTERVAL_FAST) -> float:
+        """Return the poll phase offset, in seconds, for the next entry."""
+        self._phases += 1
+        return (self._phases * _PHASE_STEP) % 1 * interval
+
+
+@callback
+def async_get_hub(hass: HomeAssistant) -> ThermiaHub:
+    """Return the hub shared by all config entries."""
+    if (hub := hass.data.get(DATA_HUB)) is None:
+        hub = hass.data[DATA_HUB] = ThermiaHub(hass)
+    return hub
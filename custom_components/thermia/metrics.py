@@ -0,0 +1,147 @@
+"""Timing histograms and transfer counters of the poll hot path."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Iterator
+from contextlib import contextmanager
+import time
+from typing import Any, Callable
+
+# Upper bounds of the histogram buckets, in seconds; slower observations go
+# to an extra overflow bucket
+HISTOGRAM_BOUNDS = (
+    0.001,
+    0.002,
+    0.005,
+    0.01,
+    0.02,
+    0.05,
+    0.1,
+    0.2,
+    0.5,
+    1.0,
+    2.0,
+    5.0,
+    10.0,
+    30.0,
+)
+
+
+class Histogram:
+    """Durations of one phase, counted in fixed exponential buckets."""
+
+    __slots__ = ("counts", "count", "total", "maximum", "last")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(HISTOGRAM_BOUNDS) + 1)
+        self.count: int = 0
+        self.total: float = 0.0
+        self.maximum: float = 0.0
+        self.last: float = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Count one duration."""
+        self.counts[bisect_left(HISTOGRAM_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.maximum = max(self.maximum, seconds)
+        self.last = seconds
+
+    def percentile(self, percent: float) -> float:
+        """Return the upper bound of the bucket holding the ``percent``-th
+        percentile; the overflow bucket reports the maximum."""
+        rank = percent / 100 * self.count
+        seen = 0
+        for bound, count in zip(HISTOGRAM_BOUNDS, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.maximum)
+        return self.maximum
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram as JSON serializable data, in milliseconds."""
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count * 1000, 3) if self.count else 0,
+            "p50_ms": round(self.percentile(50) * 1000, 3),
+            "p95_ms": round(self.percentile(95) * 1000, 3),
+            "max_ms": round(self.maximum * 1000, 3),
+            "last_ms": round(self.last * 1000, 3),
+            "buckets": {
+                f"le_{bound * 1000:g}ms": count
+                for bound, count in zip(HISTOGRAM_BOUNDS, self.counts)
+                if count
+            }
+            | ({"overflow": self.counts[-1]} if self.counts[-1] else {}),
+        }
+
+
+class PollMetrics:
+    """Histograms of the phases of a poll and the traffic of each poll.
+
+    A phase is timed with ``time``, a request is counted with ``request``
+    and ``end_cycle`` closes the counts of a poll.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self._clock = clock
+        self.histograms: dict[str, Histogram] = {}
+        self.cycles: int = 0
+        self.calls: int = 0
+        self.bytes: int = 0
+        self.cycle_calls: int = 0
+        self.cycle_bytes: int = 0
+        self.last_cycle_calls: int = 0
+        self.last_cycle_bytes: int = 0
+
+    def observe(self, phase: str, seconds: float) -> None:
+        """Count a duration of ``phase``."""
+        if (histogram := self.histograms.get(phase)) is None:
+            histogram = self.histograms[phase] = Histogram()
+        histogram.observe(seconds)
+
+    @contextmanager
+    def time(self, phase: str) -> Iterator[None]:
+        """Time the body of the ``with`` statement as ``phase``."""
+        start = self._clock()
+        try:
+            yield
+        finally:
+            self.observe(phase, self._clock() - start)
+
+    def request(self, nbytes: int) -> None:
+        """Count a request whose response had ``nbytes`` bytes."""
+        self.calls += 1
+        self.bytes += nbytes
+        self.cycle_calls += 1
+        self.cycle_bytes += nbytes
+
+    def end_cycle(self) -> None:
+        """Close the request counts of a poll."""
+        self.cycles += 1
+        self.last_cycle_calls, self.cycle_calls = self.cycle_calls, 0
+        self.last_cycle_bytes, self.cycle_bytes = self.cycle_bytes, 0
+
+    def last(self, phase: str) -> float | None:
+        """Return the last duration of ``phase``, in seconds."""
+        histogram = self.histograms.get(phase)
+        return None if histogram is None else histogram.last
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics as JSON serializable data."""
+        return {
+            "cycles": self.cycles,
+            "calls": self.calls,
+            "bytes": self.bytes,
+            "calls_per_cycle": round(self.calls / self.cycles, 2)
+            if self.cycles
+            else None,
+            "bytes_per_cycle": round(self.bytes / self.cycles) if self.cycles else None,
+            "last_cycle_calls": self.last_cycle_calls,
+            "last_cycle_bytes": self.last_cycle_bytes,
+            "phases": {
+                phase: histogram.as_dict()
+                for phase, histogram in sorted(self.histograms.items())
+            },
+        }
@@ -2,25 +2,16 @@
 
 from __future__ import annotations
 
-import logging
-
-from homeassistant.components.number import NumberEntity
-from homeassistant.const import UnitOfTemperature, UnitOfTime, UnitOfPressure 
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .const import DOMAIN
 from .coordinator import ThermiaDataUpdateCoordinator
+from .descriptions import NUMBER_DESCRIPTIONS
 from .numbers.generic_number import ThermiaGenericNumber
 
 
-from .const import (
-    DOMAIN,
-    MDI_TEMPERATURE_ICON,
-    MDI_TIMER_COG_OUTLINE_ICON,
-)
-
-
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -30,115 +21,24 @@ async def async_setup_entry(
 
     coordinator: ThermiaDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
-    hass_thermia_numbers = []
-
-    _LOGGER = logging.getLogger(__name__)
-    _LOGGER.debug("Number starting ")
-    
-    for idx, heat_pump in enumerate(coordinator.data.heat_pumps):
-        _LOGGER.debug("Start loop")
-        if heat_pump.HC_REG_HEATING_HEAT_CURVE:
-            _LOGGER.debug("inside heat curve")
-            hass_thermia_numbers.append(
-                ThermiaGenericNumber(
-                    coordinator,
-                    idx,
-                    "is_online",
-                    "HEATING HEAT CURVE",
-                    MDI_TEMPERATURE_ICON,
-                    EntityCategory.CONFIG,
-                    "temperature",
-                    "measurement",
-                    "HC_REG_HEATING_HEAT_CURVE",
-                    "REG_HEATING_HEAT_CURVE",
-                    UnitOfTemperature.CELSIUS,
-                    "HC_REG_HEATING_HEAT_CURVE_max",
-                    "HC_REG_HEATING_HEAT_CURVE_min",
-                    "HC_REG_HEATING_HEAT_CURVE_step",                   
-                )
-            )
-        if heat_pump.HC_REG_HEATING_HEAT_CURVE:
-            _LOGGER.debug("inside heat curve")
-            hass_thermia_numbers.append(
-                ThermiaGenericNumber(
-                    coordinator,
-                    idx,
-                    "is_online",
-                    "HEATING Supply line miniumm",
-                    MDI_TEMPERATURE_ICON,
-                    EntityCategory.CONFIG,
-                    "temperature",
-                    "measurement",
-                    "HC_REG_HEATING_HEAT_CURVE_MIN",
-                    "REG_HEATING_HEAT_CURVE_MIN",
-                    UnitOfTemperature.CELSIUS,
-                    "HC_REG_HEATING_HEAT_CURVE_MIN_max",
-                    "HC_REG_HEATING_HEAT_CURVE_MIN_min",
-                    "HC_REG_HEATING_HEAT_CURVE_MIN_step",
-                )
-            )
-        if heat_pump.HC_REG_HEATING_HEAT_CURVE:
-            _LOGGER.debug("inside heat curve")
-            hass_thermia_numbers.append(
-                ThermiaGenericNumber(
-                    coordinator,
-                    idx,
-                    "is_online",
-                    "HEATING Supply line max. ",
-                    MDI_TEMPERATURE_ICON,
-                    EntityCategory.CONFIG,
-                    "temperature",
-                    "measurement",
-                    "HC_REG_HEATING_HEAT_CURVE_MAX",
-                    "REG_HEATING_HEAT_CURVE_MAX",
-                    UnitOfTemperature.CELSIUS,
-                    "HC_REG_HEATING_HEAT_CURVE_MAX_max",
-                    "HC_REG_HEATING_HEAT_CURVE_MAX_min",
-                    "HC_REG_HEATING_HEAT_CURVE_MAX_step",
-                )
-            ) 
-        if heat_pump.HC_REG_HEATING_HEAT_CURVE:
-            _LOGGER.debug("inside heat curve")
-            hass_thermia_numbers.append(
-                ThermiaGenericNumber(
-                    coordinator,
-                    idx,
-                    "is_online",
-                    "HEATING Heat Stop",
-                    MDI_TEMPERATURE_ICON,
-                    EntityCategory.CONFIG,
-                    "temperature",
-                    "measurement",
-                    "HC_REG_HEATING_HEAT_STOP",
-                    "REG_HEATING_HEAT_STOP",
-                    UnitOfTemperature.CELSIUS,
-                    "HC_REG_HEATING_HEAT_STOP_max",
-                    "HC_REG_HEATING_HEAT_STOP_min",
-                    "HC_REG_HEATING_HEAT_STOP_step",
-                )
-            )
-        if heat_pump.HC_REG_HEATING_HEAT_CURVE:
-            _LOGGER.debug("inside heat curve")
-            hass_thermia_numbers.append(
-                ThermiaGenericNumber(
-                    coordinator,
-                    idx,
-                    "is_online",
-                    "HEATING Room Factor",
-                    MDI_TEMPERATURE_ICON,
-                    EntityCategory.CONFIG,
-                    "temperature",
-                    "measurement",
-                    "HC_REG_HEATING_ROOM_FACTOR",
-                    "REG_HEATING_ROOM_FACTOR",
-                    UnitOfTemperature.CELSIUS,
-                    "HC_REG_HEATING_ROOM_FACTOR_max",
-                    "HC_REG_HEATING_ROOM_FACTOR_min",
-                    "HC_REG_HEATING_ROOM_FACTOR_step",
-                )
-            )
-
-
-
+    hass_thermia_numbers = [
+        ThermiaGenericNumber(
+            coordinator,
+            idx,
+            description.is_online_prop,
+            description.name,
+            description.icon,
+            description.entity_category,
+            description.device_class,
+            description.state_class,
+            description.key,
+            description.register,
+            description.unit,
+            description.max_prop,
+            description.min_prop,
+            description.step_prop,
+        )
+        for idx, description in NUMBER_DESCRIPTIONS.probe(coordinator.data.heat_pumps)
+    ]
 
     async_add_entities(hass_thermia_numbers)
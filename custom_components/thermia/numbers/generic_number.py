@@ -1,22 +1,22 @@
 
 from __future__ import annotations
 
+from functools import partial
+
 from homeassistant.components.number import NumberEntity, NumberDeviceClass
 from homeassistant.const import UnitOfTemperature
 from homeassistant.helpers.entity import EntityCategory
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 import logging
 
-from ..const import DOMAIN
 from ThermiaOnlineAPI.const import REG_GROUP_HEATING_CURVE
 from ..coordinator import ThermiaDataUpdateCoordinator
+from ..entity import ThermiaEntity
+from ..snapshot import EntityWatch
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class ThermiaGenericNumber(
-    CoordinatorEntity[ThermiaDataUpdateCoordinator], NumberEntity
-):
+class ThermiaGenericNumber(ThermiaEntity, NumberEntity):
     """Represents a generic number entity for Home Assistant."""
 
     _attr_has_entity_name = True
@@ -41,7 +41,13 @@ class ThermiaGenericNumber(
         """
         Initializes a new GenericNumberEntity.
         """
-        super().__init__(coordinator)
+        watched = {is_online_prop, value_prop, "name"}
+        watched.update(
+            prop
+            for prop in (native_max_value, native_min_value, native_step)
+            if isinstance(prop, str)
+        )
+        super().__init__(coordinator, EntityWatch(idx, frozenset(watched)))
         self.idx: int = idx
 
         self._is_online_prop: str = is_online_prop
@@ -61,17 +67,19 @@ class ThermiaGenericNumber(
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return getattr(self.coordinator.data.heat_pumps[self.idx], self._is_online_prop)
+        return self._fetched(self._value_prop) and getattr(
+            self.coordinator.data.heat_pumps[self.idx], self._is_online_prop
+        )
 
     @property
     def name(self) -> str:
         """Return the name of the number."""
-        return f"{self.coordinator.data.heat_pumps[self.idx].name} {self._number_name}"
+        return self.coordinator.descriptors[self.idx].entity_name(self._number_name)
 
     @property
     def unique_id(self) -> str:
         """Return the unique ID of the number."""
-        return f"{self.coordinator.data.heat_pumps[self.idx].name}_{self._number_name.lower().replace(' ', '_')}"
+        return self.coordinator.descriptors[self.idx].entity_unique_id(self._number_name)
 
     @property
     def icon(self) -> str | None:
@@ -81,13 +89,7 @@ class ThermiaGenericNumber(
     @property
     def device_info(self) -> dict:
         """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.data.heat_pumps[self.idx].id)},
-            "name": self.coordinator.data.heat_pumps[self.idx].name,
-            "manufacturer": "Thermia",
-            "model": self.coordinator.data.heat_pumps[self.idx].model,
-            "model_id": self.coordinator.data.heat_pumps[self.idx].model_id,
-        }
+        return self.coordinator.descriptors[self.idx].device_info
 
     @property
     def entity_category(self) -> EntityCategory | None:
@@ -129,12 +131,18 @@ class ThermiaGenericNumber(
         _LOGGER.debug("Setting new setting: %s for %s", value, self._number_name)
         _LOGGER.debug("Index: %s", self.idx)
 
-        await self.hass.async_add_executor_job(
-            lambda: self.coordinator.data.heat_pumps[
-                self.idx
-            ].set_register_data_by_register_group_and_name(
-                REG_GROUP_HEATING_CURVE, self._reg_name, value
-            )
+        # Reject out of range values before they are queued
+        value = self.coordinator.client.validate_register(
+            self.idx, (REG_GROUP_HEATING_CURVE, self._reg_name), value
+        )
+        await self.coordinator.writes.async_write(
+            (self.idx, self._reg_name),
+            partial(
+                self.coordinator.client.async_set_register,
+                self.idx,
+                REG_GROUP_HEATING_CURVE,
+                self._reg_name,
+                value,
+            ),
         )
-        await self.coordinator.async_request_refresh()
 
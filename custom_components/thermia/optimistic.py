@@ -0,0 +1,124 @@
+"""Optimistic values of writes that no poll has confirmed yet."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+import time
+from typing import Any, Callable, Hashable
+
+from .const import WRITE_CONFIRM_WINDOW
+from .snapshot import ThermiaSnapshot
+
+_LOGGER = logging.getLogger(__name__)
+
+PendingKey = tuple[int, str]
+
+
+@dataclass(slots=True)
+class PendingWrite:
+    """A value written to a heat pump attribute, shown until ``deadline``.
+
+    ``interim`` holds the value the attribute had before the write and every
+    value written since, so a poll that still shows one of them is not taken
+    for a conflicting change.
+    """
+
+    value: Hashable
+    interim: set[Hashable]
+    deadline: float
+
+
+class OptimisticState:
+    """Values entities show right after a write, reconciled on every poll.
+
+    A write sets the new value of a snapshot attribute at once. The next poll
+    that reports it confirms the write. A poll reporting a value the write
+    never knew about is a conflicting change made elsewhere, and no poll
+    reporting the value within ``timeout`` seconds reverts the write; both
+    show the polled value again and are logged and counted.
+    """
+
+    def __init__(
+        self,
+        timeout: float = WRITE_CONFIRM_WINDOW,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.timeout = timeout
+        self._clock = clock
+        self.pending: dict[PendingKey, PendingWrite] = {}
+        self.confirmed: int = 0
+        self.reverted: int = 0
+        self.conflicts: int = 0
+
+    def value(self, idx: int, attribute: str, polled: Any) -> Any:
+        """Return the value to show for ``attribute`` of heat pump ``idx``."""
+        if not self.pending:
+            return polled
+        pending = self.pending.get((idx, attribute))
+        return polled if pending is None else pending.value
+
+    def expect(self, idx: int, attribute: str, value: Any, polled: Any) -> None:
+        """Show ``value`` until a poll confirms it; ``polled`` is the current
+        value."""
+        key = (idx, attribute)
+        deadline = self._clock() + self.timeout
+        if (pending := self.pending.get(key)) is not None:
+            pending.interim.add(pending.value)
+            pending.value = value
+            pending.deadline = deadline
+        else:
+            self.pending[key] = PendingWrite(value, {polled}, deadline)
+
+    def discard(self, idx: int, attribute: str) -> None:
+        """Drop the value of a write that failed."""
+        self.pending.pop((idx, attribute), None)
+
+    def reconcile(self, snapshot: ThermiaSnapshot) -> set[PendingKey]:
+        """Settle the pending writes against a fresh ``snapshot``.
+
+        Returns the attributes whose shown value falls back to the polled one
+        although the poll itself may not have changed it.
+        """
+        if not self.pending:
+            return set()
+
+        now = self._clock()
+        settled: set[PendingKey] = set()
+        for key, pending in list(self.pending.items()):
+            idx, attribute = key
+            if idx >= len(snapshot.heat_pumps):
+                del self.pending[key]
+                settled.add(key)
+                continue
+
+            polled = snapshot.heat_pumps[idx].values.get(attribute)
+            if polled == pending.value:
+                self.confirmed += 1
+            elif polled not in pending.interim:
+                self.conflicts += 1
+                _LOGGER.info(
+                    "%s of heat pump %s changed to %s while writing %s",
+                    attribute,
+                    idx,
+                    polled,
+                    pending.value,
+                )
+                settled.add(key)
+            elif now >= pending.deadline:
+                self.reverted += 1
+                _LOGGER.warning(
+                    "Write of %s to %s of heat pump %s was not confirmed "
+                    "within %s seconds, showing %s again",
+                    pending.value,
+                    attribute,
+                    idx,
+                    self.timeout,
+                    polled,
+                )
+                settled.add(key)
+            else:
+                continue
+            del self.pending[key]
+
+        return settled
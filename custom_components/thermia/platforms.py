@@ -0,0 +1,52 @@
+"""Entity platforms a Thermia account needs."""
+
+from __future__ import annotations
+
+from typing import Callable
+
+from homeassistant.const import Platform
+
+from .descriptions import NUMBER_DESCRIPTIONS
+from .snapshot import HeatPumpSnapshot, ThermiaSnapshot
+
+
+def _has_status_binary_sensors(heat_pump: HeatPumpSnapshot) -> bool:
+    return bool(
+        heat_pump.available_operational_statuses
+        and heat_pump.running_operational_statuses is not None
+    ) or bool(
+        heat_pump.available_power_statuses
+        and heat_pump.running_power_statuses is not None
+    )
+
+
+def _has_switches(heat_pump: HeatPumpSnapshot) -> bool:
+    return (
+        heat_pump.hot_water_switch_state is not None
+        or heat_pump.hot_water_boost_switch_state is not None
+    )
+
+
+def _has_numbers(heat_pump: HeatPumpSnapshot) -> bool:
+    return bool(NUMBER_DESCRIPTIONS.probe((heat_pump,)))
+
+
+# Whether a platform creates at least one entity for a heat pump. Mirrors the
+# checks in the platforms' async_setup_entry without importing them.
+PLATFORM_PROBES: dict[str, Callable[[HeatPumpSnapshot], bool]] = {
+    Platform.BINARY_SENSOR: _has_status_binary_sensors,
+    # Every heat pump has an active alarms sensor and both water heaters
+    Platform.SENSOR: lambda heat_pump: True,
+    Platform.SWITCH: _has_switches,
+    Platform.WATER_HEATER: lambda heat_pump: True,
+    Platform.NUMBER: _has_numbers,
+}
+
+
+def required_platforms(snapshot: ThermiaSnapshot) -> list[str]:
+    """Return the platforms that have entities for ``snapshot``."""
+    return [
+        platform
+        for platform, probe in PLATFORM_PROBES.items()
+        if any(probe(heat_pump) for heat_pump in snapshot.heat_pumps)
+    ]
@@ -0,0 +1,143 @@
+"""Register writes by register group and name, and the limits they obey."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import math
+from typing import Any, Mapping
+
+from homeassistant.exceptions import ServiceValidationError
+
+# Register group and register name
+RegisterKey = tuple[str, str]
+
+# Allowed rounding error when checking a value against the register step
+STEP_TOLERANCE = 1e-6
+
+
+def register_key(name: str, default_group: str) -> RegisterKey:
+    """Return the key of ``GROUP/NAME``, or of ``NAME`` in ``default_group``."""
+    group, _, register_name = name.rpartition("/")
+    return (group or default_group, register_name)
+
+
+@dataclass(frozen=True, slots=True)
+class RegisterConstraint:
+    """Limits of one register, as the Thermia Online API enforces them."""
+
+    name: str
+    minimum: float | None = None
+    maximum: float | None = None
+    step: float | None = None
+    read_only: bool = False
+
+    @classmethod
+    def from_register(cls, register: Mapping[str, Any]) -> RegisterConstraint:
+        """Return the limits of an entry of a register group response."""
+        return cls(
+            name=register["registerName"],
+            minimum=register.get("minValue"),
+            maximum=register.get("maxValue"),
+            step=register.get("step") or None,
+            read_only=bool(register.get("isReadOnly")),
+        )
+
+    def problem(self, value: float) -> str | None:
+        """Return why ``value`` cannot be written, if it cannot."""
+        if self.read_only:
+            return "register is read only"
+        if not math.isfinite(value):
+            return f"{value} is not a number"
+        if self.minimum is not None and value < self.minimum:
+            return f"{value} is below the minimum of {self.minimum}"
+        if self.maximum is not None and value > self.maximum:
+            return f"{value} is above the maximum of {self.maximum}"
+        return None
+
+    def snap(self, value: float) -> float:
+        """Return ``value`` rounded to the nearest step within the limits."""
+        if self.step is None:
+            return value
+        base = self.minimum or 0
+        steps = round((value - base) / self.step)
+        snapped = base + steps * self.step
+        if self.maximum is not None and snapped > self.maximum + STEP_TOLERANCE:
+            snapped -= self.step
+        # Drop the float noise of the multiplication
+        return round(snapped, 9)
+
+    def validate(self, value: float) -> float:
+        """Return ``value`` snapped to the register step.
+
+        Raises ServiceValidationError if the register cannot take it.
+        """
+        if (problem := self.problem(value)) is not None:
+            raise ServiceValidationError(f"Cannot set {self.name}: {problem}")
+        return self.snap(value)
+
+
+class RegisterConstraints:
+    """Limits of the registers of every heat pump of an account.
+
+    Indexed by group and name and by register ID, so a write is checked
+    without a request. A register group is only indexed again once its
+    response was fetched again.
+    """
+
+    def __init__(self) -> None:
+        self._by_key: dict[str, dict[RegisterKey, RegisterConstraint]] = {}
+        self._by_id: dict[str, dict[int, RegisterConstraint]] = {}
+        self._indexed: dict[tuple[str, str], list | None] = {}
+
+    def index(self, heat_pump_id: str, group: str, registers: list | None) -> None:
+        """Index the registers of a register group response."""
+        if self._indexed.get((heat_pump_id, group), ()) is registers:
+            return
+        self._indexed[(heat_pump_id, group)] = registers
+        by_key = self._by_key.setdefault(heat_pump_id, {})
+        by_id = self._by_id.setdefault(heat_pump_id, {})
+        for register in registers or []:
+            if register.get("registerName") is None:
+                continue
+            constraint = RegisterConstraint.from_register(register)
+            by_key[(group, constraint.name)] = constraint
+            if (register_id := register.get("registerId")) is not None:
+                by_id[register_id] = constraint
+
+    def get(
+        self, heat_pump_id: str, register: RegisterKey | int
+    ) -> RegisterConstraint | None:
+        """Return the limits of a register, by group and name or by ID."""
+        table = self._by_id if isinstance(register, int) else self._by_key
+        return table.get(heat_pump_id, {}).get(register)
+
+    def validate(
+        self, heat_pump_id: str, register: RegisterKey | int, value: float
+    ) -> float:
+        """Return ``value`` snapped to the step of ``register``.
+
+        Registers that were not indexed yet are left to the API to check.
+        Raises ServiceValidationError if the register cannot take the value.
+        """
+        if (constraint := self.get(heat_pump_id, register)) is None:
+            return value
+        return constraint.validate(value)
+
+
+@dataclass(frozen=True, slots=True)
+class RegisterWrite:
+    """Outcome of writing one register of a batch."""
+
+    key: RegisterKey
+    value: float
+    error: Exception | None = None
+    seconds: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the outcome as JSON serializable data."""
+        return {
+            "value": self.value,
+            "ok": self.error is None,
+            "error": None if self.error is None else str(self.error),
+            "ms": round(self.seconds * 1000, 1),
+        }
@@ -0,0 +1,90 @@
+"""Adaptive poll interval for the Thermia coordinator."""
+
+from __future__ import annotations
+
+import random
+import time
+from typing import Callable
+
+from .const import (
+    CHANGE_RATE_SMOOTHING,
+    POLL_INTERVAL_FAST,
+    POLL_INTERVAL_SLOW,
+    POLL_JITTER,
+    POLL_MAX_BACKOFF,
+    WRITE_CONFIRM_WINDOW,
+)
+
+
+class AdaptivePollScheduler:
+    """Choose the next poll interval from what the heat pump is doing.
+
+    Polls at ``fast`` while the compressor runs, a write waits to be
+    confirmed or part of the last poll failed. Otherwise the interval slides
+    towards ``slow`` as the smoothed rate of cycles that brought new values
+    drops. Consecutive failures back off exponentially up to ``max_backoff``.
+    Every interval gets a little jitter so accounts do not end up polling in
+    lockstep, and ``phase`` is added once to shift this scheduler against the
+    others.
+    """
+
+    def __init__(
+        self,
+        fast: float = POLL_INTERVAL_FAST,
+        slow: float = POLL_INTERVAL_SLOW,
+        max_backoff: float = POLL_MAX_BACKOFF,
+        jitter: float = POLL_JITTER,
+        smoothing: float = CHANGE_RATE_SMOOTHING,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Callable[[], float] = random.random,
+        phase: float = 0.0,
+    ):
+        self.fast = fast
+        self.slow = slow
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.smoothing = smoothing
+        self._clock = clock
+        self._rng = rng
+        self.phase = phase
+
+        self.change_rate: float = 1.0
+        self.failures: int = 0
+        self._write_deadline: float = 0.0
+
+    @property
+    def write_pending(self) -> bool:
+        """Return True while a write is waiting to be confirmed by a poll."""
+        return self._clock() < self._write_deadline
+
+    def note_write(self, window: float = WRITE_CONFIRM_WINDOW) -> None:
+        """Poll fast for ``window`` seconds after a write."""
+        self._write_deadline = self._clock() + window
+
+    def take_phase(self) -> float:
+        """Return the phase offset if it was not applied yet."""
+        phase, self.phase = self.phase, 0.0
+        return phase
+
+    def on_success(
+        self, changed: bool, active: bool, degraded: bool = False
+    ) -> float:
+        """Return the next interval after a successful poll."""
+        self.failures = 0
+        self.change_rate += self.smoothing * (float(changed) - self.change_rate)
+
+        if active or degraded or self.write_pending:
+            return self._jittered(self.fast) + self.take_phase()
+
+        return (
+            self._jittered(self.slow - (self.slow - self.fast) * self.change_rate)
+            + self.take_phase()
+        )
+
+    def on_failure(self) -> float:
+        """Return the next interval after a failed poll."""
+        self.failures += 1
+        return self._jittered(min(self.max_backoff, self.fast * 2**self.failures))
+
+    def _jittered(self, interval: float) -> float:
+        return interval * (1 + self.jitter * (2 * self._rng() - 1))
@@ -2,36 +2,43 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 from homeassistant.components.sensor import SensorEntity
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from ..const import DOMAIN
-from ..coordinator import ThermiaDataUpdateCoordinator
+from ..entity import ThermiaEntity
+from ..snapshot import EntityWatch
+
 
+class ThermiaActiveAlarmsSensor(ThermiaEntity, SensorEntity):
+    """Representation of an Thermia active alarms sensor.
 
-class ThermiaActiveAlarmsSensor(
-    CoordinatorEntity[ThermiaDataUpdateCoordinator], SensorEntity
-):
-    """Representation of an Thermia active alarms sensor."""
+    The active alarms themselves are listed in the ``alarms`` attribute.
+    """
 
     def __init__(self, coordinator, idx: int):
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator,
+            EntityWatch(
+                idx, frozenset({"active_alarm_count", "active_alarms", "name"})
+            ),
+        )
         self.idx: int = idx
 
     @property
     def available(self):
         """Return True if entity is available."""
-        return self.coordinator.data.connected
+        return self.coordinator.data.connected and self._fetched("active_alarm_count")
 
     @property
     def name(self):
         """Return the name of the sensor."""
-        return f"{self.coordinator.data.heat_pumps[self.idx].name} Active Alarms"
+        return self.coordinator.descriptors[self.idx].entity_name("Active Alarms")
 
     @property
     def unique_id(self):
         """Return the unique ID of the sensor."""
-        return f"{self.coordinator.data.heat_pumps[self.idx].name}_active_alarms"
+        return self.coordinator.descriptors[self.idx].entity_unique_id("Active Alarms")
 
     @property
     def icon(self):
@@ -41,13 +48,7 @@ class ThermiaActiveAlarmsSensor(
     @property
     def device_info(self):
         """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.data.heat_pumps[self.idx].id)},
-            "name": self.coordinator.data.heat_pumps[self.idx].name,
-            "manufacturer": "Thermia",
-            "model": self.coordinator.data.heat_pumps[self.idx].model,
-            "model_id": self.coordinator.data.heat_pumps[self.idx].model_id,
-        }
+        return self.coordinator.descriptors[self.idx].device_info
 
     @property
     def state_class(self):
@@ -58,3 +59,15 @@ class ThermiaActiveAlarmsSensor(
     def native_value(self):
         """Return active alarms count of the sensor."""
         return self.coordinator.data.heat_pumps[self.idx].active_alarm_count
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the active alarms."""
+        heat_pump_id = str(self.coordinator.data.heat_pumps[self.idx].id)
+        return {
+            "alarms": [
+                alarm.as_dict()
+                for alarm in self.coordinator.client.alarms.alarms(heat_pump_id)
+            ],
+            **(super().extra_state_attributes or {}),
+        }
@@ -0,0 +1,78 @@
+"""Thermia derived metrics sensor integration."""
+
+from __future__ import annotations
+
+from homeassistant.components.sensor import SensorEntity
+
+from ..derived import DerivedMetric, DerivedWatch
+from ..entity import ThermiaEntity
+
+
+class ThermiaDerivedSensor(ThermiaEntity, SensorEntity):
+    """Sensor showing a metric derived from the polled values, such as the
+    temperature difference over the heating circuit or the compressor duty
+    cycle."""
+
+    def __init__(self, coordinator, idx: int, metric: DerivedMetric):
+        super().__init__(
+            coordinator,
+            DerivedWatch(
+                idx,
+                frozenset({"is_online", "name", *metric.inputs}),
+                metric.key,
+                coordinator.derived,
+            ),
+        )
+        self.idx: int = idx
+        self._metric = metric
+
+    @property
+    def available(self):
+        """Return True if entity is available."""
+        return self._fetched(*self._metric.inputs) and bool(
+            self.coordinator.data.heat_pumps[self.idx].is_online
+        )
+
+    @property
+    def name(self):
+        """Return the name of the sensor."""
+        return self.coordinator.descriptors[self.idx].entity_name(self._metric.name)
+
+    @property
+    def unique_id(self):
+        """Return the unique ID of the sensor."""
+        return self.coordinator.descriptors[self.idx].entity_unique_id(
+            self._metric.name
+        )
+
+    @property
+    def icon(self):
+        """Return the icon of the sensor."""
+        return self._metric.icon
+
+    @property
+    def device_info(self):
+        """Return device information."""
+        return self.coordinator.descriptors[self.idx].device_info
+
+    @property
+    def device_class(self):
+        """Return the device class of the sensor."""
+        return self._metric.device_class
+
+    @property
+    def state_class(self):
+        """Return the state class of the sensor."""
+        return "measurement"
+
+    @property
+    def native_value(self):
+        """Return the value of the metric."""
+        return self.coordinator.derived.value(
+            self.coordinator.data.heat_pumps[self.idx].id, self._metric.key
+        )
+
+    @property
+    def native_unit_of_measurement(self):
+        """Return the unit of measurement of the sensor."""
+        return self._metric.unit
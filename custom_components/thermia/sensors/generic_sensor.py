@@ -2,16 +2,16 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 from homeassistant.components.sensor import SensorEntity
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from ..const import DOMAIN
-from ..coordinator import ThermiaDataUpdateCoordinator
+from ..aggregation import AGGREGATED_ATTRIBUTES, AggregatedWatch
+from ..entity import ThermiaEntity
+from ..snapshot import EntityWatch
 
 
-class ThermiaGenericSensor(
-    CoordinatorEntity[ThermiaDataUpdateCoordinator], SensorEntity
-):
+class ThermiaGenericSensor(ThermiaEntity, SensorEntity):
     """Representation of an Thermia generic sensor."""
 
     def __init__(
@@ -27,7 +27,13 @@ class ThermiaGenericSensor(
         value_prop: str,
         unit_of_measurement: str | None,
     ):
-        super().__init__(coordinator)
+        attributes = frozenset({is_online_prop, value_prop, "name"})
+        super().__init__(
+            coordinator,
+            AggregatedWatch(idx, attributes, value_prop, coordinator.aggregation)
+            if value_prop in AGGREGATED_ATTRIBUTES
+            else EntityWatch(idx, attributes),
+        )
         self.idx: int = idx
 
         self._is_online_prop: str = is_online_prop
@@ -42,17 +48,19 @@ class ThermiaGenericSensor(
     @property
     def available(self):
         """Return True if entity is available."""
-        return getattr(self.coordinator.data.heat_pumps[self.idx], self._is_online_prop)
+        return self._fetched(self._value_prop) and getattr(
+            self.coordinator.data.heat_pumps[self.idx], self._is_online_prop
+        )
 
     @property
     def name(self):
         """Return the name of the sensor."""
-        return f"{self.coordinator.data.heat_pumps[self.idx].name} {self._sensor_name}"
+        return self.coordinator.descriptors[self.idx].entity_name(self._sensor_name)
 
     @property
     def unique_id(self):
         """Return the unique ID of the sensor."""
-        return f"{self.coordinator.data.heat_pumps[self.idx].name}_{self._sensor_name.lower().replace(' ', '_')}"
+        return self.coordinator.descriptors[self.idx].entity_unique_id(self._sensor_name)
 
     @property
     def icon(self):
@@ -62,13 +70,7 @@ class ThermiaGenericSensor(
     @property
     def device_info(self):
         """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.data.heat_pumps[self.idx].id)},
-            "name": self.coordinator.data.heat_pumps[self.idx].name,
-            "manufacturer": "Thermia",
-            "model": self.coordinator.data.heat_pumps[self.idx].model,
-            "model_id": self.coordinator.data.heat_pumps[self.idx].model_id,
-        }
+        return self.coordinator.descriptors[self.idx].device_info
 
     @property
     def entity_category(self):
@@ -88,7 +90,15 @@ class ThermiaGenericSensor(
     @property
     def native_value(self):
         """Return value of the sensor."""
-        return getattr(self.coordinator.data.heat_pumps[self.idx], self._value_prop)
+        return self.coordinator.published(self.idx, self._value_prop)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the statistics of the window the value sums up, if any."""
+        attributes = self.coordinator.aggregation.attributes(
+            self.coordinator.data.heat_pumps[self.idx].id, self._value_prop
+        )
+        return {**attributes, **(super().extra_state_attributes or {})} or None
 
     @property
     def native_unit_of_measurement(self):
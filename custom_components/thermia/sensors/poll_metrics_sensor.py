@@ -0,0 +1,105 @@
+"""Thermia poll metrics sensor integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.sensor import SensorEntity
+from homeassistant.const import UnitOfInformation, UnitOfTime
+from homeassistant.helpers.entity import EntityCategory
+
+from ..entity import ThermiaEntity
+
+# Sensor name, unit, device class and icon of every poll metric
+POLL_METRICS: dict[str, tuple[str, str | None, str | None, str]] = {
+    "duration": ("Poll Duration", UnitOfTime.MILLISECONDS, "duration", "mdi:timer"),
+    "requests": ("Poll Requests", None, None, "mdi:swap-vertical"),
+    "bytes": ("Poll Bytes", UnitOfInformation.BYTES, "data_size", "mdi:download"),
+}
+
+
+class ThermiaPollMetricsSensor(ThermiaEntity, SensorEntity):
+    """Diagnostic sensor showing how the last poll of the account went.
+
+    The sensors are attached to the first heat pump of the account and are
+    updated on every poll.
+    """
+
+    def __init__(self, coordinator, metric: str):
+        super().__init__(coordinator)
+        self.idx: int = 0
+        self._metric = metric
+        (
+            self._sensor_name,
+            self._unit_of_measurement,
+            self._device_class,
+            self._mdi_icon,
+        ) = POLL_METRICS[metric]
+
+    @property
+    def name(self):
+        """Return the name of the sensor."""
+        return self.coordinator.descriptors[self.idx].entity_name(self._sensor_name)
+
+    @property
+    def unique_id(self):
+        """Return the unique ID of the sensor."""
+        return self.coordinator.descriptors[self.idx].entity_unique_id(
+            self._sensor_name
+        )
+
+    @property
+    def icon(self):
+        """Return the icon of the sensor."""
+        return self._mdi_icon
+
+    @property
+    def device_info(self):
+        """Return device information."""
+        return self.coordinator.descriptors[self.idx].device_info
+
+    @property
+    def entity_category(self):
+        """Return the category of the sensor."""
+        return EntityCategory.DIAGNOSTIC
+
+    @property
+    def device_class(self):
+        """Return the device class of the sensor."""
+        return self._device_class
+
+    @property
+    def state_class(self):
+        """Return the state class of the sensor."""
+        return "measurement"
+
+    @property
+    def native_value(self):
+        """Return the metric of the last poll."""
+        client_metrics = self.coordinator.client.metrics
+        if self._metric == "requests":
+            return client_metrics.last_cycle_calls
+        if self._metric == "bytes":
+            return client_metrics.last_cycle_bytes
+        if (duration := self.coordinator.metrics.last("update")) is None:
+            return None
+        return round(duration * 1000, 1)
+
+    @property
+    def native_unit_of_measurement(self):
+        """Return the unit of measurement of the sensor."""
+        return self._unit_of_measurement
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the percentiles of the poll duration."""
+        if self._metric != "duration" or (
+            histogram := self.coordinator.metrics.histograms.get("update")
+        ) is None:
+            return super().extra_state_attributes
+        return {
+            "p50_ms": round(histogram.percentile(50) * 1000, 1),
+            "p95_ms": round(histogram.percentile(95) * 1000, 1),
+            "max_ms": round(histogram.maximum * 1000, 1),
+            **(super().extra_state_attributes or {}),
+        }
@@ -3,85 +3,256 @@
 from __future__ import annotations
 
 import logging
+import time
 
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
 from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.service import async_extract_entity_ids
 from homeassistant.helpers.template import device_attr
+from homeassistant.util import dt as dt_util
+from ThermiaOnlineAPI import ThermiaHeatPump
+from ThermiaOnlineAPI.const import REG_GROUP_HEATING_CURVE
+import voluptuous as vol
 
 from .coordinator import ThermiaDataUpdateCoordinator
-from .const import DEBUG_ACTION_NAME, DEFAULT_DEBUG_FILENAME, DOMAIN
+from .debug import async_dump_heat_pump
+from .const import (
+    DEBUG_ACTION_NAME,
+    DOMAIN,
+    REFRESH_METADATA_ACTION_NAME,
+    REGISTERS_ACTION_NAME,
+    TELEMETRY_ACTION_NAME,
+)
+from .registers import RegisterKey, register_key
+from .telemetry import TELEMETRY_ATTRIBUTES
 
 _LOGGER = logging.getLogger(__name__)
 
+TELEMETRY_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Optional("start"): cv.datetime,
+        vol.Optional("end"): cv.datetime,
+        vol.Optional("attributes"): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+
+SET_REGISTERS_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Required("registers"): vol.All(
+            {cv.string: vol.Coerce(float)}, vol.Length(min=1)
+        ),
+        vol.Optional("register_group", default=REG_GROUP_HEATING_CURVE): cv.string,
+    }
+)
+
 
 class ThermiaServicesSetup:
-    """Set up Thermia services."""
+    """Set up Thermia services.
+
+    The services act on every loaded config entry, so they are registered
+    by the first entry that loads and removed with the last one.
+    """
 
-    def __init__(self, hass: HomeAssistant, coordinator: ThermiaDataUpdateCoordinator):
+    def __init__(self, hass: HomeAssistant):
         self.hass = hass
-        self.coordinator = coordinator
 
         self.setup_services()
 
     def setup_services(self):
         """Set up Thermia services."""
+        if self.hass.services.has_service(DOMAIN, DEBUG_ACTION_NAME):
+            # Already set up by another config entry
+            return
         self.hass.services.async_register(
-            DOMAIN, DEBUG_ACTION_NAME, self.async_handle_heat_pump_debug
+            DOMAIN,
+            DEBUG_ACTION_NAME,
+            self.async_handle_heat_pump_debug,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+        self.hass.services.async_register(
+            DOMAIN, REFRESH_METADATA_ACTION_NAME, self.async_handle_refresh_metadata
+        )
+        self.hass.services.async_register(
+            DOMAIN,
+            TELEMETRY_ACTION_NAME,
+            self.async_handle_get_telemetry,
+            schema=TELEMETRY_SCHEMA,
+            supports_response=SupportsResponse.ONLY,
+        )
+        self.hass.services.async_register(
+            DOMAIN,
+            REGISTERS_ACTION_NAME,
+            self.async_handle_set_registers,
+            schema=SET_REGISTERS_SCHEMA,
+            supports_response=SupportsResponse.OPTIONAL,
         )
 
-    async def async_handle_heat_pump_debug(self, call: ServiceCall):
-        """Handle debug service call."""
-        entity_ids = await async_extract_entity_ids(self.hass, call)
-
-        entity_ids = list(
-            filter(lambda entity_id: entity_id.startswith("water_heater."), entity_ids)
+    async def async_handle_refresh_metadata(self, call: ServiceCall):
+        """Handle refresh metadata service call."""
+        coordinators: list[ThermiaDataUpdateCoordinator] = list(
+            self.hass.data[DOMAIN].values()
         )
+        # Entries of one account share a client: drop its cache once, the
+        # first refresh fetches and the others reuse that update
+        clients = {
+            id(coordinator.client): coordinator.client for coordinator in coordinators
+        }
+        for client in clients.values():
+            client.invalidate()
+        for coordinator in coordinators:
+            await coordinator.async_refresh()
 
-        if len(entity_ids) == 0 or len(entity_ids) > 1:
-            raise ServiceValidationError(
-                "Exactly one water heater entity should be provided"
-            )
+    async def async_handle_heat_pump_debug(self, call: ServiceCall) -> ServiceResponse:
+        """Handle debug service call.
 
-        entity_id = entity_ids[0]
+        Writes a report for the heat pump of every targeted water heater, or
+        for every heat pump when no water heater is targeted.
+        """
+        dumps = []
+        for coordinator, heat_pump in await self._async_targets(
+            call, "water_heater."
+        ):
+            dumps.append(
+                await async_dump_heat_pump(self.hass, coordinator.client, heat_pump)
+            )
+        return {"dumps": dumps}
 
-        device_identifiers = device_attr(self.hass, entity_id, "identifiers")
+    async def async_handle_get_telemetry(self, call: ServiceCall) -> ServiceResponse:
+        """Handle get telemetry service call.
 
-        if device_identifiers is None:
+        Returns the recorded samples of the heat pumps of the targeted
+        entities, or of every heat pump, between the optional start and end.
+        """
+        start = call.data.get("start")
+        end = call.data.get("end")
+        attributes = call.data.get("attributes")
+        if unknown := set(attributes or ()) - set(TELEMETRY_ATTRIBUTES):
             raise ServiceValidationError(
-                f"Cannot find device identifiers for entity {entity_id}"
+                f"Unknown telemetry attributes: {', '.join(sorted(unknown))}"
             )
 
-        device_identifiers = list(device_identifiers)
+        heat_pumps = {}
+        for coordinator, heat_pump in await self._async_targets(call):
+            if (buffer := coordinator.telemetry.buffers.get(heat_pump.id)) is None:
+                continue
+            heat_pumps[str(heat_pump.id)] = buffer.slice(
+                None if start is None else dt_util.as_timestamp(start),
+                None if end is None else dt_util.as_timestamp(end),
+                attributes,
+            )
+        return {"heat_pumps": heat_pumps}
+
+    async def async_handle_set_registers(self, call: ServiceCall) -> ServiceResponse:
+        """Handle set registers service call.
 
-        if len(device_identifiers) != 1 and len(device_identifiers[0]) != 2:
+        Writes every given register of the targeted heat pump in one batch,
+        followed by a single refresh. Registers are named ``GROUP/NAME`` or
+        ``NAME`` in the given register group. All values are checked against
+        the limits of their register and snapped to its step before anything
+        is written.
+        """
+        start = time.perf_counter()
+        targets = await self._async_targets(call)
+        if len(targets) != 1:
+            raise ServiceValidationError("Target exactly one heat pump")
+        coordinator, heat_pump = targets[0]
+        idx = coordinator.client.heat_pumps.index(heat_pump)
+
+        values: dict[RegisterKey, float] = {
+            register_key(name, call.data["register_group"]): value
+            for name, value in call.data["registers"].items()
+        }
+        # Index the limits of every register group involved; the write reuses
+        # the fetched registers rather than fetching the groups again
+        registers = await coordinator.client.async_registers(
+            idx, (group for group, _ in values)
+        )
+        invalid = []
+        for key, value in values.items():
+            constraint = coordinator.client.constraints.get(str(heat_pump.id), key)
+            if constraint is None:
+                invalid.append(f"{'/'.join(key)}: register is not available")
+            elif (problem := constraint.problem(value)) is not None:
+                invalid.append(f"{'/'.join(key)}: {problem}")
+            else:
+                values[key] = constraint.snap(value)
+        if invalid:
             raise ServiceValidationError(
-                f"Invalid device identifiers for entity {entity_id}"
+                f"Invalid register values: {'; '.join(invalid)}"
             )
 
-        heat_pump_id = device_identifiers[0][1]
+        results = await coordinator.async_write_registers(idx, values, registers)
+        for result in results:
+            if result.error is not None:
+                _LOGGER.error(
+                    "Writing %s/%s of %s failed: %s",
+                    *result.key,
+                    heat_pump.name,
+                    result.error,
+                )
+        return {
+            "heat_pump": str(heat_pump.id),
+            "registers": {
+                "/".join(result.key): result.as_dict() for result in results
+            },
+            "ms": round((time.perf_counter() - start) * 1000, 1),
+        }
 
-        heat_pump = next(
-            (
-                heat_pump
-                for heat_pump in self.coordinator.data.heat_pumps
-                if heat_pump.id == heat_pump_id
-            ),
-            None,
+    async def _async_targets(
+        self, call: ServiceCall, entity_prefix: str = ""
+    ) -> list[tuple[ThermiaDataUpdateCoordinator, ThermiaHeatPump]]:
+        """Return the heat pumps of the targeted entities whose ID starts
+        with ``entity_prefix``, or every heat pump when none is targeted."""
+        coordinators: list[ThermiaDataUpdateCoordinator] = list(
+            self.hass.data[DOMAIN].values()
+        )
+        # Entries sharing a client share its heat pumps
+        targets = list(
+            {
+                heat_pump.id: (coordinator, heat_pump)
+                for coordinator in coordinators
+                for heat_pump in coordinator.client.heat_pumps
+            }.values()
         )
 
-        if heat_pump is None:
+        entity_ids = [
+            entity_id
+            for entity_id in await async_extract_entity_ids(self.hass, call)
+            if entity_id.startswith(entity_prefix)
+        ]
+        if not entity_ids:
+            return targets
+
+        heat_pump_ids = {self._heat_pump_id(entity_id) for entity_id in entity_ids}
+        targets = [
+            (coordinator, heat_pump)
+            for coordinator, heat_pump in targets
+            if heat_pump.id in heat_pump_ids
+        ]
+        if not targets:
             raise ServiceValidationError("Cannot find heat pump by unique_id")
+        return targets
+
+    def _heat_pump_id(self, entity_id: str) -> str:
+        """Return the id of the heat pump device of ``entity_id``."""
+        device_identifiers = device_attr(self.hass, entity_id, "identifiers")
 
-        debug_data = await self.hass.async_add_executor_job(lambda: heat_pump.debug())
+        if device_identifiers is None:
+            raise ServiceValidationError(
+                f"Cannot find device identifiers for entity {entity_id}"
+            )
 
-        def create_debug_file():
-            with open(DEFAULT_DEBUG_FILENAME, "w", encoding="utf-8") as report_file:
-                report_file.write(debug_data)
+        device_identifiers = list(device_identifiers)
 
-            _LOGGER.info(
-                f"Thermia debug file was created and data was written to {
-                    DEFAULT_DEBUG_FILENAME}"
+        if len(device_identifiers) != 1 or len(device_identifiers[0]) != 2:
+            raise ServiceValidationError(
+                f"Invalid device identifiers for entity {entity_id}"
             )
 
-        await self.hass.async_add_executor_job(create_debug_file)
+        return device_identifiers[0][1]
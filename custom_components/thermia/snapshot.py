@@ -0,0 +1,277 @@
+"""Immutable per-poll snapshots of the Thermia heat pumps."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Mapping
+
+from ThermiaOnlineAPI import Thermia, ThermiaHeatPump
+
+from .descriptions import NUMBER_DESCRIPTIONS, SENSOR_DESCRIPTIONS
+
+# Every heat pump attribute an entity reads, captured once per poll.
+SNAPSHOT_ATTRIBUTES = tuple(
+    sorted(
+        {
+            "is_online",
+            "heat_min_temperature_value",
+            "heat_max_temperature_value",
+            "available_operational_statuses",
+            "running_operational_statuses",
+            "available_power_statuses",
+            "running_power_statuses",
+            "operation_mode",
+            "available_operation_modes",
+            "is_operation_mode_read_only",
+            "hot_water_switch_state",
+            "hot_water_boost_switch_state",
+            "active_alarm_count",
+            "active_alarms",
+            "indoor_temperature",
+            "heat_temperature",
+            "start_hot_water_temperature",
+            "weighted_hot_water_temperature",
+        }
+        | SENSOR_DESCRIPTIONS.attributes
+        | NUMBER_DESCRIPTIONS.attributes
+    )
+)
+
+
+def _freeze(value: Any) -> Any:
+    """Return an immutable, comparable copy of ``value``."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Return a JSON serializable copy of a frozen ``value``."""
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    return value
+
+
+@dataclass(frozen=True, slots=True)
+class HeatPumpSnapshot:
+    """Values of one heat pump as seen by one poll.
+
+    Attribute access falls through to ``values``, so entities read a snapshot
+    exactly like they would read a ``ThermiaHeatPump``. ``unavailable`` names
+    the attributes the poll could not fetch; they keep their previous value.
+    ``sources`` holds the status of every endpoint and register group the
+    values were read from.
+    """
+
+    id: str
+    name: str | None
+    model: str | None
+    model_id: str | None
+    values: Mapping[str, Any]
+    unavailable: frozenset[str] = frozenset()
+    sources: Mapping[str, Any] = field(
+        default_factory=lambda: MappingProxyType({}), compare=False
+    )
+
+    def __getattr__(self, attribute: str) -> Any:
+        try:
+            return self.values[attribute]
+        except KeyError:
+            raise AttributeError(attribute) from None
+
+    @classmethod
+    def capture(
+        cls,
+        heat_pump: ThermiaHeatPump,
+        unavailable: frozenset[str] = frozenset(),
+        sources: Mapping[str, Any] | None = None,
+    ) -> HeatPumpSnapshot:
+        """Capture the current values of ``heat_pump``."""
+        return cls(
+            id=heat_pump.id,
+            name=heat_pump.name,
+            model=heat_pump.model,
+            model_id=heat_pump.model_id,
+            values=MappingProxyType(
+                {
+                    attribute: _freeze(getattr(heat_pump, attribute, None))
+                    for attribute in SNAPSHOT_ATTRIBUTES
+                }
+            ),
+            unavailable=unavailable,
+            sources=MappingProxyType(dict(sources or {})),
+        )
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> HeatPumpSnapshot:
+        """Restore a snapshot stored with ``as_dict``."""
+        values = data["values"]
+        return cls(
+            id=data["id"],
+            name=data["name"],
+            model=data["model"],
+            model_id=data["model_id"],
+            values=MappingProxyType(
+                {
+                    attribute: _freeze(values.get(attribute))
+                    for attribute in SNAPSHOT_ATTRIBUTES
+                }
+            ),
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the snapshot as JSON serializable data."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "model": self.model,
+            "model_id": self.model_id,
+            "values": _thaw(self.values),
+        }
+
+    def fetched(self, *attributes: str) -> bool:
+        """Return True if the poll fetched all ``attributes``."""
+        return self.unavailable.isdisjoint(attributes)
+
+    def changed_attributes(self, other: HeatPumpSnapshot) -> frozenset[str]:
+        """Return the attributes that differ from ``other``, including those
+        that became available or unavailable."""
+        changed = {
+            attribute
+            for attribute, value in self.values.items()
+            if other.values.get(attribute) != value
+        }
+        changed.update(self.unavailable ^ other.unavailable)
+        if self.name != other.name:
+            changed.add("name")
+        return frozenset(changed)
+
+
+@dataclass(frozen=True, slots=True)
+class ThermiaSnapshot:
+    """All heat pumps of an account as seen by one poll.
+
+    ``stale`` marks a snapshot restored from storage that no poll has
+    confirmed yet.
+    """
+
+    connected: bool
+    heat_pumps: tuple[HeatPumpSnapshot, ...]
+    stale: bool = False
+
+    @classmethod
+    def capture(
+        cls,
+        thermia: Thermia,
+        unavailable: Mapping[str, frozenset[str]] | None = None,
+        sources: Mapping[str, Mapping[str, Any]] | None = None,
+    ) -> ThermiaSnapshot:
+        """Capture the current values of every heat pump of ``thermia``.
+
+        ``unavailable`` and ``sources`` hold the attributes the poll could not
+        fetch and the status of every data source, by heat pump ID.
+        """
+        return cls(
+            connected=thermia.connected,
+            heat_pumps=tuple(
+                HeatPumpSnapshot.capture(
+                    heat_pump,
+                    (unavailable or {}).get(str(heat_pump.id), frozenset()),
+                    (sources or {}).get(str(heat_pump.id)),
+                )
+                for heat_pump in thermia.heat_pumps
+            ),
+        )
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> ThermiaSnapshot:
+        """Restore a snapshot stored with ``as_dict``; it is marked stale."""
+        return cls(
+            connected=data["connected"],
+            heat_pumps=tuple(
+                HeatPumpSnapshot.from_dict(heat_pump)
+                for heat_pump in data["heat_pumps"]
+            ),
+            stale=True,
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the snapshot as JSON serializable data."""
+        return {
+            "connected": self.connected,
+            "heat_pumps": [heat_pump.as_dict() for heat_pump in self.heat_pumps],
+        }
+
+    def diff(
+        self, previous: ThermiaSnapshot | None
+    ) -> dict[int, frozenset[str]] | None:
+        """Return the changed attributes per heat pump index.
+
+        ``None`` means the change cannot be narrowed down (first poll, other
+        heat pumps, connection state, staleness) and every entity has to be
+        updated.
+        """
+        if (
+            previous is None
+            or previous.stale != self.stale
+            or previous.connected != self.connected
+            or [heat_pump.id for heat_pump in previous.heat_pumps]
+            != [heat_pump.id for heat_pump in self.heat_pumps]
+        ):
+            return None
+
+        return {
+            idx: heat_pump.changed_attributes(previous.heat_pumps[idx])
+            for idx, heat_pump in enumerate(self.heat_pumps)
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class EntityWatch:
+    """Listener context naming the snapshot attributes an entity renders."""
+
+    idx: int
+    attributes: frozenset[str]
+
+    def affected(
+        self,
+        changes: dict[int, frozenset[str]],
+        previous: ThermiaSnapshot,
+        current: ThermiaSnapshot,
+    ) -> bool:
+        """Return True if the entity state may differ after this poll."""
+        return not self.attributes.isdisjoint(changes.get(self.idx, ()))
+
+
+@dataclass(frozen=True, slots=True)
+class MembershipWatch(EntityWatch):
+    """Watch whether ``member`` is in the list attribute ``status_list``."""
+
+    status_list: str = ""
+    member: str = ""
+
+    def affected(
+        self,
+        changes: dict[int, frozenset[str]],
+        previous: ThermiaSnapshot,
+        current: ThermiaSnapshot,
+    ) -> bool:
+        """Return True if membership or any other watched attribute changed."""
+        changed = changes.get(self.idx, frozenset())
+        if self.status_list in changed:
+            previous_pump = previous.heat_pumps[self.idx]
+            current_pump = current.heat_pumps[self.idx]
+            if previous_pump.fetched(self.status_list) != current_pump.fetched(
+                self.status_list
+            ):
+                return True
+            before = getattr(previous_pump, self.status_list) or ()
+            after = getattr(current_pump, self.status_list) or ()
+            if (self.member in before) != (self.member in after):
+                return True
+        return not (self.attributes - {self.status_list}).isdisjoint(changed)
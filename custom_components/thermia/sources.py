@@ -0,0 +1,124 @@
+"""Data sources behind the heat pump attributes and their health."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Collection
+
+from ThermiaOnlineAPI.const import (
+    REG_GROUP_HEATING_CURVE,
+    REG_GROUP_HOT_WATER,
+    REG_GROUP_OPERATIONAL_OPERATION,
+    REG_GROUP_OPERATIONAL_STATUS,
+    REG_GROUP_OPERATIONAL_TIME,
+    REG_GROUP_TEMPERATURES,
+)
+
+from .descriptions import NUMBER_DESCRIPTIONS
+from .snapshot import SNAPSHOT_ATTRIBUTES
+
+
+@dataclass(frozen=True, slots=True)
+class SourceStatus:
+    """Outcome of the last fetch of one data source of one heat pump.
+
+    ``last_success`` is the POSIX timestamp of the last successful fetch and
+    ``failures`` counts the failed fetches since.
+    """
+
+    ok: bool
+    last_success: float | None = None
+    error: str | None = None
+    failures: int = 0
+
+    def failed(self, error: Exception) -> SourceStatus:
+        """Return the status after a fetch that failed with ``error``."""
+        return SourceStatus(False, self.last_success, repr(error), self.failures + 1)
+
+
+# Endpoint or register group every attribute is read from. Attributes that
+# are not listed count as unavailable whenever any source of their heat pump
+# failed.
+ATTRIBUTE_SOURCES: dict[str, str] = {
+    "is_online": "get_device_info",
+    **dict.fromkeys(
+        (
+            "indoor_temperature",
+            "outdoor_temperature",
+            "hot_water_temperature",
+            "heat_temperature",
+            "has_indoor_temp_sensor",
+            "is_outdoor_temp_sensor_functioning",
+            "is_hot_water_active",
+        ),
+        "get_device_status",
+    ),
+    **dict.fromkeys(
+        (
+            "heat_min_temperature_value",
+            "heat_max_temperature_value",
+            "supply_line_temperature",
+            "desired_supply_line_temperature",
+            "buffer_tank_temperature",
+            "return_line_temperature",
+            "brine_out_temperature",
+            "brine_in_temperature",
+            "pool_temperature",
+            "cooling_tank_temperature",
+            "cooling_supply_line_temperature",
+        ),
+        REG_GROUP_TEMPERATURES,
+    ),
+    **dict.fromkeys(
+        (
+            "available_operational_statuses",
+            "running_operational_statuses",
+            "available_power_statuses",
+            "running_power_statuses",
+            "operational_status_integral",
+            "operational_status_pid",
+        ),
+        REG_GROUP_OPERATIONAL_STATUS,
+    ),
+    **dict.fromkeys(
+        (
+            "compressor_operational_time",
+            "heating_operational_time",
+            "hot_water_operational_time",
+            "auxiliary_heater_1_operational_time",
+            "auxiliary_heater_2_operational_time",
+            "auxiliary_heater_3_operational_time",
+        ),
+        REG_GROUP_OPERATIONAL_TIME,
+    ),
+    **dict.fromkeys(
+        (
+            "operation_mode",
+            "available_operation_modes",
+            "is_operation_mode_read_only",
+        ),
+        REG_GROUP_OPERATIONAL_OPERATION,
+    ),
+    **dict.fromkeys(
+        ("hot_water_switch_state", "hot_water_boost_switch_state"),
+        REG_GROUP_HOT_WATER,
+    ),
+    **dict.fromkeys(("active_alarm_count", "active_alarms"), "get_all_alarms"),
+    **dict.fromkeys(
+        NUMBER_DESCRIPTIONS.attributes - {"is_online"}, REG_GROUP_HEATING_CURVE
+    ),
+}
+
+ALL_ATTRIBUTES = frozenset(SNAPSHOT_ATTRIBUTES)
+_UNMAPPED_ATTRIBUTES = ALL_ATTRIBUTES - ATTRIBUTE_SOURCES.keys()
+
+
+def unavailable_attributes(failed_sources: Collection[str]) -> frozenset[str]:
+    """Return the attributes that depend on any of ``failed_sources``."""
+    if not failed_sources:
+        return frozenset()
+    return _UNMAPPED_ATTRIBUTES | {
+        attribute
+        for attribute, source in ATTRIBUTE_SOURCES.items()
+        if source in failed_sources
+    }
@@ -2,36 +2,41 @@
 
 from __future__ import annotations
 
+from functools import partial
+
 from homeassistant.components.switch import SwitchEntity
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from ..const import DOMAIN
-from ..coordinator import ThermiaDataUpdateCoordinator
+from ..entity import ThermiaEntity
+from ..snapshot import EntityWatch
 
 
-class ThermiaHotWaterBoostSwitch(
-    CoordinatorEntity[ThermiaDataUpdateCoordinator], SwitchEntity
-):
+class ThermiaHotWaterBoostSwitch(ThermiaEntity, SwitchEntity):
     """Representation of an Thermia hot water boost switch."""
 
     def __init__(self, coordinator, idx: int):
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator,
+            EntityWatch(idx, frozenset({"is_online", "hot_water_boost_switch_state", "name"})),
+        )
         self.idx: int = idx
 
     @property
     def available(self):
         """Return True if entity is available."""
-        return self.coordinator.data.heat_pumps[self.idx].is_online
+        return (
+            self._fetched("hot_water_boost_switch_state")
+            and self.coordinator.data.heat_pumps[self.idx].is_online
+        )
 
     @property
     def name(self):
         """Return the name of the switch."""
-        return f"{self.coordinator.data.heat_pumps[self.idx].name} Hot Water Boost"
+        return self.coordinator.descriptors[self.idx].entity_name("Hot Water Boost")
 
     @property
     def unique_id(self):
         """Return the unique ID of the switch."""
-        return f"{self.coordinator.data.heat_pumps[self.idx].name}_hot_water_boost"
+        return self.coordinator.descriptors[self.idx].entity_unique_id("Hot Water Boost")
 
     @property
     def icon(self):
@@ -41,13 +46,7 @@ class ThermiaHotWaterBoostSwitch(
     @property
     def device_info(self):
         """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.data.heat_pumps[self.idx].id)},
-            "name": self.coordinator.data.heat_pumps[self.idx].name,
-            "manufacturer": "Thermia",
-            "model": self.coordinator.data.heat_pumps[self.idx].model,
-            "model_id": self.coordinator.data.heat_pumps[self.idx].model_id,
-        }
+        return self.coordinator.descriptors[self.idx].device_info
 
     @property
     def device_class(self):
@@ -57,25 +56,27 @@ class ThermiaHotWaterBoostSwitch(
     @property
     def is_on(self):
         """Return true if switch is on."""
-        return (
-            self.coordinator.data.heat_pumps[self.idx].hot_water_boost_switch_state == 1
-        )
+        return self.coordinator.value(self.idx, "hot_water_boost_switch_state") == 1
 
     async def async_turn_on(self, **kwargs):
         """Turn on the switch."""
-        await self.hass.async_add_executor_job(
-            lambda: self.coordinator.data.heat_pumps[
-                self.idx
-            ].set_hot_water_boost_switch_state(1)
+        await self.coordinator.async_write_optimistic(
+            self.idx,
+            "hot_water_boost_switch_state",
+            1,
+            partial(self.coordinator.client.async_set_hot_water_boost_switch_state, self.idx, 1),
         )
+        await self.coordinator.async_request_refresh_after_write()
 
     async def async_turn_off(self, **kwargs):
         """Turn off the switch."""
-        await self.hass.async_add_executor_job(
-            lambda: self.coordinator.data.heat_pumps[
-                self.idx
-            ].set_hot_water_boost_switch_state(0)
+        await self.coordinator.async_write_optimistic(
+            self.idx,
+            "hot_water_boost_switch_state",
+            0,
+            partial(self.coordinator.client.async_set_hot_water_boost_switch_state, self.idx, 0),
         )
+        await self.coordinator.async_request_refresh_after_write()
 
     async def async_toggle(self, **kwargs):
         """Toggle the switch."""
@@ -0,0 +1,130 @@
+"""Recent numeric samples of the Thermia heat pumps, kept in memory."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+import math
+from typing import Any, Iterable
+
+from .const import TELEMETRY_SAMPLES
+from .descriptions import SENSOR_DESCRIPTIONS
+from .snapshot import HeatPumpSnapshot, ThermiaSnapshot
+
+# Every sensor attribute; all of them are numeric
+TELEMETRY_ATTRIBUTES = tuple(
+    sorted(description.key for description in SENSOR_DESCRIPTIONS)
+)
+
+_MISSING = math.nan
+
+
+class TelemetryBuffer:
+    """Ring buffer of the last ``capacity`` samples of one heat pump.
+
+    Samples are stored column-wise, one array of doubles for the timestamps
+    and one per attribute, all allocated up front, so the memory footprint
+    is fixed at ``capacity * (len(attributes) + 1) * 8`` bytes. Values that
+    are missing, not numeric or were not fetched are stored as NaN.
+    """
+
+    __slots__ = ("capacity", "attributes", "timestamps", "columns", "head", "size")
+
+    def __init__(
+        self,
+        capacity: int = TELEMETRY_SAMPLES,
+        attributes: Iterable[str] = TELEMETRY_ATTRIBUTES,
+    ) -> None:
+        self.capacity = capacity
+        self.attributes: tuple[str, ...] = tuple(attributes)
+        self.timestamps = array("d", bytes(8 * capacity))
+        self.columns: dict[str, array] = {
+            attribute: array("d", bytes(8 * capacity))
+            for attribute in self.attributes
+        }
+        # Slot the next sample goes to and the number of samples kept
+        self.head: int = 0
+        self.size: int = 0
+
+    @property
+    def nbytes(self) -> int:
+        """Return the memory taken by the samples."""
+        return self.capacity * (len(self.columns) + 1) * 8
+
+    def append(self, timestamp: float, heat_pump: HeatPumpSnapshot) -> None:
+        """Add the values of ``heat_pump``, overwriting the oldest sample."""
+        if self.size and timestamp < self.timestamps[self.head - 1]:
+            # Keep the timestamps sorted for the binary search of ``slice``
+            timestamp = self.timestamps[self.head - 1]
+
+        slot = self.head
+        self.timestamps[slot] = timestamp
+        values = heat_pump.values
+        unavailable = heat_pump.unavailable
+        for attribute, column in self.columns.items():
+            value = values.get(attribute)
+            column[slot] = (
+                value
+                if isinstance(value, (int, float))
+                and not isinstance(value, bool)
+                and attribute not in unavailable
+                else _MISSING
+            )
+
+        self.head = (slot + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def _segments(self) -> tuple[tuple[int, int], ...]:
+        """Return the slot ranges holding the samples, oldest first."""
+        if self.size < self.capacity:
+            return ((0, self.size),)
+        return ((self.head, self.capacity), (0, self.head))
+
+    def slice(
+        self,
+        start: float | None = None,
+        end: float | None = None,
+        attributes: Iterable[str] | None = None,
+    ) -> dict[str, Any]:
+        """Return the samples taken from ``start`` up to ``end``, column-wise.
+
+        The result has a ``timestamps`` list of POSIX timestamps and a list of
+        values per attribute, with ``None`` for missing values.
+        """
+        columns = [
+            (attribute, self.columns[attribute])
+            for attribute in (self.attributes if attributes is None else attributes)
+            if attribute in self.columns
+        ]
+        result: dict[str, Any] = {
+            "timestamps": [],
+            "attributes": {attribute: [] for attribute, _ in columns},
+        }
+        for lo, hi in self._segments():
+            # Every segment is sorted by timestamp
+            first = lo if start is None else bisect_left(self.timestamps, start, lo, hi)
+            last = hi if end is None else bisect_right(self.timestamps, end, lo, hi)
+            if first >= last:
+                continue
+            result["timestamps"].extend(self.timestamps[first:last])
+            for attribute, column in columns:
+                result["attributes"][attribute].extend(
+                    None if math.isnan(value) else value
+                    for value in column[first:last]
+                )
+        return result
+
+
+class TelemetryRecorder:
+    """Telemetry buffers of every heat pump of an account, by heat pump ID."""
+
+    def __init__(self, capacity: int = TELEMETRY_SAMPLES) -> None:
+        self.capacity = capacity
+        self.buffers: dict[str, TelemetryBuffer] = {}
+
+    def record(self, timestamp: float, snapshot: ThermiaSnapshot) -> None:
+        """Add a sample of every heat pump in ``snapshot``."""
+        for heat_pump in snapshot.heat_pumps:
+            if (buffer := self.buffers.get(heat_pump.id)) is None:
+                buffer = self.buffers[heat_pump.id] = TelemetryBuffer(self.capacity)
+            buffer.append(timestamp, heat_pump)
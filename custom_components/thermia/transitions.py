@@ -0,0 +1,137 @@
+"""State transitions of the operational statuses, kept in memory."""
+
+from __future__ import annotations
+
+from array import array
+from collections import deque
+
+from .const import TRANSITION_LOG_SIZE
+from .snapshot import ThermiaSnapshot
+
+
+class TransitionLog:
+    """Ring buffer of the last ``capacity`` transitions of one status.
+
+    A transition is the time the status changed and whether it started or
+    stopped running, stored in two arrays allocated up front, so a log takes
+    ``capacity * 9`` bytes whatever the uptime. The first state seen is only
+    remembered as ``running``: when it began is not known. Entries therefore
+    alternate between started and stopped.
+
+    The starts and the shortest run within a sliding window are kept up to
+    date as transitions come in and leave the window: a running count of the
+    starts, and a deque of the runs that can still become the shortest one,
+    their durations increasing from front to back. Neither is found by
+    walking the log again, so a poll costs O(1) amortized.
+    """
+
+    __slots__ = (
+        "capacity",
+        "timestamps",
+        "states",
+        "head",
+        "size",
+        "running",
+        "_in_window",
+        "_starts",
+        "_started",
+        "_runs",
+    )
+
+    def __init__(self, capacity: int = TRANSITION_LOG_SIZE) -> None:
+        self.capacity = capacity
+        self.timestamps = array("d", bytes(8 * capacity))
+        self.states = array("b", bytes(capacity))
+        # Slot the next transition goes to and the number of transitions kept
+        self.head: int = 0
+        self.size: int = 0
+        self.running: bool | None = None
+        # Newest transitions still in the window and the starts among them
+        self._in_window: int = 0
+        self._starts: int = 0
+        # Time of the last start, and end time and duration of the runs that
+        # are shorter than every run that ended after them
+        self._started: float | None = None
+        self._runs: deque[tuple[float, float]] = deque()
+
+    def observe(self, timestamp: float, running: bool) -> bool:
+        """Take in the state seen at ``timestamp``; return True if it changed."""
+        if self.running is None or self.running == running:
+            self.running = running
+            return False
+        self.running = running
+
+        if self._in_window == self.capacity:
+            # The oldest transition in the window is overwritten
+            self._in_window -= 1
+            self._starts -= self.states[self.head]
+        self.timestamps[self.head] = timestamp
+        self.states[self.head] = running
+        self.head = (self.head + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+        self._in_window += 1
+        self._starts += running
+
+        if running:
+            self._started = timestamp
+        elif self._started is not None:
+            run = timestamp - self._started
+            while self._runs and self._runs[-1][1] >= run:
+                self._runs.pop()
+            self._runs.append((timestamp, run))
+        return True
+
+    def _expire(self, since: float) -> None:
+        """Drop the transitions and runs at or before ``since`` from the
+        window; ``since`` never goes back between calls."""
+        while self._in_window:
+            slot = (self.head - self._in_window) % self.capacity
+            if self.timestamps[slot] > since:
+                break
+            self._starts -= self.states[slot]
+            self._in_window -= 1
+        while self._runs and self._runs[0][0] <= since:
+            self._runs.popleft()
+
+    def starts(self, since: float) -> int:
+        """Return how often the status started running since ``since``."""
+        self._expire(since)
+        return self._starts
+
+    def shortest_run(self, since: float) -> float | None:
+        """Return the duration of the shortest run that ended since ``since``.
+
+        Runs that started before the first transition seen are not counted.
+        """
+        self._expire(since)
+        return self._runs[0][1] if self._runs else None
+
+
+class TransitionRecorder:
+    """Transition logs of every operational status of every heat pump."""
+
+    def __init__(self, capacity: int = TRANSITION_LOG_SIZE) -> None:
+        self.capacity = capacity
+        self.logs: dict[tuple[str, str], TransitionLog] = {}
+
+    def record(self, timestamp: float, snapshot: ThermiaSnapshot) -> None:
+        """Log the statuses of a poll that changed since the last one."""
+        for heat_pump in snapshot.heat_pumps:
+            running = heat_pump.values.get("running_operational_statuses")
+            available = heat_pump.values.get("available_operational_statuses")
+            if (
+                running is None
+                or available is None
+                or not heat_pump.fetched("running_operational_statuses")
+            ):
+                continue
+            for status in available:
+                if (log := self.logs.get((heat_pump.id, status))) is None:
+                    log = self.logs[(heat_pump.id, status)] = TransitionLog(
+                        self.capacity
+                    )
+                log.observe(timestamp, status in running)
+
+    def log(self, heat_pump_id: str, status: str) -> TransitionLog | None:
+        """Return the transition log of ``status`` of a heat pump."""
+        return self.logs.get((heat_pump_id, status))
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import partial
 import logging
 
 from homeassistant.components.water_heater import (
@@ -13,10 +14,10 @@ from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
-
 from .const import DOMAIN
 from .coordinator import ThermiaDataUpdateCoordinator
+from .entity import ThermiaEntity
+from .snapshot import EntityWatch
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -44,11 +45,28 @@ async def async_setup_entry(
 # Francis - new device which allows for the control of hot water 
 # requires user to have installer priverlidges on their login so that they can see more parameters from the Thermia 
 
-class StartWaterHeater ( CoordinatorEntity[ThermiaDataUpdateCoordinator], WaterHeaterEntity
+class StartWaterHeater ( ThermiaEntity, WaterHeaterEntity
 ):
     def __init__(self, coordinator: ThermiaDataUpdateCoordinator, idx: int):
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator,
+            EntityWatch(
+                idx,
+                frozenset(
+                    {
+                        "start_hot_water_temperature",
+                        "weighted_hot_water_temperature",
+                        "name",
+                    }
+                ),
+            ),
+        )
         self.idx = idx
+
+    @property
+    def available(self):
+        """Return True if entity is available."""
+        return self._fetched("start_hot_water_temperature")
         
     @property
     def name(self):
@@ -58,7 +76,7 @@ class StartWaterHeater ( CoordinatorEntity[ThermiaDataUpdateCoordinator], WaterH
     @property
     def unique_id(self):
         """Return a unique ID."""
-        return self.coordinator.data.heat_pumps[self.idx].id + "A"
+        return self.coordinator.descriptors[self.idx].id + "A"
         
     @property
     def icon(self):
@@ -83,7 +101,7 @@ class StartWaterHeater ( CoordinatorEntity[ThermiaDataUpdateCoordinator], WaterH
     def target_temperature(self):
         """Return the start temp setting."""
         ## this will be the start temp value 
-        return self.coordinator.data.heat_pumps[self.idx].start_hot_water_temperature
+        return self.coordinator.value(self.idx, "start_hot_water_temperature")
         
     @property
     def current_temperature(self):
@@ -107,10 +125,19 @@ class StartWaterHeater ( CoordinatorEntity[ThermiaDataUpdateCoordinator], WaterH
         target_temp = kwargs.get(ATTR_TEMPERATURE)
         _LOGGER.info("start water target temperature update : %s", target_temp)
         if target_temp is not None:
-            await self.hass.async_add_executor_job(
-                lambda: self.coordinator.data.heat_pumps[self.idx].set_hot_water_start_temperature(
-                    target_temp
-                )
+            await self.coordinator.async_write_optimistic(
+                self.idx,
+                "start_hot_water_temperature",
+                target_temp,
+                partial(
+                    self.coordinator.writes.async_write,
+                    (self.idx, "hot_water_start_temperature"),
+                    partial(
+                        self.coordinator.client.async_set_hot_water_start_temperature,
+                        self.idx,
+                        target_temp,
+                    ),
+                ),
             )
         else:
             _LOGGER.error("A target temperature must be provided")
@@ -118,41 +145,54 @@ class StartWaterHeater ( CoordinatorEntity[ThermiaDataUpdateCoordinator], WaterH
     @property
     def device_info(self):
         """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.data.heat_pumps[self.idx].id)},
-            "name": self.coordinator.data.heat_pumps[self.idx].name,
-            "manufacturer": "Thermia",
-            "model": self.coordinator.data.heat_pumps[self.idx].model,
-            "model_id": self.coordinator.data.heat_pumps[self.idx].model_id,
-        }
+        return self.coordinator.descriptors[self.idx].device_info
 
     
 ################################################
 # Francis - this is the original water heater - it controls the ROOM temprature setting 
 # 
-class ThermiaWaterHeater(
-    CoordinatorEntity[ThermiaDataUpdateCoordinator], WaterHeaterEntity
-):
+class ThermiaWaterHeater(ThermiaEntity, WaterHeaterEntity):
     """Representation of an Thermia water heater."""
 
     def __init__(self, coordinator: ThermiaDataUpdateCoordinator, idx: int):
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator,
+            EntityWatch(
+                idx,
+                frozenset(
+                    {
+                        "is_online",
+                        "name",
+                        "heat_min_temperature_value",
+                        "heat_max_temperature_value",
+                        "indoor_temperature",
+                        "heat_temperature",
+                        "operation_mode",
+                        "available_operation_modes",
+                        "is_operation_mode_read_only",
+                    }
+                ),
+            ),
+        )
         self.idx = idx
 
     @property
     def available(self):
         """Return True if entity is available."""
-        return self.coordinator.data.heat_pumps[self.idx].is_online
+        return (
+            self._fetched("heat_temperature", "operation_mode")
+            and self.coordinator.data.heat_pumps[self.idx].is_online
+        )
 
     @property
     def name(self):
         """Return the name of the water heater."""
-        return self.coordinator.data.heat_pumps[self.idx].name
+        return self.coordinator.descriptors[self.idx].name
 
     @property
     def unique_id(self):
         """Return a unique ID."""
-        return self.coordinator.data.heat_pumps[self.idx].id 
+        return self.coordinator.descriptors[self.idx].id 
 
     @property
     def icon(self):
@@ -162,13 +202,7 @@ class ThermiaWaterHeater(
     @property
     def device_info(self):
         """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.data.heat_pumps[self.idx].id)},
-            "name": self.coordinator.data.heat_pumps[self.idx].name,
-            "manufacturer": "Thermia",
-            "model": self.coordinator.data.heat_pumps[self.idx].model,
-            "model_id": self.coordinator.data.heat_pumps[self.idx].model_id,
-        }
+        return self.coordinator.descriptors[self.idx].device_info
 
     @property
     def min_temp(self):
@@ -212,7 +246,7 @@ class ThermiaWaterHeater(
     @property
     def target_temperature(self):
         """Return the temperature we try to reach."""
-        return self.coordinator.data.heat_pumps[self.idx].heat_temperature
+        return self.coordinator.value(self.idx, "heat_temperature")
 
     @property
     def temperature_unit(self):
@@ -222,7 +256,7 @@ class ThermiaWaterHeater(
     @property
     def current_operation(self):
         """Return current operation ie. eco, off, etc."""
-        return self.coordinator.data.heat_pumps[self.idx].operation_mode
+        return self.coordinator.value(self.idx, "operation_mode")
 
     @property
     def operation_list(self):
@@ -248,10 +282,23 @@ class ThermiaWaterHeater(
         """Set new target temperature."""
         target_temp = kwargs.get(ATTR_TEMPERATURE)
         if target_temp is not None:
-            await self.hass.async_add_executor_job(
-                lambda: self.coordinator.data.heat_pumps[self.idx].set_temperature(
-                    target_temp
-                )
+            client = self.coordinator.client
+            target_temp = client.validate_register(
+                self.idx, client.register_index(self.idx, "temperature"), target_temp
+            )
+            await self.coordinator.async_write_optimistic(
+                self.idx,
+                "heat_temperature",
+                target_temp,
+                partial(
+                    self.coordinator.writes.async_write,
+                    (self.idx, "temperature"),
+                    partial(
+                        self.coordinator.client.async_set_temperature,
+                        self.idx,
+                        target_temp,
+                    ),
+                ),
             )
         else:
             _LOGGER.error("A target temperature must be provided")
@@ -259,10 +306,16 @@ class ThermiaWaterHeater(
     async def async_set_operation_mode(self, operation_mode):
         """Set operation mode."""
         if operation_mode is not None:
-            await self.hass.async_add_executor_job(
-                lambda: self.coordinator.data.heat_pumps[self.idx].set_operation_mode(
-                    operation_mode
-                )
+            await self.coordinator.async_write_optimistic(
+                self.idx,
+                "operation_mode",
+                operation_mode,
+                partial(
+                    self.coordinator.client.async_set_operation_mode,
+                    self.idx,
+                    operation_mode,
+                ),
             )
+            await self.coordinator.async_request_refresh_after_write()
         else:
             _LOGGER.error("An operation mode must be provided")
@@ -0,0 +1,102 @@
+"""Coalescing of rapid register writes."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from datetime import datetime
+from functools import partial
+import logging
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+Write = Callable[[], Awaitable[None]]
+CallLater = Callable[[float, Callable[[datetime], None]], CALLBACK_TYPE]
+
+
+class WriteQueue:
+    """Register writes of one account, coalesced and debounced.
+
+    A slider sets a value for every step it passes. Writes are kept per
+    register until none arrived for ``window`` seconds; then only the last
+    value of each register is posted, followed by one refresh. Every caller
+    waits for the write that superseded its own and sees its error, if any.
+    ``call_later`` schedules the debounce timer and defaults to Home
+    Assistant's ``async_call_later``.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        window: float,
+        refresh: Callable[[], Awaitable[None]],
+        call_later: CallLater | None = None,
+    ):
+        self.hass = hass
+        self.window = window
+        self._refresh = refresh
+        self._call_later = call_later or partial(async_call_later, hass)
+        self._pending: dict[Hashable, tuple[Write, asyncio.Future[None]]] = {}
+        self._lock = asyncio.Lock()
+        self._unsub_timer: CALLBACK_TYPE | None = None
+        self.submitted: int = 0
+        self.written: int = 0
+
+    async def async_write(self, key: Hashable, write: Write) -> None:
+        """Queue ``write`` for the register ``key`` and wait until it is done."""
+        self.submitted += 1
+        if (pending := self._pending.get(key)) is not None:
+            future = pending[1]
+        else:
+            future = self.hass.loop.create_future()
+        self._pending[key] = (write, future)
+
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+        self._unsub_timer = self._call_later(self.window, self._async_due)
+
+        await asyncio.shield(future)
+
+    @callback
+    def _async_due(self, _now: datetime) -> None:
+        self._unsub_timer = None
+        self.hass.async_create_task(self.async_flush(), f"{DOMAIN} register writes")
+
+    async def async_flush(self, refresh: bool = True) -> None:
+        """Post the last queued value of every register now."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+        async with self._lock:
+            pending, self._pending = self._pending, {}
+            if not pending:
+                return
+
+            written = False
+            for key, (write, future) in pending.items():
+                try:
+                    await write()
+                except Exception as exception:  # noqa: BLE001
+                    future.set_exception(exception)
+                    # Retrieved here in case every caller gave up waiting
+                    future.exception()
+                else:
+                    future.set_result(None)
+                    written = True
+                    self.written += 1
+
+            _LOGGER.debug(
+                "Wrote %s registers (%s writes requested so far, %s posted)",
+                len(pending),
+                self.submitted,
+                self.written,
+            )
+
+            if written and refresh:
+                await self._refresh()
@@ -0,0 +1,96 @@
+"""State writes per day of the measurement sensors by aggregation mode.
+
+Feeds a synthetic day of polls, slowly drifting temperatures with a tenth of
+a degree of jitter, through the aggregation stage in every mode and counts
+the values it publishes, against every change being written as before.
+``raw`` only filters the sensors with a deadband in their description. Every
+published value is a state write and a recorder row.
+
+    python -m scripts.benchmark.bench_aggregation --hours 24 --interval 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import time
+from types import MappingProxyType
+
+from custom_components.thermia.aggregation import (
+    AGGREGATED_ATTRIBUTES,
+    AggregationStage,
+)
+from custom_components.thermia.const import AGGREGATION_MODES, AGGREGATION_RAW
+from custom_components.thermia.snapshot import (
+    SNAPSHOT_ATTRIBUTES,
+    HeatPumpSnapshot,
+    ThermiaSnapshot,
+)
+
+
+def _polls(hours: float, interval: float) -> list[tuple[float, ThermiaSnapshot]]:
+    rng = random.Random(1)
+    polls = []
+    for poll in range(int(hours * 3600 / interval)):
+        t = poll * interval
+        values = {
+            attribute: round(
+                20
+                + 10 * math.sin(t / 3600 + offset)
+                + rng.choice((-0.1, 0.0, 0.1)),
+                1,
+            )
+            for offset, attribute in enumerate(SNAPSHOT_ATTRIBUTES)
+        }
+        heat_pump = HeatPumpSnapshot(
+            id="1000",
+            name="Heat Pump",
+            model=None,
+            model_id=None,
+            values=MappingProxyType(values),
+        )
+        polls.append((t, ThermiaSnapshot(connected=True, heat_pumps=(heat_pump,))))
+    return polls
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hours", type=float, default=24)
+    parser.add_argument("--interval", type=float, default=10)
+    parser.add_argument("--window", type=float, default=60)
+    parser.add_argument("--deadband", type=float, default=0.2)
+    args = parser.parse_args()
+
+    polls = _polls(args.hours, args.interval)
+    baseline = None
+    for mode in (None, *AGGREGATION_MODES):
+        now = 0.0
+        stage = AggregationStage(
+            mode or AGGREGATION_RAW, args.window, args.deadband, lambda: now
+        )
+        writes = 0
+        previous = None
+        start = time.perf_counter()
+        for now, snapshot in polls:
+            stage.process(snapshot)
+            changed = (snapshot.diff(previous) or {}).get(0, frozenset())
+            for attribute in AGGREGATED_ATTRIBUTES:
+                if mode is not None and stage.handles(attribute):
+                    writes += ("1000", attribute) in stage.updated
+                else:
+                    writes += attribute in changed
+            previous = snapshot
+        elapsed = time.perf_counter() - start
+        per_sensor_day = writes / len(AGGREGATED_ATTRIBUTES) / args.hours * 24
+        baseline = baseline or per_sensor_day
+        print(
+            f"mode={mode or 'unfiltered':10s} "
+            f"writes/sensor/day={per_sensor_day:7.0f} "
+            f"({per_sensor_day / baseline:6.1%} of unfiltered) "
+            f"cost={elapsed / len(polls) * 1e6:6.1f}us/poll"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Perceived control latency of switches and water heaters.
+
+Sets up a config entry against the mock server and, for each control, times
+how long a service call takes until the entity state shows the new value and
+until the call returns. The cloud latency is injected with ``--latency`` and
+the polls in between are counted.
+
+    python -m scripts.benchmark.bench_control --repeats 10 --latency 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import statistics
+import tempfile
+import time
+
+from aiohttp import ClientSession
+
+from custom_components.thermia.const import CONF_WRITE_DEBOUNCE, DOMAIN
+
+from .harness import async_start_hass, create_entry, patched_cloud
+from .mock_server import MockThermiaServer
+
+SWITCH_ID = "switch.heat_pump_1000_hot_water_boost"
+WATER_HEATER_ID = "water_heater.heat_pump_1000"
+
+
+async def _shown_after(hass, entity_id: str, shown, call) -> tuple[float, float]:
+    """Return seconds until ``shown(state)`` holds and until ``call`` returns."""
+    start = time.perf_counter()
+    task = hass.async_create_task(call)
+    while not shown(hass.states.get(entity_id)):
+        await asyncio.sleep(0.001)
+    visible = time.perf_counter() - start
+    await task
+    return visible, time.perf_counter() - start
+
+
+async def _run(args) -> None:
+    logging.basicConfig(level=logging.ERROR)
+    server = MockThermiaServer(pumps=1, latency=args.latency)
+    await server.start()
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = await async_start_hass(config_dir)
+        entry = create_entry(options={CONF_WRITE_DEBOUNCE: args.debounce})
+        async with ClientSession() as session:
+            with patched_cloud(server, session):
+                await hass.config_entries.async_add(entry)
+                await hass.async_block_till_done()
+                coordinator = hass.data[DOMAIN][entry.entry_id]
+
+                samples: dict[str, list[tuple[float, float]]] = {
+                    "switch": [],
+                    "water_heater": [],
+                }
+                for repeat in range(args.repeats):
+                    turn_on = hass.states.get(SWITCH_ID).state == "off"
+                    target = "on" if turn_on else "off"
+                    samples["switch"].append(
+                        await _shown_after(
+                            hass,
+                            SWITCH_ID,
+                            lambda state, target=target: state.state == target,
+                            hass.services.async_call(
+                                "switch",
+                                "turn_on" if turn_on else "turn_off",
+                                {"entity_id": SWITCH_ID},
+                                blocking=True,
+                            ),
+                        )
+                    )
+
+                    temperature = 18 + repeat % 6
+                    samples["water_heater"].append(
+                        await _shown_after(
+                            hass,
+                            WATER_HEATER_ID,
+                            lambda state, temperature=temperature: state.attributes.get(
+                                "temperature"
+                            )
+                            == temperature,
+                            hass.services.async_call(
+                                "water_heater",
+                                "set_temperature",
+                                {
+                                    "entity_id": WATER_HEATER_ID,
+                                    "temperature": temperature,
+                                },
+                                blocking=True,
+                            ),
+                        )
+                    )
+
+                for control, timings in samples.items():
+                    print(
+                        f"{control:13s} shown_median="
+                        f"{statistics.median(t[0] for t in timings) * 1000:8.1f}ms "
+                        f"call_median="
+                        f"{statistics.median(t[1] for t in timings) * 1000:8.1f}ms"
+                    )
+                optimistic = coordinator.optimistic
+                print(
+                    f"confirmed={optimistic.confirmed} reverted={optimistic.reverted} "
+                    f"conflicts={optimistic.conflicts} requests={server.requests}"
+                )
+                await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_stop(force=True)
+
+    await server.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeats", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--debounce", type=float, default=1.5)
+    asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
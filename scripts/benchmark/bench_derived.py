@@ -0,0 +1,112 @@
+"""Cost per poll of the derived metrics, incremental against recomputed.
+
+Feeds a synthetic day of polls, with the compressor cycling on and off,
+through the derived metrics stage and through a recomputation of the duty
+cycle and starts from every recorded state on each poll, the way a template
+or statistics sensor over the recorder history does, and checks that both
+agree.
+
+    python -m scripts.benchmark.bench_derived --hours 24 --interval 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import time
+from types import MappingProxyType
+
+from custom_components.thermia.const import COMPRESSOR_OPERATIONAL_STATUS
+from custom_components.thermia.derived import DerivedMetrics
+from custom_components.thermia.snapshot import HeatPumpSnapshot, ThermiaSnapshot
+
+
+def _polls(hours: float, interval: float) -> list[tuple[float, ThermiaSnapshot]]:
+    rng = random.Random(1)
+    polls = []
+    running = False
+    for poll in range(int(hours * 3600 / interval)):
+        t = poll * interval
+        if rng.random() < interval / 900:
+            running = not running
+        values = {
+            "supply_line_temperature": 35 + 5 * math.sin(t / 3600),
+            "return_line_temperature": 30 + 4 * math.sin(t / 3600),
+            "brine_in_temperature": 2 + rng.choice((-0.1, 0.0, 0.1)),
+            "brine_out_temperature": -1 + rng.choice((-0.1, 0.0, 0.1)),
+            "available_operational_statuses": (COMPRESSOR_OPERATIONAL_STATUS,),
+            "running_operational_statuses": (COMPRESSOR_OPERATIONAL_STATUS,)
+            if running
+            else (),
+        }
+        heat_pump = HeatPumpSnapshot(
+            id="1000",
+            name="Heat Pump",
+            model=None,
+            model_id=None,
+            values=MappingProxyType(values),
+        )
+        polls.append((t, ThermiaSnapshot(connected=True, heat_pumps=(heat_pump,))))
+    return polls
+
+
+def _recompute(
+    states: list[tuple[float, bool]], now: float, window: float
+) -> tuple[float | None, int]:
+    cutoff = now - window
+    total = on = 0.0
+    starts = 0
+    for (start, running), (end, next_running) in zip(states, states[1:]):
+        if end <= cutoff:
+            continue
+        covered = end - max(start, cutoff)
+        total += covered
+        on += covered if running else 0
+        starts += next_running and not running
+    return (round(on / total * 100, 1) if total else None), starts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hours", type=float, default=24)
+    parser.add_argument("--interval", type=float, default=10)
+    parser.add_argument("--window", type=float, default=3600)
+    args = parser.parse_args()
+
+    polls = _polls(args.hours, args.interval)
+    now = 0.0
+    stage = DerivedMetrics(args.window, lambda: now)
+    start = time.perf_counter()
+    incremental = []
+    for now, snapshot in polls:
+        stage.process(snapshot)
+        incremental.append(
+            (
+                stage.value("1000", "compressor_duty_cycle"),
+                stage.value("1000", "compressor_starts"),
+            )
+        )
+    incremental_elapsed = time.perf_counter() - start
+
+    states: list[tuple[float, bool]] = []
+    start = time.perf_counter()
+    recomputed = []
+    for now, snapshot in polls:
+        statuses = snapshot.heat_pumps[0].running_operational_statuses
+        states.append((now, COMPRESSOR_OPERATIONAL_STATUS in statuses))
+        recomputed.append(_recompute(states, now, args.window))
+    recomputed_elapsed = time.perf_counter() - start
+
+    mismatches = sum(
+        a != b for a, b in zip(incremental, recomputed) if a[0] is not None
+    )
+    print(f"polls={len(polls)} window={args.window:.0f}s")
+    print(f"incremental cost={incremental_elapsed / len(polls) * 1e6:8.1f}us/poll")
+    print(f"recomputed  cost={recomputed_elapsed / len(polls) * 1e6:8.1f}us/poll")
+    print(f"updated metrics on the last poll={len(stage.updated)}")
+    print(f"mismatches={mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Load of many config entries on one Thermia Online host.
+
+Sets up ``--entries`` config entries spread over ``--accounts`` logins, all
+against one mock server, and lets them poll for ``--seconds``. Runs once with
+the shared hub and once with every entry on its own client and in the same
+poll phase, like before the hub, and reports logins, requests, the peak of
+concurrent requests and the busiest second.
+
+    python -m scripts.benchmark.bench_entries --entries 50 --accounts 10 --seconds 60
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter
+from contextlib import nullcontext
+import logging
+import tempfile
+import time
+from unittest.mock import patch
+
+from aiohttp import ClientSession
+
+from custom_components.thermia.auth import async_get_token_store
+from custom_components.thermia.client import ThermiaClient
+from custom_components.thermia.hub import ThermiaHub
+
+from .harness import async_start_hass, create_entry, patched_cloud
+from .mock_server import MockThermiaServer
+
+
+def _isolated_acquire(hub: ThermiaHub, username: str, password: str) -> ThermiaClient:
+    """Client per entry, as every entry had before the hub."""
+    return ThermiaClient(
+        hub.hass, username, password, tokens=async_get_token_store(hub.hass)
+    )
+
+
+async def _load(args, shared: bool) -> dict:
+    server = MockThermiaServer(pumps=args.pumps, latency=args.latency)
+    await server.start()
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = await async_start_hass(config_dir)
+        entries = [
+            create_entry(username=f"account{idx % args.accounts}")
+            for idx in range(args.entries)
+        ]
+        async with ClientSession() as session:
+            with patched_cloud(server, session):
+                if shared:
+                    isolated = nullcontext()
+                else:
+                    isolated = patch.multiple(
+                        ThermiaHub,
+                        async_acquire=_isolated_acquire,
+                        async_release=lambda hub, client: client.close(),
+                        async_next_phase=lambda hub, interval=0: 0.0,
+                    )
+                with isolated:
+                    start = time.perf_counter()
+                    await asyncio.gather(
+                        *(hass.config_entries.async_add(entry) for entry in entries)
+                    )
+                    await hass.async_block_till_done()
+                    setup = time.perf_counter() - start
+
+                    requests_before = server.requests
+                    polling_since = time.monotonic()
+                    await asyncio.sleep(args.seconds)
+
+                    busiest = Counter(
+                        int(at - polling_since)
+                        for at in server.request_times
+                        if at >= polling_since
+                    )
+                    result = {
+                        "setup": setup,
+                        "logins": server.logins,
+                        "requests": server.requests - requests_before,
+                        "peak_in_flight": server.peak_in_flight,
+                        "busiest_second": max(busiest.values(), default=0),
+                    }
+                    for entry in entries:
+                        await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_stop(force=True)
+
+    await server.stop()
+    return result
+
+
+async def _run(args) -> None:
+    logging.basicConfig(level=logging.ERROR)
+    for shared in (False, True):
+        result = await _load(args, shared)
+        print(
+            f"{'shared' if shared else 'isolated':8s} entries={args.entries} "
+            f"accounts={args.accounts} setup={result['setup']:6.2f}s "
+            f"logins={result['logins']:3d} "
+            f"requests/min={result['requests'] * 60 / args.seconds:8.1f} "
+            f"peak_in_flight={result['peak_in_flight']:3d} "
+            f"busiest_second={result['busiest_second']:4d}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=50)
+    parser.add_argument("--accounts", type=int, default=10)
+    parser.add_argument("--pumps", type=int, default=1)
+    parser.add_argument("--seconds", type=float, default=60)
+    parser.add_argument("--latency", type=float, default=0.05)
+    asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
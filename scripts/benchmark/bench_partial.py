@@ -0,0 +1,81 @@
+"""Outages caused by a flaky register group.
+
+Polls the mock server while ``--group`` fails with ``--error-rate``. For
+every cycle it counts whether the poll as a whole failed, which previously
+happened on any error, and how many attributes went unavailable, and reports
+the requests spent on retries.
+
+    python -m scripts.benchmark.bench_partial --pumps 2 --cycles 200 --error-rate 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from aiohttp import ClientSession
+
+from custom_components.thermia import client as client_module
+from custom_components.thermia.snapshot import SNAPSHOT_ATTRIBUTES
+
+from .mock_server import MockThermiaServer
+
+
+async def _run(args) -> None:
+    server = MockThermiaServer(
+        pumps=args.pumps, error_rate=args.error_rate, flaky_groups=(args.group,)
+    )
+    await server.start()
+
+    async with ClientSession() as session:
+        hass = SimpleNamespace(loop=asyncio.get_running_loop())
+        with (
+            patch.object(client_module, "Thermia", lambda *_: server.connect()),
+            patch.object(client_module, "async_get_clientsession", lambda _: session),
+        ):
+            client = client_module.ThermiaClient(hass, "benchmark", "benchmark")
+            await client.async_login()
+
+        # Learn the request plan without errors
+        error_rate, server.error_rate = server.error_rate, 0.0
+        await client.async_update_data()
+        server.error_rate = error_rate
+        requests_before = server.requests
+
+        degraded = failed = unavailable = 0
+        for _ in range(args.cycles):
+            client.mark_stale()
+            try:
+                await client.async_update_data()
+            except Exception:  # noqa: BLE001
+                failed += 1
+                continue
+            degraded += client.degraded
+            unavailable += sum(map(len, client.unavailable().values()))
+
+        client.close()
+
+    await server.stop()
+    attributes = len(SNAPSHOT_ATTRIBUTES) * args.pumps
+    print(
+        f"group={args.group} error_rate={args.error_rate:.2f} "
+        f"cycles={args.cycles} failed_cycles={failed} "
+        f"degraded_cycles={degraded} (all-or-nothing would fail these too) "
+        f"unavailable_share={unavailable / (attributes * args.cycles):6.1%} "
+        f"requests/cycle={(server.requests - requests_before) / args.cycles:5.1f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pumps", type=int, default=2)
+    parser.add_argument("--cycles", type=int, default=200)
+    parser.add_argument("--error-rate", type=float, default=0.2)
+    parser.add_argument("--group", default="REG_GROUP_OPERATIONAL_TIME")
+    asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Poll latency and executor use: blocking library vs native async client.
+
+Also prints the phase histograms the native client recorded.
+
+Run from the repository root inside the dev environment (scripts/setup.sh):
+
+    python -m scripts.benchmark.bench_poll --pumps 2 --cycles 50 --latency 0.02
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import statistics
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from aiohttp import ClientSession
+
+from custom_components.thermia import client as client_module
+
+from .mock_server import MockThermiaServer
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    """Executor standing in for Home Assistant's shared pool."""
+
+    submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+def percentile(samples: list[float], percent: float) -> float:
+    """Return the ``percent`` percentile of ``samples``."""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+
+async def _run(args) -> None:
+    loop = asyncio.get_running_loop()
+    shared = CountingExecutor(max_workers=8)
+    loop.set_default_executor(shared)
+
+    server = MockThermiaServer(pumps=args.pumps, latency=args.latency)
+    await server.start()
+
+    async with ClientSession() as session:
+        hass = SimpleNamespace(loop=loop)
+        with (
+            patch.object(client_module, "Thermia", lambda *_: server.connect()),
+            patch.object(client_module, "async_get_clientsession", lambda _: session),
+        ):
+            client = client_module.ThermiaClient(hass, "benchmark", "benchmark")
+            await client.async_login()
+
+        blocking = await loop.run_in_executor(None, server.connect)
+
+        async def native_poll() -> None:
+            # Every cycle fetches, however close together they run
+            client.mark_stale()
+            await client.async_update_data()
+
+        scenarios = {
+            "blocking, shared executor": lambda: loop.run_in_executor(
+                None, blocking.update_data
+            ),
+            "native client": native_poll,
+        }
+        for label, poll in scenarios.items():
+            await poll()
+            shared.submitted = client.executor_calls = 0
+            requests_before = server.requests
+            bytes_before = server.bytes_sent
+            latencies = []
+            for _ in range(args.cycles):
+                start = time.perf_counter()
+                await poll()
+                latencies.append(time.perf_counter() - start)
+
+            print(
+                f"{label:26} "
+                f"p50={statistics.median(latencies) * 1000:7.1f}ms "
+                f"p95={percentile(latencies, 95) * 1000:7.1f}ms "
+                f"requests/cycle={(server.requests - requests_before) / args.cycles:5.1f} "
+                f"bytes/cycle={(server.bytes_sent - bytes_before) // args.cycles:6d} "
+                f"shared_executor_jobs={shared.submitted} "
+                f"client_executor_jobs={client.executor_calls}"
+            )
+
+        # Where the native polls spent their time, as reported in diagnostics
+        for phase, histogram in sorted(client.metrics.histograms.items()):
+            print(
+                f"  {phase:42} count={histogram.count:5d} "
+                f"mean={histogram.total / histogram.count * 1000:7.2f}ms "
+                f"p95<={histogram.percentile(95) * 1000:7.1f}ms"
+            )
+
+        client.close()
+
+    await server.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pumps", type=int, default=1)
+    parser.add_argument("--cycles", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.02)
+    asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Poll latency by number of heat pumps, with slow and offline heat pumps.
+
+For every heat pump count, polls the mock server with the native client
+fetching one request at a time and with ``--parallel`` requests at once, and
+then with one slow and one offline heat pump added. Reports cycle latency
+percentiles and how many heat pumps had unavailable attributes per cycle.
+
+    python -m scripts.benchmark.bench_pumps --pumps 1 5 20 --latency 0.05
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from aiohttp import ClientSession
+
+from custom_components.thermia import client as client_module
+
+from .bench_poll import percentile
+from .mock_server import MockThermiaServer
+
+
+async def _cycles(args, pumps: int, parallel: int, faulty: bool) -> dict:
+    server = MockThermiaServer(
+        pumps=pumps + (2 if faulty else 0),
+        latency=args.latency,
+        slow_pumps=1 if faulty else 0,
+        slow_latency=args.timeout * 2,
+        offline_pumps=1 if faulty else 0,
+    )
+    await server.start()
+
+    latencies = []
+    failed = 0
+    async with ClientSession() as session:
+        hass = SimpleNamespace(loop=asyncio.get_running_loop())
+        with (
+            patch.object(client_module, "Thermia", lambda *_: server.connect()),
+            patch.object(client_module, "async_get_clientsession", lambda _: session),
+        ):
+            client = client_module.ThermiaClient(
+                hass,
+                "benchmark",
+                "benchmark",
+                max_parallel_fetches=parallel,
+                request_timeout=args.timeout,
+            )
+            await client.async_login()
+
+        # Learn the request plan before the faulty heat pumps start failing
+        offline, server.offline_devices = server.offline_devices, set()
+        slow, server.slow_devices = server.slow_devices, set()
+        await client.async_update_data()
+        server.offline_devices, server.slow_devices = offline, slow
+
+        for _ in range(args.cycles):
+            client.mark_stale()
+            start = time.perf_counter()
+            await client.async_update_data()
+            latencies.append(time.perf_counter() - start)
+            failed += sum(map(bool, client.unavailable().values()))
+
+        client.close()
+
+    await server.stop()
+    return {
+        "p50": statistics.median(latencies),
+        "p95": percentile(latencies, 95),
+        "failed": failed / args.cycles,
+    }
+
+
+async def _run(args) -> None:
+    for pumps in args.pumps:
+        for label, parallel, faulty in (
+            ("sequential", 1, False),
+            ("concurrent", args.parallel, False),
+            ("concurrent +slow +offline", args.parallel, True),
+        ):
+            result = await _cycles(args, pumps, parallel, faulty)
+            print(
+                f"pumps={pumps:3d} {label:26s} "
+                f"p50={result['p50'] * 1000:8.1f}ms "
+                f"p95={result['p95'] * 1000:8.1f}ms "
+                f"failed_pumps/cycle={result['failed']:4.1f}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pumps", type=int, nargs="+", default=[1, 5, 20])
+    parser.add_argument("--cycles", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--parallel", type=int, default=8)
+    parser.add_argument("--timeout", type=float, default=1.0)
+    asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Restart to entities available: without vs with a stored snapshot.
+
+Sets up a config entry on an empty config directory (first start, nothing
+stored), stops Home Assistant and starts it again on the same directory.
+For both starts it reports when the config entry was loaded with entities
+in place, and when the first fresh poll replaced any stale values.
+
+    python -m scripts.benchmark.bench_restart --pumps 2 --latency 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import tempfile
+import time
+
+from aiohttp import ClientSession
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant
+
+from custom_components.thermia.const import ATTR_STALE, DOMAIN
+
+from .harness import async_start_hass, create_entry, patched_cloud
+from .mock_server import MockThermiaServer
+
+
+def _entities_ready(hass: HomeAssistant) -> bool:
+    states = hass.states.async_all()
+    return bool(states) and all(state.state != STATE_UNAVAILABLE for state in states)
+
+
+def _entities_fresh(hass: HomeAssistant) -> bool:
+    return _entities_ready(hass) and not any(
+        state.attributes.get(ATTR_STALE) for state in hass.states.async_all()
+    )
+
+
+async def _start(
+    config_dir: str, server: MockThermiaServer, session: ClientSession, first: bool
+) -> dict:
+    hass = await async_start_hass(config_dir)
+    with patched_cloud(server, session):
+        start = time.perf_counter()
+        if first:
+            entry = create_entry()
+            await hass.config_entries.async_add(entry)
+        else:
+            (entry,) = hass.config_entries.async_entries(DOMAIN)
+            await hass.config_entries.async_setup(entry.entry_id)
+        loaded = time.perf_counter() - start
+        ready = loaded if _entities_ready(hass) else None
+
+        while not _entities_fresh(hass):
+            await asyncio.sleep(0.005)
+        fresh = time.perf_counter() - start
+
+        entities = len(hass.states.async_all())
+        await hass.async_stop()
+
+    return {"loaded": loaded, "ready": ready, "fresh": fresh, "entities": entities}
+
+
+async def _run(args) -> None:
+    logging.basicConfig(level=logging.ERROR)
+    server = MockThermiaServer(pumps=args.pumps, latency=args.latency)
+    await server.start()
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        async with ClientSession() as session:
+            for label, first in (("no stored snapshot", True), ("stored snapshot", False)):
+                result = await _start(config_dir, server, session, first)
+                ready = result["ready"]
+                print(
+                    f"{label:19} "
+                    f"setup={result['loaded'] * 1000:7.1f}ms "
+                    f"entities_available="
+                    f"{f'{ready * 1000:7.1f}ms' if ready is not None else '    n/a'} "
+                    f"fresh={result['fresh'] * 1000:7.1f}ms "
+                    f"entities={result['entities']}"
+                )
+
+    await server.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pumps", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0.2)
+    asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
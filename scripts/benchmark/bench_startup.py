@@ -0,0 +1,118 @@
+"""Cold start time of a config entry: lazy platform loading vs all platforms.
+
+Every sample runs in a fresh interpreter so platform modules are imported
+cold, like after a Home Assistant restart. Time is measured from adding the
+config entry until it is loaded and all entities are added.
+
+    python -m scripts.benchmark.bench_startup --pumps 1 --samples 5 --no-hot-water
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from unittest.mock import patch
+
+from aiohttp import ClientSession
+
+import custom_components.thermia as integration
+
+from .harness import async_start_hass, create_entry, patched_cloud
+from .mock_server import MockThermiaServer
+
+
+async def _measure(args) -> dict:
+    logging.basicConfig(level=logging.ERROR)
+    server = MockThermiaServer(pumps=args.pumps, hot_water=args.hot_water)
+    await server.start()
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = await async_start_hass(config_dir)
+        entry = create_entry()
+        async with ClientSession() as session:
+            with patched_cloud(server, session):
+                modules_before = len(sys.modules)
+                start = time.perf_counter()
+                await hass.config_entries.async_add(entry)
+                await hass.async_block_till_done()
+                elapsed = time.perf_counter() - start
+
+                result = {
+                    "seconds": elapsed,
+                    "entities": len(hass.states.async_all()),
+                    "platforms": sorted(hass.data[integration.DOMAIN][entry.entry_id].platforms),
+                    "modules_imported": len(sys.modules) - modules_before,
+                }
+                await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_stop(force=True)
+
+    await server.stop()
+    return result
+
+
+def _child(args) -> None:
+    if args.mode == "all":
+        with patch.object(
+            integration, "required_platforms", lambda snapshot: integration.PLATFORMS
+        ):
+            result = asyncio.run(_measure(args))
+    else:
+        result = asyncio.run(_measure(args))
+    print(json.dumps(result))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pumps", type=int, default=1)
+    parser.add_argument("--samples", type=int, default=5)
+    parser.add_argument(
+        "--no-hot-water",
+        dest="hot_water",
+        action="store_false",
+        help="heat pumps without hot water registers, so no switches",
+    )
+    parser.add_argument("--mode", choices=("lazy", "all"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        _child(args)
+        return
+
+    for mode in ("all", "lazy"):
+        results = []
+        for _ in range(args.samples):
+            command = [
+                sys.executable,
+                "-m",
+                "scripts.benchmark.bench_startup",
+                "--mode",
+                mode,
+                "--pumps",
+                str(args.pumps),
+            ]
+            if not args.hot_water:
+                command.append("--no-hot-water")
+            output = subprocess.run(
+                command, check=True, capture_output=True, text=True
+            ).stdout
+            results.append(json.loads(output.splitlines()[-1]))
+
+        print(
+            f"{mode:5} "
+            f"median={statistics.median(r['seconds'] for r in results) * 1000:7.1f}ms "
+            f"min={min(r['seconds'] for r in results) * 1000:7.1f}ms "
+            f"entities={results[-1]['entities']:4d} "
+            f"modules_imported={results[-1]['modules_imported']:4d} "
+            f"platforms={','.join(results[-1]['platforms'])}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""State write cost per entity, and the share spent on entity identity.
+
+Sets up every platform against snapshots of the mock server's heat pumps and
+times ``async_write_ha_state`` for each entity class. The identity columns
+compare rebuilding ``name``/``unique_id``/``device_info`` from the heat pump,
+as the entities used to, with reading them from the shared descriptor.
+
+    python -m scripts.benchmark.bench_state_write --pumps 2 --writes 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import defaultdict
+import logging
+import tempfile
+import time
+from types import SimpleNamespace
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.thermia import (
+    binary_sensor,
+    number,
+    sensor,
+    switch,
+    water_heater,
+)
+from custom_components.thermia.const import DOMAIN
+from custom_components.thermia.coordinator import ThermiaDataUpdateCoordinator
+from custom_components.thermia.device import refresh_descriptors
+from custom_components.thermia.snapshot import ThermiaSnapshot
+
+from .mock_server import MockThermiaServer
+
+PLATFORMS = {
+    "binary_sensor": binary_sensor,
+    "sensor": sensor,
+    "switch": switch,
+    "water_heater": water_heater,
+    "number": number,
+}
+
+
+def rebuilt_identity(heat_pumps, idx: int, entity_name: str) -> tuple:
+    """Identity properties the way entities computed them before descriptors."""
+    return (
+        f"{heat_pumps[idx].name} {entity_name}",
+        f"{heat_pumps[idx].name}_{entity_name.lower().replace(' ', '_')}",
+        {
+            "identifiers": {(DOMAIN, heat_pumps[idx].id)},
+            "name": heat_pumps[idx].name,
+            "manufacturer": "Thermia",
+            "model": heat_pumps[idx].model,
+            "model_id": heat_pumps[idx].model_id,
+        },
+    )
+
+
+def timed(func, count: int) -> float:
+    """Return the mean duration of ``func`` in microseconds."""
+    start = time.perf_counter()
+    for _ in range(count):
+        func()
+    return (time.perf_counter() - start) / count * 1e6
+
+
+async def _run(args) -> None:
+    # Entities are written without an entity platform, which HA warns about.
+    logging.getLogger("homeassistant.helpers.entity").setLevel(logging.ERROR)
+
+    server = MockThermiaServer(pumps=args.pumps)
+    await server.start()
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        loop = asyncio.get_running_loop()
+        thermia = await loop.run_in_executor(None, server.connect)
+        snapshot = ThermiaSnapshot.capture(thermia)
+
+        coordinator = ThermiaDataUpdateCoordinator(hass, SimpleNamespace())
+        coordinator.data = snapshot
+        coordinator.descriptors = refresh_descriptors((), snapshot.heat_pumps)
+        entry = SimpleNamespace(entry_id="benchmark")
+        hass.data[DOMAIN] = {entry.entry_id: coordinator}
+
+        entities = []
+        for domain, platform in PLATFORMS.items():
+            added = []
+            await platform.async_setup_entry(hass, entry, added.extend)
+            for entity in added:
+                entity.hass = hass
+                entity.entity_id = f"{domain}.benchmark_{len(entities)}"
+                entities.append(entity)
+
+        results = defaultdict(list)
+        for entity in entities:
+            write = timed(entity.async_write_ha_state, args.writes)
+            rebuilt = timed(
+                lambda: rebuilt_identity(
+                    snapshot.heat_pumps, entity.idx, str(entity.name)
+                ),
+                args.writes,
+            )
+            cached = timed(
+                lambda: (entity.name, entity.unique_id, entity.device_info),
+                args.writes,
+            )
+            results[type(entity).__name__].append((write, rebuilt, cached))
+
+        print(f"{len(entities)} entities, {args.writes} writes each")
+        for name, samples in sorted(results.items()):
+            count = len(samples)
+            print(
+                f"{name:46} n={count:3d} "
+                f"write={sum(s[0] for s in samples) / count:6.1f}us "
+                f"identity rebuilt={sum(s[1] for s in samples) / count:5.2f}us "
+                f"cached={sum(s[2] for s in samples) / count:5.2f}us"
+            )
+
+        await hass.async_stop(force=True)
+
+    await server.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pumps", type=int, default=1)
+    parser.add_argument("--writes", type=int, default=2000)
+    asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
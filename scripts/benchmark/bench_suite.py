@@ -0,0 +1,233 @@
+"""End-to-end benchmark suite of the integration, with regression checks.
+
+Runs the integration in a bare Home Assistant against the mock Thermia
+Online server, serving synthetic installations or the responses recorded in
+a debug report (``--recording``, the output of ``thermia.debug`` or a debug
+file of the ThermiaOnlineAPI test suite). The server runs on its own thread,
+so CPU time is that of the Home Assistant event loop thread alone. Reports:
+
+- setup time: ``async_setup_entry`` until every entity is added
+- latency percentiles and event loop CPU time per poll cycle
+- memory per entity, from tracemalloc over a second setup of the entry
+- state writes per minute at the fast poll interval
+- latency of the number, switch and water heater setters
+
+``--save`` writes the results as JSON; ``--compare`` checks them against a
+saved run and fails if a metric got worse by more than ``--tolerance``.
+
+    python -m scripts.benchmark.bench_suite --pumps 2 --save baseline.json
+    python -m scripts.benchmark.bench_suite --pumps 2 --compare baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import logging
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from aiohttp import ClientSession
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.thermia.const import (
+    CONF_WRITE_DEBOUNCE,
+    DOMAIN,
+    POLL_INTERVAL_FAST,
+)
+
+from .bench_poll import percentile
+from .harness import async_start_hass, create_entry, patched_cloud, serve_in_thread
+from .mock_server import MockThermiaServer, load_debug_report
+
+# Service calls timed by the setter benchmark, alternating between two values
+SETTERS = {
+    "number": (
+        "number.heat_pump_1000_heating_heat_curve",
+        "set_value",
+        "value",
+        (40, 41),
+    ),
+    "switch": ("switch.heat_pump_1000_hot_water_boost", None, None, ("on", "off")),
+    "water_heater": (
+        "water_heater.heat_pump_1000",
+        "set_temperature",
+        "temperature",
+        (20, 21),
+    ),
+}
+
+# Results where a higher value is worse, compared by ``--compare``
+METRICS = (
+    "setup_ms",
+    "cycle_p50_ms",
+    "cycle_p95_ms",
+    "cycle_cpu_ms",
+    "memory_per_entity_kib",
+    "state_writes_per_minute",
+    "setter_number_ms",
+    "setter_switch_ms",
+    "setter_water_heater_ms",
+)
+
+OPTIONS = {CONF_WRITE_DEBOUNCE: 0}
+
+
+def _entities(hass: HomeAssistant, entry_id: str) -> int:
+    return len(er.async_entries_for_config_entry(er.async_get(hass), entry_id))
+
+
+async def _setup(hass: HomeAssistant) -> tuple[str, dict]:
+    entry = create_entry(options=OPTIONS)
+    start = time.perf_counter()
+    await hass.config_entries.async_add(entry)
+    await hass.async_block_till_done()
+    return entry.entry_id, {
+        "setup_ms": (time.perf_counter() - start) * 1000,
+        "entities": _entities(hass, entry.entry_id),
+    }
+
+
+async def _cycles(hass: HomeAssistant, entry_id: str, cycles: int) -> dict:
+    coordinator = hass.data[DOMAIN][entry_id]
+    writes = 0
+
+    def count(event: Event) -> None:
+        nonlocal writes
+        writes += 1
+
+    unsubscribe = hass.bus.async_listen(EVENT_STATE_CHANGED, count)
+    latencies, cpu = [], []
+    for _ in range(cycles):
+        coordinator.client.mark_stale()
+        start, start_cpu = time.perf_counter(), time.thread_time()
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+        latencies.append(time.perf_counter() - start)
+        cpu.append(time.thread_time() - start_cpu)
+    unsubscribe()
+
+    return {
+        "cycle_p50_ms": statistics.median(latencies) * 1000,
+        "cycle_p95_ms": percentile(latencies, 95) * 1000,
+        "cycle_cpu_ms": statistics.mean(cpu) * 1000,
+        "state_writes_per_cycle": writes / cycles,
+        "state_writes_per_minute": writes / cycles * 60 / POLL_INTERVAL_FAST,
+    }
+
+
+async def _setters(hass: HomeAssistant, repeats: int) -> dict:
+    results = {}
+    for platform, (entity_id, service, field, values) in SETTERS.items():
+        if hass.states.get(entity_id) is None:
+            continue
+        timings = []
+        for repeat in range(repeats):
+            value = values[repeat % 2]
+            data = {"entity_id": entity_id}
+            if field is not None:
+                data[field] = value
+            start = time.perf_counter()
+            await hass.services.async_call(
+                platform, service or f"turn_{value}", data, blocking=True
+            )
+            timings.append(time.perf_counter() - start)
+        await hass.async_block_till_done()
+        results[f"setter_{platform}_ms"] = statistics.median(timings) * 1000
+    return results
+
+
+async def _memory(hass: HomeAssistant) -> dict:
+    """Set the entry up again and trace what it allocates."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    entry = create_entry(options=OPTIONS)
+    await hass.config_entries.async_add(entry)
+    await hass.async_block_till_done()
+    gc.collect()
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    entities = _entities(hass, entry.entry_id)
+    await hass.config_entries.async_unload(entry.entry_id)
+    return {
+        "memory_entry_kib": allocated / 1024,
+        "memory_per_entity_kib": allocated / 1024 / max(entities, 1),
+    }
+
+
+async def _run(args) -> dict:
+    logging.basicConfig(level=logging.ERROR)
+    server = MockThermiaServer(
+        pumps=args.pumps,
+        latency=args.latency,
+        recording=load_debug_report(args.recording) if args.recording else None,
+    )
+    results: dict = {"pumps": args.pumps, "cycles": args.cycles}
+
+    async with serve_in_thread(server):
+        with tempfile.TemporaryDirectory() as config_dir:
+            hass = await async_start_hass(config_dir)
+            async with ClientSession() as session:
+                with patched_cloud(server, session):
+                    entry_id, setup = await _setup(hass)
+                    results |= setup
+                    results |= await _cycles(hass, entry_id, args.cycles)
+                    results |= await _setters(hass, args.repeats)
+                    # Removing the entry also drops its stored snapshot
+                    await hass.config_entries.async_remove(entry_id)
+                    results |= await _memory(hass)
+            await hass.async_stop(force=True)
+
+    results["requests"] = server.requests
+    return results
+
+
+def _regressions(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    return [
+        f"{metric}: {baseline[metric]:.2f} -> {results[metric]:.2f}"
+        for metric in METRICS
+        if metric in results
+        and metric in baseline
+        and results[metric] > baseline[metric] * (1 + tolerance)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pumps", type=int, default=1)
+    parser.add_argument("--cycles", type=int, default=50)
+    parser.add_argument("--repeats", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--recording", help="debug report to serve")
+    parser.add_argument("--save", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="JSON file of a previous run")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+
+    results = asyncio.run(_run(args))
+    for metric, value in results.items():
+        print(f"{metric:26} {value:10.2f}")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            regressions = _regressions(results, json.load(file), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Cost of the in-memory telemetry recorder.
+
+Fills a telemetry buffer past its capacity with snapshots of random values
+and reports the time per recorded sample, the time to slice the last hour of
+one attribute and of all attributes, and the memory the buffer takes.
+
+    python -m scripts.benchmark.bench_telemetry --samples 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from types import MappingProxyType
+
+from custom_components.thermia.const import TELEMETRY_SAMPLES
+from custom_components.thermia.snapshot import SNAPSHOT_ATTRIBUTES, HeatPumpSnapshot
+from custom_components.thermia.telemetry import TELEMETRY_ATTRIBUTES, TelemetryBuffer
+
+
+def _snapshot() -> HeatPumpSnapshot:
+    return HeatPumpSnapshot(
+        id="1000",
+        name="Heat Pump",
+        model=None,
+        model_id=None,
+        values=MappingProxyType(
+            {
+                attribute: round(random.uniform(-10, 60), 1)
+                for attribute in SNAPSHOT_ATTRIBUTES
+            }
+        ),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=10000)
+    parser.add_argument("--capacity", type=int, default=TELEMETRY_SAMPLES)
+    parser.add_argument("--interval", type=float, default=10.0)
+    args = parser.parse_args()
+
+    buffer = TelemetryBuffer(args.capacity)
+    snapshots = [_snapshot() for _ in range(100)]
+
+    start = time.perf_counter()
+    for sample in range(args.samples):
+        buffer.append(sample * args.interval, snapshots[sample % len(snapshots)])
+    record = (time.perf_counter() - start) / args.samples
+
+    end = (args.samples - 1) * args.interval
+    hour = end - 3600
+    start = time.perf_counter()
+    one = buffer.slice(hour, end, ["supply_line_temperature"])
+    slice_one = time.perf_counter() - start
+    start = time.perf_counter()
+    buffer.slice(hour, end)
+    slice_all = time.perf_counter() - start
+
+    print(
+        f"capacity={buffer.capacity} attributes={len(TELEMETRY_ATTRIBUTES)} "
+        f"memory={buffer.nbytes / 1024:8.1f}KiB "
+        f"record={record * 1e6:6.1f}us/sample "
+        f"slice_1h_one={slice_one * 1000:6.2f}ms "
+        f"({len(one['timestamps'])} samples) "
+        f"slice_1h_all={slice_all * 1000:6.2f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Cloud writes and refreshes caused by dragging a slider.
+
+Sets up a config entry against the mock server and sends a burst of
+``water_heater.set_temperature`` calls for the heating target temperature,
+``--interval`` seconds apart, like a slider does while it is dragged. For each write debounce window
+it reports how many register writes reached the cloud, which value was
+written last, and how many requests the burst caused in total.
+
+    python -m scripts.benchmark.bench_writes --events 20 --interval 0.05
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import tempfile
+import time
+
+from aiohttp import ClientSession
+
+from custom_components.thermia.const import CONF_WRITE_DEBOUNCE
+
+from .harness import async_start_hass, create_entry, patched_cloud
+from .mock_server import MockThermiaServer
+
+ENTITY_ID = "water_heater.heat_pump_1000"
+
+
+async def _burst(args, window: float) -> dict:
+    server = MockThermiaServer(pumps=1, latency=args.latency)
+    await server.start()
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = await async_start_hass(config_dir)
+        entry = create_entry(options={CONF_WRITE_DEBOUNCE: window})
+        async with ClientSession() as session:
+            with patched_cloud(server, session):
+                await hass.config_entries.async_add(entry)
+                await hass.async_block_till_done()
+                requests_before = server.requests
+
+                start = time.perf_counter()
+                calls = []
+                for value in range(args.events):
+                    calls.append(
+                        hass.async_create_task(
+                            hass.services.async_call(
+                                "water_heater",
+                                "set_temperature",
+                                {"entity_id": ENTITY_ID, "temperature": 10 + value},
+                                blocking=True,
+                            )
+                        )
+                    )
+                    await asyncio.sleep(args.interval)
+                await asyncio.gather(*calls)
+                await hass.async_block_till_done()
+                elapsed = time.perf_counter() - start
+
+                result = {
+                    "writes": len(server.writes),
+                    "last": server.writes[-1]["registerValue"] if server.writes else None,
+                    "requests": server.requests - requests_before,
+                    "seconds": elapsed,
+                }
+                await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_stop(force=True)
+
+    await server.stop()
+    return result
+
+
+async def _run(args) -> None:
+    logging.basicConfig(level=logging.ERROR)
+    for window in args.windows:
+        result = await _burst(args, window)
+        print(
+            f"window={window:4.1f}s events={args.events:3d} "
+            f"cloud_writes={result['writes']:3d} last_value={result['last']} "
+            f"requests={result['requests']:4d} "
+            f"burst_done={result['seconds'] * 1000:7.1f}ms"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=20)
+    parser.add_argument("--interval", type=float, default=0.05)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument(
+        "--windows", type=float, nargs="+", default=[0.0, 0.5, 1.5]
+    )
+    asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Bare Home Assistant instance running the integration against the mock server."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+import inspect
+import threading
+from unittest.mock import patch
+
+from aiohttp import ClientSession
+from homeassistant import bootstrap, loader
+from homeassistant.config_entries import ConfigEntries, ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from custom_components.thermia import client as client_module
+from custom_components.thermia.const import CONF_PASSWORD, CONF_USERNAME, DOMAIN
+
+from .mock_server import MockThermiaServer
+
+
+async def async_start_hass(config_dir: str) -> HomeAssistant:
+    """Start Home Assistant with registries and config entries but no config."""
+    hass = HomeAssistant(config_dir)
+    hass.config.skip_pip = True
+    loader.async_setup(hass)
+    hass.config_entries = ConfigEntries(hass, {})
+    await bootstrap.async_load_base_functionality(hass)
+    await hass.async_start()
+    return hass
+
+
+def create_entry(
+    username: str = "benchmark", options: dict | None = None
+) -> ConfigEntry:
+    """Return a Thermia config entry for ``username``."""
+    kwargs = {
+        "version": 1,
+        "minor_version": 1,
+        "domain": DOMAIN,
+        "title": username,
+        "data": {CONF_USERNAME: username, CONF_PASSWORD: "benchmark"},
+        "source": "user",
+        "options": options or {},
+        "unique_id": None,
+        "discovery_keys": {},
+    }
+    accepted = inspect.signature(ConfigEntry).parameters
+    return ConfigEntry(**{key: value for key, value in kwargs.items() if key in accepted})
+
+
+@contextmanager
+def patched_cloud(server: MockThermiaServer, session: ClientSession) -> Iterator[None]:
+    """Point logins and requests of the integration at ``server``."""
+    with (
+        patch.object(client_module, "Thermia", lambda *_: server.connect()),
+        patch.object(client_module, "async_get_clientsession", lambda _: session),
+    ):
+        yield
+
+
+@asynccontextmanager
+async def serve_in_thread(server: MockThermiaServer) -> AsyncIterator[None]:
+    """Run ``server`` on its own event loop in a separate thread.
+
+    The CPU time the server spends then stays out of the thread running Home
+    Assistant, so ``time.thread_time`` there measures the integration alone.
+    """
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, name="mock_thermia", daemon=True)
+    thread.start()
+    try:
+        await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(server.start(), loop))
+        try:
+            yield
+        finally:
+            await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(server.stop(), loop)
+            )
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
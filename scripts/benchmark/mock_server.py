@@ -0,0 +1,330 @@
+"""Local stand-in for the Thermia Online API used by the benchmarks."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+import gzip
+import json
+import random
+import re
+import time
+from typing import Any
+
+from aiohttp import web
+import requests
+from ThermiaOnlineAPI import Thermia
+from ThermiaOnlineAPI.api.ThermiaAPI import ThermiaAPI
+
+OPERATIONAL_STATUSES = ("COMPRESSOR", "HEATING", "HOTWATER", "AUX_HEATER")
+
+
+# Section titles of a heat pump debug report
+_SECTION = re.compile(r"^(self\.__\w+|All available groups|Group \w+):$")
+
+
+def load_debug_report(path: str) -> dict[str, Any]:
+    """Return the responses recorded in a heat pump debug report.
+
+    Reads the output of the ``thermia.debug`` action, gzip compressed or
+    not, and the debug files of the ThermiaOnlineAPI test suite.
+    """
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as report:
+        lines = report.read().splitlines()
+
+    sections: dict[str, Any] = {}
+    title, body = None, []
+    for line in [*lines, "#"]:
+        match = _SECTION.match(line)
+        if match is None and not line.startswith("#"):
+            body.append(line)
+            continue
+        if title is not None:
+            text = "\n".join(body).strip()
+            sections[title] = json.loads(text) if text else None
+        title, body = (match.group(1) if match else None), []
+
+    return {
+        "info": sections.get("self.__info") or {},
+        "status": sections.get("self.__status") or {},
+        "device_data": sections.get("self.__device_data") or {},
+        "groups": {
+            title.removeprefix("Group "): data or []
+            for title, data in sections.items()
+            if title.startswith("Group ")
+        },
+    }
+
+
+class MockThermiaServer:
+    """aiohttp server serving synthetic or recorded installations.
+
+    Every heat pump exposes the endpoints and register groups that
+    ``ThermiaHeatPump.update_data`` reads. Synthetic values drift on every
+    request so change detection has something to do. With a ``recording``
+    from ``load_debug_report`` every heat pump serves the recorded responses
+    instead.
+    """
+
+    def __init__(
+        self,
+        pumps: int = 1,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        hot_water: bool = True,
+        slow_pumps: int = 0,
+        slow_latency: float = 5.0,
+        offline_pumps: int = 0,
+        flaky_groups: tuple[str, ...] = (),
+        recording: dict[str, Any] | None = None,
+    ):
+        self.pumps = pumps
+        self.recording = recording
+        self.hot_water = hot_water
+        self.latency = latency
+        self.error_rate = error_rate
+        # Register groups ``error_rate`` applies to; all requests if empty
+        self.flaky_groups = set(flaky_groups)
+        # The first ``slow_pumps`` heat pumps answer ``slow_latency`` seconds
+        # late, the next ``offline_pumps`` ones not at all
+        self.slow_devices = {str(1000 + idx) for idx in range(slow_pumps)}
+        self.slow_latency = slow_latency
+        self.offline_devices = {
+            str(1000 + idx) for idx in range(slow_pumps, slow_pumps + offline_pumps)
+        }
+        self.requests = 0
+        self.logins = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.request_times: list[float] = []
+        self.bytes_sent = 0
+        self.writes: list[dict] = []
+        # Written register values by register ID, reported by later reads
+        self.registers: dict[int, float] = {}
+        self.base_url = ""
+        self._tick = 0
+        self._runner: web.AppRunner | None = None
+
+    async def start(self) -> str:
+        """Start listening on a free local port and return the base URL."""
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_get("/api/v1/installationsInfo", self._devices)
+        app.router.add_get("/api/v1/installations/{id}", self._info)
+        app.router.add_get("/api/v1/installationstatus/{id}/status", self._status)
+        app.router.add_get("/api/v1/installation/{id}/events", self._alarms)
+        app.router.add_get(
+            "/api/v1/Registers/Installations/{id}/Groups/{group}", self._group
+        )
+        app.router.add_post("/api/v1/Registers/Installations/{id}/Registers", self._write)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{port}"
+        return self.base_url
+
+    async def stop(self) -> None:
+        """Stop the server."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    def connect(self) -> Thermia:
+        """Return a real ``Thermia`` object talking to this server.
+
+        The Azure login is skipped by giving the API object a long lived fake
+        token; everything else is the unmodified library.
+        """
+        self.logins += 1
+        api = object.__new__(ThermiaAPI)
+        valid_to = (datetime.now() + timedelta(days=1)).timestamp()
+        api._ThermiaAPI__email = api._ThermiaAPI__password = "benchmark"
+        api._ThermiaAPI__token = "benchmark"
+        api._ThermiaAPI__token_valid_to = valid_to
+        api._ThermiaAPI__refresh_token = "benchmark"
+        api._ThermiaAPI__refresh_token_valid_to = valid_to
+        api._ThermiaAPI__default_request_headers = {
+            "Authorization": "Bearer benchmark",
+            "Content-Type": "application/json",
+        }
+        api._ThermiaAPI__session = requests.Session()
+        api.configuration = {"apiBaseUrl": self.base_url}
+        api.authenticated = True
+
+        thermia = object.__new__(Thermia)
+        thermia._username = thermia._password = "benchmark"
+        thermia.api_interface = api
+        thermia.connected = True
+        thermia.heat_pumps = thermia.fetch_heat_pumps()
+        return thermia
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler):
+        self.requests += 1
+        self.request_times.append(time.monotonic())
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            device_id = request.match_info.get("id")
+            if device_id in self.slow_devices:
+                await asyncio.sleep(self.slow_latency)
+            flaky = not self.flaky_groups or (
+                request.match_info.get("group") in self.flaky_groups
+            )
+            if device_id in self.offline_devices or (
+                flaky and self.error_rate and random.random() < self.error_rate
+            ):
+                return web.Response(status=503, text="Service Unavailable")
+            response = await handler(request)
+            self.bytes_sent += len(response.body or b"")
+            return response
+        finally:
+            self.in_flight -= 1
+
+    @staticmethod
+    def _json(data) -> web.Response:
+        return web.Response(text=json.dumps(data), content_type="application/json")
+
+    def _value(self, base: float, spread: float = 0.5) -> float:
+        self._tick += 1
+        return round(base + spread * ((self._tick * 7919) % 11 - 5) / 5, 1)
+
+    async def _devices(self, request: web.Request) -> web.Response:
+        device_data = (self.recording or {}).get("device_data") or {
+            "profile": {"thermiaName": "Calibra", "name": "CALIBRA"}
+        }
+        return self._json(
+            {"items": [{**device_data, "id": 1000 + idx} for idx in range(self.pumps)]}
+        )
+
+    async def _info(self, request: web.Request) -> web.Response:
+        device_id = request.match_info["id"]
+        return self._json(
+            {
+                "installationProfileId": 1,
+                **(self.recording or {}).get("info", {}),
+                "id": int(device_id),
+                "name": f"Heat Pump {device_id}",
+                "isOnline": True,
+                "lastOnline": datetime.now().isoformat(),
+            }
+        )
+
+    async def _status(self, request: web.Request) -> web.Response:
+        if self.recording is not None:
+            return self._json(self.recording["status"])
+        return self._json(
+            {
+                "heatingEffect": self.registers.get(1, 21),
+                "heatingEffectRegisters": [None, 1],
+                "hasIndoorTempSensor": True,
+                "indoorTemperature": self._value(21.0, 0.2),
+                "isOutdoorTempSensorFunctioning": True,
+                "outdoorTemperature": self._value(4.0, 1.0),
+                "isHotWaterActive": True,
+                "hotWaterTemperature": self._value(48.0),
+            }
+        )
+
+    async def _alarms(self, request: web.Request) -> web.Response:
+        return self._json([])
+
+    async def _write(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        self.writes.append(body)
+        self.registers[body["registerSpecificationId"]] = body["registerValue"]
+        return self._json({})
+
+    async def _group(self, request: web.Request) -> web.Response:
+        group = request.match_info["group"]
+        if self.recording is not None:
+            registers = json.loads(json.dumps(self.recording["groups"].get(group, [])))
+        else:
+            registers = self._synthetic_group(group)
+        for register in registers:
+            register["registerValue"] = self.registers.get(
+                register["registerId"], register["registerValue"]
+            )
+        return self._json(registers)
+
+    def _synthetic_group(self, group: str) -> list[dict]:
+        return {
+            "REG_GROUP_TEMPERATURES": [
+                _register(1, "REG_INDOOR_TEMPERATURE", 21, 5, 30),
+                _register(2, "REG_SUPPLY_LINE", self._value(35.0)),
+                _register(3, "REG_RETURN_LINE", self._value(30.0)),
+                _register(4, "REG_BRINE_IN", self._value(2.0)),
+                _register(5, "REG_BRINE_OUT", self._value(-1.0)),
+                _register(6, "REG_DESIRED_SUPPLY_LINE", 36),
+            ],
+            "REG_GROUP_OPERATIONAL_STATUS": [
+                _register(
+                    20,
+                    "REG_OPERATIONAL_STATUS_PRIO1",
+                    1 if self._tick % 40 < 25 else 2,
+                    value_names=[
+                        {"value": 1 << idx, "name": f"REG_VALUE_STATUS_{status}"}
+                        for idx, status in enumerate(OPERATIONAL_STATUSES)
+                    ],
+                ),
+                _register(21, "REG_INTEGRAL_LSD", self._value(-100, 50)),
+                _register(22, "REG_PID", self._value(10, 5)),
+            ],
+            "REG_GROUP_OPERATIONAL_TIME": [
+                _register(30, "REG_OPER_TIME_COMPRESSOR", 12000 + self._tick // 360),
+                _register(31, "REG_OPER_TIME_HEATING", 9000 + self._tick // 500),
+                _register(32, "REG_OPER_TIME_HOT_WATER", 3000 + self._tick // 900),
+            ],
+            "REG_GROUP_OPERATIONAL_OPERATION": [
+                _register(
+                    40,
+                    "REG_OPERATIONMODE",
+                    3,
+                    value_names=[
+                        {"value": 0, "name": "REG_VALUE_OPERATION_MODE_OFF"},
+                        {"value": 3, "name": "REG_VALUE_OPERATION_MODE_AUTO"},
+                        {"value": 4, "name": "REG_VALUE_OPERATION_MODE_HOT_WATER_ONLY"},
+                    ],
+                ),
+            ],
+            "REG_GROUP_HOT_WATER": [
+                _register(50, "REG_HOT_WATER_STATUS", 1, value_names=_ON_OFF),
+                _register(51, "REG__HOT_WATER_BOOST", 0, value_names=_ON_OFF),
+            ]
+            if self.hot_water
+            else [],
+            "REG_GROUP_HEATING_CURVE": [
+                _register(60, "REG_HEATING_HEAT_CURVE", 40, 0, 100),
+                _register(61, "REG_HEATING_HEAT_CURVE_MIN", 20, 10, 40),
+                _register(62, "REG_HEATING_HEAT_CURVE_MAX", 55, 30, 65),
+                _register(63, "REG_HEATING_HEAT_STOP", 17, 5, 30),
+                _register(64, "REG_HEATING_ROOM_FACTOR", 2, 0, 10),
+            ],
+        }.get(group, [])
+
+
+_ON_OFF = [{"value": 0, "name": "OFF"}, {"value": 1, "name": "ON"}]
+
+
+def _register(
+    register_id: int,
+    name: str,
+    value: float,
+    min_value: float = -50,
+    max_value: float = 100,
+    step: float = 1,
+    value_names: list | None = None,
+) -> dict:
+    return {
+        "registerId": register_id,
+        "registerName": name,
+        "registerValue": value,
+        "minValue": min_value,
+        "maxValue": max_value,
+        "step": step,
+        "isReadOnly": False,
+        "valueNames": value_names,
+    }
@@ -0,0 +1,150 @@
+"""Replay a recorded heat pump trace against the poll schedulers.
+
+A trace is a JSON lines file, one sample per line, ordered by time:
+
+    {"t": 0, "compressor": true, "values": {"supply_line_temperature": 35.1}}
+    {"t": 10, "compressor": true, "values": {"supply_line_temperature": 35.3}}
+    {"t": 20, "error": true}
+    {"t": 30, "write": true, "values": {...}}
+
+``t`` is in seconds, ``error`` marks a period where the cloud fails and
+``write`` marks a setting change made from Home Assistant. Without a trace a
+synthetic day with compressor cycles, a stable night and an outage is used.
+
+    python -m scripts.benchmark.simulate_polling [trace.jsonl] [--hours 24]
+"""
+
+from __future__ import annotations
+
+import argparse
+import bisect
+import json
+import math
+import random
+
+from custom_components.thermia.const import POLL_INTERVAL_FAST
+from custom_components.thermia.scheduler import AdaptivePollScheduler
+
+# HTTP requests one poll of one heat pump costs with the native client.
+REQUESTS_PER_POLL = 9
+
+
+def synthetic_trace(hours: float, step: float = 10.0) -> list[dict]:
+    """Build a trace with compressor cycles, idle periods and an outage."""
+    rng = random.Random(1)
+    trace = []
+    supply = 30.0
+    for i in range(int(hours * 3600 / step)):
+        t = i * step
+        hour = (t / 3600) % 24
+        # Long runs in the cold morning and evening, idle around midday
+        # and most of the night.
+        running = (5 <= hour < 9 or 17 <= hour < 22) and (t // 900) % 3 != 2
+        target = 38.0 if running else 24.0
+        supply += (target - supply) * 0.02
+        sample = {
+            "t": t,
+            "compressor": running,
+            "values": {
+                "supply_line_temperature": round(supply, 1),
+                "outdoor_temperature": round(4 + 3 * math.sin(t / 7200), 0),
+            },
+        }
+        if 13 <= hour < 13.5:
+            sample["error"] = True
+        if rng.random() < 0.0005:
+            sample["write"] = True
+        trace.append(sample)
+    return trace
+
+
+def load_trace(path: str) -> list[dict]:
+    """Load a JSON lines trace."""
+    with open(path, encoding="utf-8") as trace_file:
+        return [json.loads(line) for line in trace_file if line.strip()]
+
+
+def simulate(trace: list[dict], scheduler: AdaptivePollScheduler | None) -> dict:
+    """Replay ``trace``; ``scheduler=None`` means a fixed fast interval."""
+    times = [sample["t"] for sample in trace]
+    end = times[-1]
+    clock = [0.0]
+    if scheduler is not None:
+        scheduler._clock = lambda: clock[0]
+
+    # Time at which each distinct observable state first appears.
+    changes = [
+        sample["t"]
+        for prev, sample in zip(trace, trace[1:])
+        if sample.get("values") != prev.get("values")
+    ]
+    seen_at: list[float] = []
+    polls = failures = 0
+    last_values = None
+    t = 0.0
+
+    while t <= end:
+        clock[0] = t
+        sample = trace[bisect.bisect_right(times, t) - 1]
+        polls += 1
+
+        if sample.get("write") and scheduler is not None:
+            scheduler.note_write()
+
+        if sample.get("error"):
+            failures += 1
+            interval = scheduler.on_failure() if scheduler else POLL_INTERVAL_FAST
+        else:
+            values = sample.get("values")
+            seen_at.append(t)
+            if scheduler is None:
+                interval = POLL_INTERVAL_FAST
+            else:
+                interval = scheduler.on_success(
+                    changed=values != last_values,
+                    active=bool(sample.get("compressor")),
+                )
+            last_values = values
+        t += interval
+
+    staleness = []
+    for change in changes:
+        idx = bisect.bisect_left(seen_at, change)
+        staleness.append((seen_at[idx] if idx < len(seen_at) else end) - change)
+    staleness.sort()
+
+    return {
+        "polls": polls,
+        "requests": polls * REQUESTS_PER_POLL,
+        "failed_polls": failures,
+        "mean_staleness": sum(staleness) / max(1, len(staleness)),
+        "p95_staleness": staleness[int(len(staleness) * 0.95)] if staleness else 0,
+        "max_staleness": staleness[-1] if staleness else 0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("trace", nargs="?")
+    parser.add_argument("--hours", type=float, default=24)
+    args = parser.parse_args()
+
+    trace = load_trace(args.trace) if args.trace else synthetic_trace(args.hours)
+    rng = random.Random(2)
+    for label, scheduler in (
+        ("fixed 10s", None),
+        ("adaptive", AdaptivePollScheduler(rng=rng.random)),
+    ):
+        result = simulate(trace, scheduler)
+        print(
+            f"{label:10} polls={result['polls']:6d} "
+            f"requests={result['requests']:7d} "
+            f"failed={result['failed_polls']:5d} "
+            f"staleness mean={result['mean_staleness']:6.1f}s "
+            f"p95={result['p95_staleness']:6.1f}s "
+            f"max={result['max_staleness']:6.1f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
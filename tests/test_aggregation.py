@@ -0,0 +1,48 @@
+"""Tests of the values the aggregation stage publishes."""
+
+from __future__ import annotations
+
+from types import MappingProxyType
+
+from custom_components.thermia.aggregation import AggregationStage, SensorFilter
+from custom_components.thermia.const import AGGREGATION_DEADBAND
+from custom_components.thermia.snapshot import HeatPumpSnapshot, ThermiaSnapshot
+
+
+def _snapshot(**values) -> ThermiaSnapshot:
+    return ThermiaSnapshot(
+        connected=True,
+        heat_pumps=(
+            HeatPumpSnapshot(
+                id="1000",
+                name="Heat pump",
+                model=None,
+                model_id=None,
+                values=MappingProxyType(values),
+            ),
+        ),
+    )
+
+
+def test_zero_band_ignores_unchanged_value() -> None:
+    """A zero band lets every change through but never a repeated value."""
+    assert not SensorFilter().significant(21.5, 21.5)
+    assert SensorFilter().significant(21.6, 21.5)
+    # A relative band around zero is zero wide
+    assert not SensorFilter(relative=0.02).significant(0.0, 0.0)
+    assert SensorFilter(relative=0.02).significant(0.1, 0.0)
+
+
+def test_zero_deadband_repeated_value_is_not_moved() -> None:
+    """Polling the same value again publishes nothing with a zero deadband."""
+    stage = AggregationStage(mode=AGGREGATION_DEADBAND, deadband=0.0)
+
+    stage.process(_snapshot(outdoor_temperature=4.0))
+    assert ("1000", "outdoor_temperature") in stage.updated
+
+    stage.process(_snapshot(outdoor_temperature=4.0))
+    assert not stage.updated
+    assert not stage.moved
+
+    stage.process(_snapshot(outdoor_temperature=4.1))
+    assert stage.moved == {("1000", "outdoor_temperature")}
@@ -0,0 +1,39 @@
+"""Tests of the transition logs of the operational statuses."""
+
+from __future__ import annotations
+
+from custom_components.thermia.transitions import TransitionLog
+
+HOUR = 3600.0
+
+
+def test_window_drops_starts_and_runs() -> None:
+    """Starts and runs leave the counts as they leave the window."""
+    log = TransitionLog(capacity=16)
+    log.observe(0, False)
+    # Runs of 300 s, then 900 s, then 600 s
+    for start, stop in ((100, 400), (1000, 1900), (2000, 2600)):
+        log.observe(start, True)
+        log.observe(stop, False)
+
+    assert log.starts(2600 - HOUR) == 3
+    assert log.shortest_run(2600 - HOUR) == 300
+
+    # The 300 s run ended at 400 and is out of the window
+    assert log.starts(4000 - HOUR) == 2
+    assert log.shortest_run(4000 - HOUR) == 600
+
+    assert log.starts(7000 - HOUR) == 0
+    assert log.shortest_run(7000 - HOUR) is None
+
+
+def test_full_log_keeps_counting_starts() -> None:
+    """Transitions overwritten in a full log leave the start count."""
+    log = TransitionLog(capacity=4)
+    log.observe(0, False)
+    for minute in range(1, 11):
+        log.observe(minute * 60, minute % 2 == 1)
+
+    # Only the last four transitions are kept: two of them are starts
+    assert log.starts(0) == 2
+    assert log.shortest_run(0) == 60
@@ -0,0 +1,83 @@
+"""Tests of the coalescing of register writes."""
+
+from __future__ import annotations
+
+import asyncio
+from functools import partial
+
+import pytest
+
+from custom_components.thermia.writes import WriteQueue
+
+WINDOW = 0.01
+
+
+class _Hass:
+    """The parts of Home Assistant the write queue uses."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+
+    def async_create_task(self, target, name=None):
+        return self.loop.create_task(target, name=name)
+
+
+def _queue(refresh) -> WriteQueue:
+    loop = asyncio.get_running_loop()
+    return WriteQueue(
+        _Hass(loop),
+        WINDOW,
+        refresh,
+        call_later=lambda delay, action: loop.call_later(delay, action, None).cancel,
+    )
+
+
+def test_burst_posts_last_value_once() -> None:
+    """N queued values of one register give one post of the last value."""
+
+    async def run():
+        posted = []
+        refreshes = []
+
+        async def post(value):
+            posted.append(value)
+
+        async def refresh():
+            refreshes.append(True)
+
+        queue = _queue(refresh)
+        results = await asyncio.gather(
+            *(queue.async_write("register", partial(post, value)) for value in range(5))
+        )
+        return posted, refreshes, results, queue
+
+    posted, refreshes, results, queue = asyncio.run(run())
+
+    assert posted == [4]
+    assert refreshes == [True]
+    assert results == [None] * 5
+    assert (queue.submitted, queue.written) == (5, 1)
+
+
+def test_burst_error_reaches_every_caller() -> None:
+    """Every caller of a coalesced write sees the error of the post."""
+
+    async def run():
+        async def post():
+            raise RuntimeError("rejected")
+
+        async def refresh():
+            raise AssertionError("refreshed after a failed write")
+
+        queue = _queue(refresh)
+        return await asyncio.gather(
+            *(queue.async_write("register", post) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(run())
+
+    assert len(results) == 3
+    for result in results:
+        with pytest.raises(RuntimeError, match="rejected"):
+            raise result